@@ -13,6 +13,9 @@ import tkinter as tk
 # - Toplevel: untuk membuat window baru di atas window utama
 from tkinter import Menu, filedialog, messagebox, simpledialog, Scale, Button, Label, Toplevel
 
+# Mengimport ttk (themed tkinter) untuk widget Progressbar
+from tkinter import ttk
+
 # Mengimport library PIL (Python Imaging Library / Pillow) untuk manipulasi gambar:
 # - Image: untuk membuka, menyimpan, dan manipulasi gambar
 # - ImageTk: untuk konversi gambar PIL ke format Tkinter
@@ -34,16 +37,1432 @@ import cv2
 # terutama untuk operasi konvolusi dan filtering
 from scipy import ndimage
 
-# Mengimport fungsi-fungsi FFT (Fast Fourier Transform) dari SciPy:
-# - fft2: 2D Forward Fourier Transform (domain spasial → domain frekuensi)
-# - ifft2: 2D Inverse Fourier Transform (domain frekuensi → domain spasial)
+# Mengimport fungsi FFT (Fast Fourier Transform) dari SciPy:
 # - fftshift: menggeser komponen frekuensi nol ke tengah
-# - ifftshift: kebalikan dari fftshift
-from scipy.fft import fft2, ifft2, fftshift, ifftshift
+from scipy.fft import fftshift
+
+# Mengimport fungsi FFT tambahan dari SciPy:
+# - rfft2, irfft2: FFT 2D untuk input real (hanya setengah spektrum, 2x lebih hemat)
+# - next_fast_len: ukuran FFT tercepat (faktor prima kecil) untuk padding
+# - fftfreq, rfftfreq: frekuensi setiap bin FFT
+from scipy.fft import rfft2, irfft2, next_fast_len, fftfreq, rfftfreq
+
+# Mengimport filter IIR dari SciPy (untuk Gaussian blur rekursif):
+# - lfilter: filter rekursif sepanjang satu sumbu array
+# - lfilter_zi: kondisi awal steady state filter
+from scipy.signal import lfilter, lfilter_zi
 
 # Mengimport library webbrowser untuk membuka URL di browser default
 import webbrowser
 
+# Mengimport library os untuk mengetahui jumlah core CPU
+import os
+
+# Mengimport ThreadPoolExecutor untuk menjalankan filter di beberapa thread sekaligus
+# OpenCV melepas GIL saat memproses, sehingga thread benar-benar berjalan paralel
+from concurrent.futures import ThreadPoolExecutor
+
+# Mengimport modul untuk instrumentasi performa:
+# - time: timer presisi tinggi (perf_counter) untuk mengukur durasi operasi
+# - tracemalloc: mengukur memori puncak yang dialokasikan selama operasi
+# - json, csv: export log timing ke file
+# - deque: log bergulir dengan panjang maksimum
+# - contextmanager: membuat blok "with" untuk mengukur fase operasi
+import time
+import tracemalloc
+import json
+import csv
+from collections import deque
+from contextlib import contextmanager
+
+# Mengimport modul untuk profiling operasi:
+# - cProfile, pstats: profiler deterministik bawaan Python dan pembaca hasilnya
+# - sys, threading: sampling stack thread utama (mirip py-spy) untuk flamegraph
+# - io: menampung output pstats sebagai string
+# - Counter: menghitung jumlah sample per stack
+import cProfile
+import pstats
+import sys
+import threading
+import io
+from collections import Counter
+
+# Mengimport OrderedDict untuk cache LRU (least recently used)
+from collections import OrderedDict
+
+# ========== PARALLEL FILTER BACKEND ==========
+# Jumlah worker thread untuk filter paralel (default: jumlah core CPU)
+FILTER_WORKERS = os.cpu_count() or 1
+
+# Gambar lebih kecil dari ini (jumlah pixel) difilter langsung tanpa dipecah
+# Overhead membagi strip tidak sebanding untuk gambar kecil
+PARALLEL_MIN_PIXELS = 1_000_000
+
+# Thread pool dibuat sekali dan dipakai ulang oleh setiap preview slider
+FILTER_POOL = ThreadPoolExecutor(max_workers=FILTER_WORKERS)
+
+# Jumlah maksimum record timing yang disimpan di log bergulir
+PERF_LOG_SIZE = 500
+
+# ========== PROFILER OPERASI ==========
+# Folder tempat menyimpan hasil profiling (.pstats dan .collapsed)
+PROFILE_DIR = "profiles"
+
+# Interval sampling stack dalam detik
+PROFILE_SAMPLE_INTERVAL = 0.001
+
+# Python < 3.12: cProfile hanya merekam thread tempat ia di-enable, sehingga
+# worker thread butuh Profile sendiri. Python >= 3.12: cProfile memakai
+# sys.monitoring yang merekam semua thread, dan Profile kedua yang di-enable
+# melempar ValueError ("Another profiling tool is already active")
+PROFILE_PER_THREAD = sys.version_info < (3, 12)
+
+# Class profiler untuk satu operasi:
+# - cProfile: statistik per fungsi (disimpan sebagai .pstats)
+# - sampler thread: mengambil stack thread utama secara periodik dan menyimpannya
+#   dalam format "collapsed stack" (input flamegraph.pl / speedscope)
+class OperationProfiler:
+    """Profiler cProfile + sampling stack untuk satu operasi"""
+    
+    def __init__(self, interval=PROFILE_SAMPLE_INTERVAL):
+        self.profile = cProfile.Profile()
+        self.interval = interval
+        
+        # Jumlah sample untuk setiap stack ("outer;...;inner" -> count)
+        self.stacks = Counter()
+        
+        # Thread yang di-sample: thread yang memanggil start(), ditambah worker
+        # thread yang dijalankan lewat profile_thread()
+        self.thread_ids = {threading.get_ident()}
+        
+        # Python < 3.12: setiap worker thread punya Profile sendiri yang
+        # digabung saat save/summary (lihat PROFILE_PER_THREAD)
+        self.thread_profiles = []
+        
+        self._stop_event = threading.Event()
+        self._sampler = None
+    
+    # Mulai profiling
+    def start(self):
+        self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+        self.profile.enable()
+    
+    # Hentikan profiling dan tunggu sampler selesai
+    def stop(self):
+        self.profile.disable()
+        self._stop_event.set()
+        self._sampler.join()
+    
+    # Menjalankan func di worker thread dengan profiling (dipanggil dari worker)
+    def profile_thread(self, func, *args):
+        self.thread_ids.add(threading.get_ident())
+        
+        # Python >= 3.12: worker sudah direkam oleh self.profile
+        if not PROFILE_PER_THREAD:
+            return func(*args)
+        
+        profile = cProfile.Profile()
+        self.thread_profiles.append(profile)
+        profile.enable()
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+    
+    # Loop sampler: ambil stack thread target setiap interval
+    def _sample_loop(self):
+        while not self._stop_event.wait(self.interval):
+            # sys._current_frames(): frame teratas setiap thread yang hidup
+            frames = sys._current_frames()
+            for thread_id in list(self.thread_ids):
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                
+                # Telusuri frame dari dalam ke luar, lalu balik urutannya
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(names))] += 1
+    
+    # Gabungkan statistik thread utama dan semua worker thread
+    def _stats(self, stream=None):
+        stats = pstats.Stats(self.profile, stream=stream)
+        for profile in self.thread_profiles:
+            stats.add(profile)
+        return stats
+    
+    # Simpan hasil ke <base_path>.pstats dan <base_path>.collapsed
+    def save(self, base_path):
+        pstats_path = base_path + ".pstats"
+        collapsed_path = base_path + ".collapsed"
+        
+        self._stats().dump_stats(pstats_path)
+        
+        # Format collapsed: satu baris per stack -> "frame1;frame2;frame3 count"
+        with open(collapsed_path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        
+        return pstats_path, collapsed_path
+    
+    # Ringkasan fungsi paling "panas" (waktu internal terbesar)
+    def summary(self, limit=15):
+        stream = io.StringIO()
+        stats = self._stats(stream)
+        stats.strip_dirs().sort_stats("tottime").print_stats(limit)
+        return stream.getvalue()
+
+# Fungsi untuk filter median/box paralel pada gambar besar
+# - img_array: numpy array gambar (grayscale atau berwarna)
+# - kernel_size: ukuran kernel (ganjil)
+# - mode: "median" atau "box"
+def parallel_filter(img_array, kernel_size, mode="median"):
+    """Filter median/box paralel dengan membagi gambar menjadi strip yang overlap"""
+
+    # Pilih operasi filter per strip
+    # cv2.medianBlur() untuk uint8 dengan kernel > 5 memakai median berbasis
+    # histogram (Perreault-Hebert) yang waktunya konstan terhadap ukuran kernel
+    # cv2.blur() memakai running sum sehingga juga konstan terhadap ukuran kernel
+    if mode == "median":
+        def apply(strip):
+            return cv2.medianBlur(strip, kernel_size)
+    else:
+        def apply(strip):
+            return cv2.blur(strip, (kernel_size, kernel_size))
+
+    height = img_array.shape[0]
+
+    # Halo: jumlah baris tambahan di atas/bawah strip agar pixel di tepi strip
+    # tetap melihat tetangga yang sama seperti saat filter seluruh gambar
+    halo = kernel_size // 2
+
+    # Jumlah strip: satu per worker, tapi setiap strip minimal 4x tinggi kernel
+    # agar baris halo yang dihitung dua kali tidak mendominasi
+    n_strips = min(FILTER_WORKERS, max(1, height // (4 * kernel_size)))
+
+    # Gambar kecil atau hanya satu strip: filter langsung
+    if n_strips == 1 or img_array.shape[0] * img_array.shape[1] < PARALLEL_MIN_PIXELS:
+        return apply(img_array)
+
+    # Batas baris setiap strip (tanpa halo)
+    bounds = np.linspace(0, height, n_strips + 1).astype(int)
+
+    # Array hasil, diisi oleh masing-masing worker di bagian barisnya sendiri
+    result = np.empty_like(img_array)
+
+    def run_strip(i):
+        y0, y1 = bounds[i], bounds[i + 1]
+
+        # Perluas strip dengan halo (dibatasi tepi gambar)
+        s0, s1 = max(0, y0 - halo), min(height, y1 + halo)
+
+        # Filter strip beserta halo, lalu buang baris halo dari hasil
+        filtered = apply(img_array[s0:s1])
+        result[y0:y1] = filtered[y0 - s0:y1 - s0]
+
+    # Jalankan semua strip di thread pool dan tunggu sampai selesai
+    # list(): memaksa iterasi agar exception dari worker ikut dilempar
+    list(FILTER_POOL.map(run_strip, range(n_strips)))
+
+    return result
+
+# ========== COLOR SPACE ENGINE ==========
+# Ruang warna linear: matrix affine 3x4 [M | offset] untuk pixel RGB 0-255
+# cv2.transform() menghitung M @ pixel + offset untuk semua pixel sekaligus
+# dalam float32 dan langsung saturate ke tipe output (tanpa array float64 HxWx3)
+COLOR_MATRICES = {
+    # YIQ: digunakan di sistem TV analog NTSC
+    # Y = luminance, I dan Q = chrominance
+    "YIQ": np.array([[0.299, 0.587, 0.114, 0],
+                     [0.596, -0.275, -0.321, 0],
+                     [0.212, -0.523, 0.311, 0]], dtype=np.float32),
+    
+    # CMY = 255 - RGB
+    # C (Cyan) = 255 - R, M (Magenta) = 255 - G, Y (Yellow) = 255 - B
+    "CMY": np.array([[-1, 0, 0, 255],
+                     [0, -1, 0, 255],
+                     [0, 0, -1, 255]], dtype=np.float32),
+}
+
+# Fungsi untuk menghitung invers matrix affine 3x4
+# pixel = M^-1 @ (hasil - offset) = M^-1 @ hasil - M^-1 @ offset
+def invert_affine(matrix):
+    linear_inv = np.linalg.inv(matrix[:, :3].astype(np.float64))
+    offset_inv = -linear_inv @ matrix[:, 3]
+    return np.hstack([linear_inv, offset_inv[:, None]]).astype(np.float32)
+
+# Matrix invers untuk mengembalikan ruang warna linear ke RGB
+COLOR_INVERSE_MATRICES = {space: invert_affine(m) for space, m in COLOR_MATRICES.items()}
+
+# Ruang warna non-linear: kode konversi OpenCV (RGB -> ruang, ruang -> RGB)
+# uint8 memakai encoding 8-bit OpenCV (mis. Hue 0-179, a/b di-offset 128)
+# float32 memakai konvensi float OpenCV (mis. Hue 0-360, L 0-100) yang presisi
+COLOR_CVT_CODES = {
+    "HSV": (cv2.COLOR_RGB2HSV, cv2.COLOR_HSV2RGB),
+    "YUV": (cv2.COLOR_RGB2YUV, cv2.COLOR_YUV2RGB),
+    "YCrCb": (cv2.COLOR_RGB2YCrCb, cv2.COLOR_YCrCb2RGB),
+    "Lab": (cv2.COLOR_RGB2Lab, cv2.COLOR_Lab2RGB),
+}
+
+# Semua ruang warna yang didukung convert_color()
+COLOR_SPACES = ("RGB",) + tuple(COLOR_MATRICES) + tuple(COLOR_CVT_CODES)
+
+# Nama channel setiap ruang warna (untuk Channel View)
+COLOR_CHANNEL_NAMES = {
+    "RGB": ("R", "G", "B"),
+    "YIQ": ("Y", "I", "Q"),
+    "CMY": ("C", "M", "Y"),
+    "HSV": ("H", "S", "V"),
+    "YUV": ("Y", "U", "V"),
+    "YCrCb": ("Y", "Cr", "Cb"),
+    "Lab": ("L", "a", "b"),
+}
+
+# Channel yang bisa bernilai negatif (I dan Q di YIQ): untuk Channel View
+# dikonversi dalam float32 lalu dinormalisasi min-max per channel, karena
+# konversi uint8 memotong nilai negatif menjadi 0
+COLOR_SIGNED_CHANNELS = {"YIQ": (1, 2)}
+
+# Ukuran maksimum (width, height) setiap panel channel di Channel View
+CHANNEL_PANEL_SIZE = (360, 420)
+
+# ========== PROXY PREVIEW ==========
+# Sisi terpanjang maksimum gambar proxy (versi kecil gambar original)
+# Preview yang mahal dijalankan pada proxy; canvas hanya 540x640 sehingga
+# detail yang hilang tidak terlihat di preview
+PROXY_MAX_SIZE = 1024
+
+# Jumlah pixel maksimum per chunk konversi
+# Array sementara (mis. float32) hanya sebesar satu chunk, bukan seluruh gambar
+COLOR_CHUNK_PIXELS = 1 << 20
+
+# Fungsi untuk mengubah tipe data chunk
+# float -> uint8 dibulatkan dan di-saturate ke 0-255
+def cast_chunk(chunk, dtype):
+    if chunk.dtype == dtype:
+        return chunk
+    if dtype == np.uint8:
+        return np.clip(np.rint(chunk), 0, 255).astype(np.uint8)
+    return chunk.astype(dtype)
+
+# Fungsi konversi ruang warna RGB <-> space
+# - img: array HxWx3 (uint8, atau float32 untuk ruang warna linear)
+# - space: salah satu COLOR_SPACES
+# - inverse: False = RGB -> space, True = space -> RGB
+# - dtype: tipe output; np.float32 menyimpan nilai tanpa clip/kuantisasi (mis. I dan Q
+#   negatif) sehingga edit channel bisa dikembalikan ke RGB tanpa kehilangan presisi
+def convert_color(img, space, inverse=False, dtype=np.uint8):
+    """Konversi ruang warna RGB <-> space, diproses per chunk baris"""
+    
+    if space not in COLOR_SPACES:
+        raise ValueError(f"Unknown color space: {space}")
+    
+    # Ruang warna non-linear dalam float: forward jika output float, inverse jika input float
+    float_mode = (img.dtype != np.uint8) if inverse else (dtype != np.uint8)
+    
+    height, width = img.shape[:2]
+    result = np.empty((height, width, 3), dtype=dtype)
+    
+    # Jumlah baris per chunk
+    rows = max(1, COLOR_CHUNK_PIXELS // width)
+    
+    for y in range(0, height, rows):
+        chunk = img[y:y + rows]
+        
+        if space == "RGB":
+            converted = chunk
+        elif space in COLOR_MATRICES:
+            matrix = COLOR_INVERSE_MATRICES[space] if inverse else COLOR_MATRICES[space]
+            
+            # Output float: chunk diubah ke float32 dulu agar hasil tidak di-saturate
+            if dtype != np.uint8:
+                chunk = chunk.astype(np.float32)
+            converted = cv2.transform(chunk, matrix)
+        else:
+            code = COLOR_CVT_CODES[space][1 if inverse else 0]
+            
+            if not float_mode:
+                # Encoding 8-bit OpenCV
+                converted = cv2.cvtColor(cast_chunk(chunk, np.uint8), code)
+            elif inverse:
+                # Float OpenCV menghasilkan RGB 0-1
+                converted = cv2.cvtColor(chunk.astype(np.float32), code) * 255
+            else:
+                # Float OpenCV mengharapkan RGB 0-1
+                converted = cv2.cvtColor(chunk.astype(np.float32) * (1 / 255), code)
+        
+        result[y:y + rows] = cast_chunk(converted, dtype)
+    
+    return result
+
+# ========== HISTOGRAM SERVICE ==========
+# Jumlah maksimum histogram (gambar + mode) yang disimpan di cache
+HIST_CACHE_SIZE = 8
+
+# Ukuran plot di jendela histogram (2 pixel per bin)
+HIST_PLOT_WIDTH = 512
+HIST_PLOT_HEIGHT = 150
+
+# Warna garis dan nama channel berdasarkan jumlah channel
+HIST_CHANNEL_COLORS = {1: ("black",), 3: ("red", "green", "blue")}
+HIST_CHANNEL_NAMES = {1: ("L",), 3: ("R", "G", "B")}
+
+# Jumlah bit 1 untuk setiap nilai byte (menghitung pixel putih BinaryMask)
+POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+# Class histogram 256 bin per channel beserta cumulative sum
+# Statistik (mean, std, min, max) dihitung dari histogram dalam O(256),
+# tanpa membaca ulang pixel gambar
+class HistogramStats:
+    """Histogram 256 bin per channel, cumulative sum, dan statistik"""
+    
+    def __init__(self, counts):
+        # counts: array int64 (jumlah channel, 256)
+        self.counts = counts
+        
+        # Cumulative sum per channel: cumulative[c, i] = jumlah pixel dengan nilai <= i
+        self.cumulative = np.cumsum(counts, axis=1)
+    
+    # Membuat histogram dari array uint8 2D (grayscale) atau 3D (multi channel)
+    @classmethod
+    def from_array(cls, array):
+        planes = array[:, :, np.newaxis] if array.ndim == 2 else array
+        
+        # np.bincount(): menghitung jumlah kemunculan setiap nilai 0-255 (exact int64)
+        counts = np.stack([np.bincount(planes[:, :, c].ravel(), minlength=256)
+                           for c in range(planes.shape[2])])
+        return cls(counts.astype(np.int64))
+    
+    # Membuat histogram dari BinaryMask tanpa unpack
+    # Pixel putih = jumlah bit 1 di data packed (bit sisa packing selalu 0)
+    @classmethod
+    def from_mask(cls, mask):
+        white = int(np.bincount(mask.packed.ravel(), minlength=256) @ POPCOUNT_TABLE)
+        counts = np.zeros((1, 256), dtype=np.int64)
+        counts[0, 0] = mask.shape[0] * mask.shape[1] - white
+        counts[0, 255] = white
+        return cls(counts)
+    
+    # Histogram setelah gambar dipetakan lewat lookup table (point operation)
+    # Setiap bin i dipindahkan ke bin lut[i]: O(256) per channel
+    # - lut: array uint8 (256,) untuk semua channel
+    def apply_lut(self, lut):
+        counts = np.stack([np.bincount(lut, weights=hist, minlength=256) for hist in self.counts])
+        return HistogramStats(counts.astype(np.int64))
+    
+    # Jumlah pixel per channel
+    @property
+    def total(self):
+        return self.cumulative[:, -1]
+    
+    # Rata-rata intensitas per channel
+    def mean(self):
+        return self.counts @ np.arange(256) / self.total
+    
+    # Standar deviasi intensitas per channel
+    def std(self):
+        mean = self.mean()
+        variance = self.counts @ (np.arange(256) ** 2) / self.total - mean ** 2
+        return np.sqrt(np.maximum(variance, 0))
+    
+    # Threshold Otsu dari histogram channel tertentu (O(256))
+    # Memilih t yang memaksimalkan variance antar kelas (pixel <= t vs pixel > t),
+    # sama seperti cv2.threshold(..., cv2.THRESH_OTSU)
+    def otsu_threshold(self, channel=0):
+        p = self.counts[channel] / self.total[channel]
+        levels = np.arange(256)
+        
+        # q1: proporsi pixel kelas bawah, mu: jumlah kumulatif i * p(i)
+        q1 = np.cumsum(p)
+        q2 = 1 - q1
+        mu = np.cumsum(levels * p)
+        
+        # Variance antar kelas = q1 * q2 * (mu1 - mu2)^2
+        # Batas yang membuat salah satu kelas kosong dilewati
+        valid = (np.minimum(q1, q2) >= np.finfo(np.float32).eps) & (np.maximum(q1, q2) <= 1 - np.finfo(np.float32).eps)
+        if not valid.any():
+            return 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mu1 = mu / q1
+            mu2 = (mu[-1] - mu) / q2
+            sigma = np.where(valid, q1 * q2 * (mu1 - mu2) ** 2, -1)
+        
+        # argmax: t pertama dengan variance maksimum
+        return int(np.argmax(sigma))
+    
+    # Threshold triangle dari histogram channel tertentu (O(256))
+    # Garis ditarik dari puncak histogram ke ujung ekor terpanjang; threshold adalah
+    # bin dengan jarak terjauh ke garis tersebut (cocok untuk histogram unimodal),
+    # sama seperti cv2.threshold(..., cv2.THRESH_TRIANGLE)
+    def triangle_threshold(self, channel=0):
+        hist = self.counts[channel].astype(np.float64)
+        nonzero = np.flatnonzero(hist)
+        
+        # Batas kiri/kanan histogram (diperlebar 1 bin)
+        left = max(nonzero[0] - 1, 0)
+        right = min(nonzero[-1] + 1, 255)
+        peak = int(np.argmax(hist))
+        
+        # Ekor terpanjang di kanan puncak: balik histogram agar ekor selalu di kiri
+        flipped = peak - left < right - peak
+        if flipped:
+            hist = hist[::-1]
+            left = 255 - right
+            peak = 255 - peak
+        
+        # Jarak (tanpa normalisasi) setiap bin di antara ekor dan puncak ke garis
+        threshold = left
+        if peak > left:
+            levels = np.arange(left + 1, peak + 1)
+            distance = hist[peak] * levels + (left - peak) * hist[left + 1:peak + 1]
+            if distance.max() > 0:
+                threshold = left + 1 + int(np.argmax(distance))
+        threshold -= 1
+        
+        return 255 - threshold if flipped else threshold
+    
+    # Ringkasan statistik per channel (satu baris per channel)
+    def summary(self):
+        lines = []
+        for name, hist, mean, std in zip(HIST_CHANNEL_NAMES[len(self.counts)], self.counts, self.mean(), self.std()):
+            nonzero = np.flatnonzero(hist)
+            lines.append(f"{name}: mean {mean:6.1f}  std {std:5.1f}  min {nonzero[0]:3d}  max {nonzero[-1]:3d}")
+        return "\n".join(lines)
+
+# ========== THRESHOLD OTOMATIS ==========
+# Block size maksimum adaptive threshold (ganjil)
+ADAPTIVE_MAX_BLOCK = 201
+
+# Adaptive Gaussian: sampai block size ini cv2.adaptiveThreshold (kernel
+# separable) lebih cepat dan hasilnya persis; di atasnya biaya cv2 naik sebanding
+# block size, sehingga dipakai pendekatan 3x box filter (waktu konstan, berbeda
+# dari cv2 pada ~0.5% pixel). Benchmark 12 MP: keduanya ~1.2 s di block 151
+ADAPTIVE_GAUSSIAN_CV2_MAX_BLOCK = 151
+
+# Fungsi untuk membuat integral image (summed-area table) dengan padding replicate
+# Jumlah pixel dalam kotak berapapun ukurannya cukup dihitung dari 4 titik integral,
+# sehingga waktu adaptive threshold tidak bergantung pada block size
+# - img_array: array 2D (uint8 atau float32)
+# - radius: lebar padding (block_size // 2)
+def padded_integral(img_array, radius):
+    # BORDER_REPLICATE: pixel tepi diulang (sama seperti cv2.adaptiveThreshold)
+    padded = cv2.copyMakeBorder(img_array, radius, radius, radius, radius, cv2.BORDER_REPLICATE)
+    
+    # Nilai integral terbesar = jumlah seluruh pixel; int32 overflow jika
+    # jumlah pixel * 255 melebihi 2^31 - 1, gunakan CV_64F untuk gambar besar
+    # Input float selalu memakai CV_64F
+    if img_array.dtype == np.uint8 and padded.size * 255 <= np.iinfo(np.int32).max:
+        return cv2.integral(padded, sdepth=cv2.CV_32S)
+    return cv2.integral(padded, sdepth=cv2.CV_64F)
+
+# Fungsi untuk menghitung rata-rata setiap kotak block x block dari integral image
+# integral dibuat dengan padded_integral(img, radius) dan block <= 2 * radius + 1
+def box_mean_from_integral(integral, block, shape):
+    height, width = shape
+    
+    # Offset agar kotak tetap berpusat di pixel jika block < 2 * radius + 1
+    offset = (integral.shape[0] - 1 - height - (block - 1)) // 2
+    top, bottom = offset, offset + block
+    
+    # Jumlah kotak = I[bawah, kanan] - I[atas, kanan] - I[bawah, kiri] + I[atas, kiri]
+    box_sum = (integral[bottom:bottom + height, bottom:bottom + width]
+               - integral[top:top + height, bottom:bottom + width]
+               - integral[bottom:bottom + height, top:top + width]
+               + integral[top:top + height, top:top + width])
+    return box_sum / float(block * block)
+
+# Fungsi untuk menghitung ukuran box filter yang, jika diulang n kali,
+# mendekati Gaussian dengan sigma tertentu (central limit theorem)
+def gaussian_box_sizes(sigma, n=3):
+    # Lebar box ideal, dibulatkan ke bilangan ganjil terdekat di bawahnya
+    w_ideal = np.sqrt(12 * sigma ** 2 / n + 1)
+    w_low = int(np.floor(w_ideal))
+    if w_low % 2 == 0:
+        w_low -= 1
+    w_low = max(w_low, 1)
+    
+    # Sebanyak m pass memakai w_low, sisanya w_low + 2 agar variance sesuai sigma
+    m = round((12 * sigma ** 2 - n * w_low ** 2 - 4 * n * w_low - 3 * n) / (-4 * w_low - 4))
+    return [w_low if i < m else w_low + 2 for i in range(n)]
+
+# Fungsi adaptive threshold dengan integral image
+# Pixel > (rata-rata lokal - C) menjadi 255, selain itu 0
+# - img_gray: array grayscale uint8
+# - method: "mean" (rata-rata kotak) atau "gaussian" (cv2 untuk block kecil,
+#   3x box filter ~ Gaussian untuk block besar)
+# - block_size: ukuran kotak tetangga (ganjil)
+# - c: konstanta pengurang rata-rata
+# - integral: integral image img_gray dengan radius block_size // 2 (opsional,
+#   untuk dipakai ulang antar preview)
+def adaptive_threshold(img_gray, method, block_size, c, integral=None):
+    """Adaptive threshold mean/gaussian dengan waktu konstan terhadap block size"""
+    
+    shape = img_gray.shape
+    
+    if method == "gaussian" and block_size <= ADAPTIVE_GAUSSIAN_CV2_MAX_BLOCK:
+        return cv2.adaptiveThreshold(img_gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                     cv2.THRESH_BINARY, block_size, c)
+    
+    if method == "mean":
+        if integral is None:
+            integral = padded_integral(img_gray, block_size // 2)
+        local = box_mean_from_integral(integral, block_size, shape)
+    else:
+        # Sigma sama seperti cv2.adaptiveThreshold(ADAPTIVE_THRESH_GAUSSIAN_C)
+        sigma = 0.3 * ((block_size - 1) * 0.5 - 1) + 0.8
+        local = img_gray
+        for width in gaussian_box_sizes(sigma):
+            local = box_mean_from_integral(padded_integral(local, width // 2), width, shape).astype(np.float32)
+    
+    # Rata-rata dibulatkan ke uint8 seperti cv2.adaptiveThreshold,
+    # C dibulatkan ke atas untuk THRESH_BINARY
+    threshold = np.rint(local) - np.ceil(c)
+    return np.where(img_gray > threshold, 255, 0).astype(np.uint8)
+
+# ========== REGION STATISTICS ==========
+# Struktur tabel statistik region (structured array NumPy, satu baris per region)
+# Tipe data kecil (int32/float32) agar ribuan region tetap ringkas di memori
+REGION_DTYPE = np.dtype([
+    ("label", np.int32),        # nomor label region (1..N)
+    ("left", np.int32),         # bounding box: x kiri
+    ("top", np.int32),          # bounding box: y atas
+    ("width", np.int32),        # bounding box: lebar
+    ("height", np.int32),       # bounding box: tinggi
+    ("area", np.int32),         # jumlah pixel region
+    ("centroid_x", np.float32), # pusat massa x
+    ("centroid_y", np.float32), # pusat massa y
+])
+
+# Ekstensi file gambar untuk batch labeling
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif")
+
+# Fungsi untuk labeling connected component dan mengukur setiap region
+# - binary: array uint8 2D, pixel bukan nol = foreground
+# - connectivity: 4 atau 8 tetangga
+# Return: (labels int32 HxW, tabel REGION_DTYPE tanpa background)
+def measure_regions(binary, connectivity=8):
+    """Labeling + statistik region dengan cv2.connectedComponentsWithStats"""
+    
+    # stats: [left, top, width, height, area] per label, centroids: [x, y]
+    # Label 0 adalah background
+    count, labels, stats, centroids = cv2.connectedComponentsWithStats(
+        binary, connectivity=connectivity, ltype=cv2.CV_32S)
+    
+    table = np.empty(count - 1, dtype=REGION_DTYPE)
+    table["label"] = np.arange(1, count)
+    table["left"] = stats[1:, cv2.CC_STAT_LEFT]
+    table["top"] = stats[1:, cv2.CC_STAT_TOP]
+    table["width"] = stats[1:, cv2.CC_STAT_WIDTH]
+    table["height"] = stats[1:, cv2.CC_STAT_HEIGHT]
+    table["area"] = stats[1:, cv2.CC_STAT_AREA]
+    table["centroid_x"] = centroids[1:, 0]
+    table["centroid_y"] = centroids[1:, 1]
+    
+    return labels, table
+
+# Fungsi untuk menggabungkan tabel region beberapa gambar menjadi satu tabel
+# dengan kolom "image" (nama file) di depan
+# - tables: list (nama gambar, tabel REGION_DTYPE)
+def combine_region_tables(tables):
+    name_length = max([len(name) for name, _ in tables] + [1])
+    dtype = np.dtype([("image", f"U{name_length}")] + REGION_DTYPE.descr)
+    
+    combined = np.empty(sum(len(table) for _, table in tables), dtype=dtype)
+    start = 0
+    for name, table in tables:
+        rows = combined[start:start + len(table)]
+        rows["image"] = name
+        for field in REGION_DTYPE.names:
+            rows[field] = table[field]
+        start += len(table)
+    
+    return combined
+
+# Fungsi untuk menyimpan tabel (structured array) ke CSV atau Parquet
+# Format ditentukan dari ekstensi file; Parquet butuh pyarrow atau pandas
+# (dependensi opsional, di-import hanya saat dibutuhkan)
+def export_table(table, path):
+    """Menyimpan structured array ke .csv atau .parquet"""
+    
+    if path.lower().endswith(".parquet"):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            pyarrow = None
+        
+        if pyarrow is not None:
+            columns = {name: table[name] for name in table.dtype.names}
+            pyarrow.parquet.write_table(pyarrow.table(columns), path)
+            return
+        
+        try:
+            import pandas
+        except ImportError:
+            raise RuntimeError("Parquet export requires pyarrow or pandas") from None
+        pandas.DataFrame(table).to_parquet(path)
+        return
+    
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(table.dtype.names)
+        # astype(str): float32 ditulis dengan representasi terpendek (tanpa noise float64)
+        writer.writerows(zip(*(table[name].astype(str) for name in table.dtype.names)))
+
+# ========== MORFOLOGI ==========
+# Bentuk structuring element yang tersedia di dialog morfologi
+MORPH_SHAPES = {
+    "Rectangle": cv2.MORPH_RECT,
+    "Ellipse": cv2.MORPH_ELLIPSE,
+    "Cross": cv2.MORPH_CROSS,
+}
+
+# Ukuran kernel maksimum di slider (ganjil)
+MORPH_MAX_KERNEL = 101
+
+# Kernel ellipse/cross mulai ukuran ini didekomposisi menjadi gabungan persegi panjang
+# Di bawahnya cv2 dengan kernel penuh lebih cepat (overhead beberapa pass lebih besar)
+MORPH_DECOMPOSE_MIN = 15
+
+# Fungsi untuk memecah structuring element menjadi gabungan (union) persegi panjang
+# Setiap baris kernel cv2 (rect/ellipse/cross, ukuran ganjil) adalah segmen yang
+# simetris terhadap pusat, dan baris yang lebih lebar selalu lebih dekat ke pusat.
+# Untuk setiap lebar segmen w: semua baris dengan lebar >= w membentuk satu
+# persegi panjang w x h, dan gabungan semua persegi panjang = kernel semula.
+# Return: list (kernel persegi panjang, anchor) untuk cv2.dilate/cv2.erode
+def kernel_rectangles(kernel):
+    """Dekomposisi kernel menjadi persegi panjang (exact)"""
+    center = kernel.shape[0] // 2
+    widths = np.count_nonzero(kernel, axis=1)
+    
+    rectangles = []
+    for width in np.unique(widths[widths > 0]):
+        rows = np.flatnonzero(widths >= width)
+        height = rows[-1] - rows[0] + 1
+        # Anchor: posisi pusat kernel semula di dalam persegi panjang
+        rectangles.append((np.ones((height, width), np.uint8), (int(width) // 2, int(center - rows[0]))))
+    
+    return rectangles
+
+# Fungsi untuk erosi/dilasi dengan dekomposisi kernel besar
+# Dilasi dengan gabungan persegi panjang = maksimum dari dilasi setiap persegi
+# panjang (erosi: minimum). Kernel persegi panjang diproses cv2 secara separable
+# (baris lalu kolom), sehingga biaya linear terhadap jumlah persegi panjang,
+# bukan kuadratik terhadap ukuran kernel.
+def morph_basic(img_array, shape, size, dilate):
+    """Erosi (dilate=False) atau dilasi (dilate=True) dengan kernel shape x size"""
+    op = cv2.dilate if dilate else cv2.erode
+    kernel = cv2.getStructuringElement(MORPH_SHAPES[shape], (size, size))
+    
+    # Persegi panjang sudah separable di cv2; kernel kecil diproses langsung
+    if shape == "Rectangle" or size < MORPH_DECOMPOSE_MIN:
+        return op(img_array, kernel)
+    
+    combine = np.maximum if dilate else np.minimum
+    result = None
+    for rectangle, anchor in kernel_rectangles(kernel):
+        part = op(img_array, rectangle, anchor=anchor)
+        result = part if result is None else combine(result, part, out=result)
+    
+    return result
+
+# Fungsi untuk operasi morfologi (hasil sama dengan cv2.morphologyEx)
+# - op: "erode", "dilate", "open", "close", "gradient", "tophat", "blackhat"
+def morphology(img_array, op, shape, size):
+    """Operasi morfologi dengan kernel shape x size"""
+    if op == "erode":
+        return morph_basic(img_array, shape, size, False)
+    if op == "dilate":
+        return morph_basic(img_array, shape, size, True)
+    if op == "gradient":
+        # Gradient = dilasi - erosi (tepi objek)
+        return cv2.subtract(morph_basic(img_array, shape, size, True),
+                            morph_basic(img_array, shape, size, False))
+    
+    # Opening = erosi lalu dilasi, Closing = dilasi lalu erosi
+    if op in ("open", "tophat"):
+        opened = morph_basic(morph_basic(img_array, shape, size, False), shape, size, True)
+        # Top-hat = gambar - opening (detail terang yang lebih kecil dari kernel)
+        return opened if op == "open" else cv2.subtract(img_array, opened)
+    
+    closed = morph_basic(morph_basic(img_array, shape, size, True), shape, size, False)
+    # Black-hat = closing - gambar (detail gelap yang lebih kecil dari kernel)
+    return closed if op == "close" else cv2.subtract(closed, img_array)
+
+# ========== GAUSSIAN & EDGE-PRESERVING SMOOTHING ==========
+# Pemilihan implementasi Gaussian blur (hasil benchmark pada gambar 5-20 MP):
+# - sigma kecil: cv2.GaussianBlur (kernel separable, biaya sebanding dengan sigma)
+# - sigma besar: FFT (biaya tidak bergantung sigma) atau IIR rekursif
+#   Young-van Vliet (O(1) per pixel, memori paling kecil) untuk gambar sangat besar
+GAUSSIAN_SEPARABLE_MAX_SIGMA = 24
+GAUSSIAN_FFT_MAX_PIXELS = 8_000_000  # jumlah pixel x channel
+
+# Bilateral: sigma spatial di gambar kecil (setelah downsample) untuk mode cepat
+# sigma_space <= 2x nilai ini diproses langsung dengan cv2.bilateralFilter
+BILATERAL_LOW_SIGMA = 3
+
+# Guided filter: radius minimal di gambar kecil dan faktor downsample maksimum
+GUIDED_LOW_RADIUS = 4
+GUIDED_MAX_SUBSAMPLE = 8
+
+# Fungsi untuk menghitung koefisien filter rekursif Gaussian (Young & van Vliet, 1995)
+# Return: (b, a) untuk scipy.signal.lfilter (float32)
+def young_van_vliet_coefficients(sigma):
+    if sigma >= 2.5:
+        q = 0.98711 * sigma - 0.96330
+    else:
+        q = 3.97156 - 4.14554 * np.sqrt(1 - 0.26891 * sigma)
+    
+    b0 = 1.57825 + 2.44413 * q + 1.4281 * q ** 2 + 0.422205 * q ** 3
+    b1 = 2.44413 * q + 2.85619 * q ** 2 + 1.26661 * q ** 3
+    b2 = -(1.4281 * q ** 2 + 1.26661 * q ** 3)
+    b3 = 0.422205 * q ** 3
+    gain = 1 - (b1 + b2 + b3) / b0
+    
+    return (np.array([gain], np.float32),
+            np.array([1, -b1 / b0, -b2 / b0, -b3 / b0], np.float32))
+
+# Fungsi untuk Gaussian blur rekursif (IIR): satu pass maju + satu pass mundur
+# per sumbu, biaya per pixel konstan berapapun sigma
+# Gambar di-padding reflect sebesar 4 sigma seperti gaussian_fft (border sama
+# seperti cv2), lalu dipotong kembali: transien pass mundur yang diawali dari
+# steady state nilai tepi padding tidak sampai ke gambar
+def gaussian_iir(img_array, sigma):
+    """Gaussian blur IIR Young-van Vliet, hasil float32"""
+    b, a = young_van_vliet_coefficients(sigma)
+    zi = lfilter_zi(b, a).astype(np.float32)
+    h, w = img_array.shape[:2]
+    pad = int(np.ceil(4 * sigma))
+    result = cv2.copyMakeBorder(img_array, pad, pad, pad, pad, cv2.BORDER_REFLECT_101).astype(np.float32)
+    
+    for axis in (1, 0):
+        # State awal dibentuk agar broadcast terhadap baris/kolom tepi
+        shape = [1] * result.ndim
+        shape[axis] = -1
+        state = zi.reshape(shape)
+        
+        # Pass maju, flip, pass mundur, flip kembali
+        for _ in range(2):
+            edge = np.take(result, [0], axis=axis)
+            result, _ = lfilter(b, a, result, axis=axis, zi=state * edge)
+            result = np.flip(result, axis)
+    
+    return result[pad:pad + h, pad:pad + w]
+
+# Fungsi untuk Gaussian blur di domain frekuensi (rfft2)
+# Gambar di-padding reflect sebesar 4 sigma (border sama seperti cv2), ukuran FFT
+# dibulatkan ke next_fast_len, lalu dikalikan respons frekuensi Gaussian
+def gaussian_fft(img_array, sigma):
+    """Gaussian blur via FFT, hasil float32"""
+    h, w = img_array.shape[:2]
+    pad = int(np.ceil(4 * sigma))
+    padded = cv2.copyMakeBorder(img_array, pad, pad, pad, pad, cv2.BORDER_REFLECT_101).astype(np.float32)
+    shape = (next_fast_len(padded.shape[0], real=True), next_fast_len(padded.shape[1], real=True))
+    
+    spectrum = rfft2(padded, s=shape, axes=(0, 1), workers=-1)
+    
+    # Respons frekuensi Gaussian: exp(-2 pi^2 sigma^2 f^2)
+    fy = fftfreq(shape[0])[:, None]
+    fx = rfftfreq(shape[1])[None, :]
+    response = np.exp(-2 * np.pi ** 2 * sigma ** 2 * (fy ** 2 + fx ** 2)).astype(np.float32)
+    if spectrum.ndim == 3:
+        response = response[..., None]
+    spectrum *= response
+    
+    result = irfft2(spectrum, s=shape, axes=(0, 1), workers=-1)
+    return result[pad:pad + h, pad:pad + w]
+
+# Fungsi Gaussian blur yang memilih implementasi otomatis berdasarkan sigma
+# dan ukuran gambar (lihat konstanta di atas)
+# Hasil bertipe sama dengan input (uint8, atau float32 tanpa pembulatan)
+def gaussian_blur(img_array, sigma):
+    """Gaussian blur dengan implementasi separable/FFT/IIR"""
+    h, w = img_array.shape[:2]
+    
+    # Sigma kecil, atau gambar lebih kecil dari jangkauan kernel: cv2 separable
+    if sigma < GAUSSIAN_SEPARABLE_MAX_SIGMA or min(h, w) <= 8 * sigma:
+        return cv2.GaussianBlur(img_array, (0, 0), sigma)
+    
+    if img_array.size <= GAUSSIAN_FFT_MAX_PIXELS:
+        return cast_chunk(gaussian_fft(img_array, sigma), img_array.dtype)
+    return cast_chunk(gaussian_iir(img_array, sigma), img_array.dtype)
+
+# Fungsi untuk menghitung koefisien model linear lokal target ~ a * guide + b
+# (inti guided filter) pada gambar kecil, box filter radius "radius"
+# Return: (mean_a, mean_b) float32
+def linear_coefficients(guide, target, radius, eps):
+    def box(x):
+        return cv2.boxFilter(x, -1, (2 * radius + 1, 2 * radius + 1), borderType=cv2.BORDER_REFLECT)
+    
+    mean_guide = box(guide)
+    mean_target = box(target)
+    covariance = box(guide * target) - mean_guide * mean_target
+    variance = box(guide * guide) - mean_guide * mean_guide
+    
+    a = covariance / (variance + eps)
+    b = mean_target - a * mean_guide
+    return box(a), box(b)
+
+# Fungsi untuk menerapkan koefisien (dari gambar kecil) ke guide resolusi penuh
+# Koefisien di-upsample bilinear, lalu q = a * guide + b
+def apply_linear_coefficients(guide, mean_a, mean_b):
+    size = (guide.shape[1], guide.shape[0])
+    if mean_a.shape[:2] != guide.shape[:2]:
+        mean_a = cv2.resize(mean_a, size, interpolation=cv2.INTER_LINEAR)
+        mean_b = cv2.resize(mean_b, size, interpolation=cv2.INTER_LINEAR)
+    
+    # Hitung in-place agar tidak ada array float sementara tambahan
+    mean_a *= guide
+    mean_a += mean_b
+    np.rint(mean_a, out=mean_a)
+    np.clip(mean_a, 0, 255, out=mean_a)
+    return mean_a.astype(np.uint8)
+
+# Fungsi untuk mengecilkan gambar dengan faktor bulat (INTER_AREA)
+def downsample(img_array, factor):
+    if factor == 1:
+        return img_array
+    h, w = img_array.shape[:2]
+    return cv2.resize(img_array, (max(1, w // factor), max(1, h // factor)), interpolation=cv2.INTER_AREA)
+
+# Fungsi untuk Guided Filter (He et al.), gambar menjadi guide bagi dirinya sendiri
+# Fast guided filter: koefisien dihitung pada guide yang di-downsample
+# (radius ikut diperkecil), lalu di-upsample ke resolusi penuh
+# - radius: radius window (pixel gambar penuh)
+# - eps: regularisasi (intensitas^2), makin besar makin halus
+def guided_filter(img_array, radius, eps):
+    """Edge-preserving smoothing dengan fast guided filter"""
+    subsample = max(1, min(radius // GUIDED_LOW_RADIUS, GUIDED_MAX_SUBSAMPLE))
+    
+    guide = img_array.astype(np.float32)
+    guide_low = downsample(guide, subsample)
+    mean_a, mean_b = linear_coefficients(guide_low, guide_low, max(1, radius // subsample), eps)
+    
+    return apply_linear_coefficients(guide, mean_a, mean_b)
+
+# Fungsi untuk Bilateral Filter dengan mode cepat untuk sigma spatial besar
+# cv2.bilateralFilter biayanya kuadratik terhadap sigma_space, sehingga untuk
+# sigma besar filter dijalankan pada gambar yang di-downsample, lalu hasilnya
+# dibawa ke resolusi penuh dengan guided upsampling (model linear lokal antara
+# gambar kecil dan hasil filternya, diterapkan ke gambar penuh sebagai guide)
+def bilateral_filter(img_array, sigma_color, sigma_space):
+    """Bilateral filter (edge-preserving) dengan guided upsampling"""
+    subsample = max(1, int(sigma_space // BILATERAL_LOW_SIGMA))
+    if subsample == 1:
+        return cv2.bilateralFilter(img_array, 0, sigma_color, sigma_space)
+    
+    low = downsample(img_array, subsample)
+    filtered_low = cv2.bilateralFilter(low, 0, sigma_color, sigma_space / subsample)
+    
+    # Window 3x3 dan eps kecil (2^2) agar tepi hasil bilateral tetap tajam
+    mean_a, mean_b = linear_coefficients(low.astype(np.float32), filtered_low.astype(np.float32), 1, 4.0)
+    return apply_linear_coefficients(img_array.astype(np.float32), mean_a, mean_b)
+
+# ========== FILTER DOMAIN FREKUENSI ==========
+# Keluarga filter dan jenis filter yang tersedia di dialog Frequency Filter
+FREQ_FAMILIES = ("Ideal", "Butterworth", "Gaussian")
+FREQ_TYPES = ("Lowpass", "Highpass", "Bandpass", "Bandreject", "Notch Reject", "Notch Pass")
+
+# Channel yang difilter: grayscale, setiap channel RGB (FFT batch HxWx3),
+# atau hanya luminance (Y) dengan chroma (Cr, Cb) gambar asli dipertahankan
+FREQ_CHANNELS = ("Gray", "Per Channel (Color)", "Luminance (Color)")
+
+# Fungsi untuk membuat grid frekuensi spektrum rfft2 (setengah bidang, tanpa shift)
+# Frekuensi dalam satuan index (siklus per gambar), sama seperti jarak dari pusat
+# pada spektrum yang di-fftshift
+# Return: (fy kolom Hx1, fx baris 1x(W//2+1), distance HxW//2+1) float32
+def frequency_grid(shape):
+    """Grid frekuensi dan jarak D(u,v) dari DC untuk spektrum rfft2"""
+    rows, cols = shape
+    fy = (fftfreq(rows) * rows).astype(np.float32)[:, None]
+    fx = (rfftfreq(cols) * cols).astype(np.float32)[None, :]
+    return fy, fx, np.sqrt(fy ** 2 + fx ** 2)
+
+# Fungsi untuk respons lowpass H(D) keluarga filter tertentu
+# - Ideal: 1 jika D <= D0, 0 jika tidak
+# - Butterworth: 1 / (1 + (D / D0)^(2n))
+# - Gaussian: exp(-D^2 / (2 D0^2))
+def lowpass_response(distance, family, cutoff, order):
+    if family == "Ideal":
+        return (distance <= cutoff).astype(np.float32)
+    if family == "Butterworth":
+        response = np.power(distance / np.float32(cutoff), 2 * order)
+        response += 1
+        return np.reciprocal(response, out=response)
+    response = np.square(distance / np.float32(cutoff))
+    response *= -0.5
+    return np.exp(response, out=response)
+
+# Fungsi untuk respons bandreject H(D) dengan pusat band D0 dan lebar W
+# - Ideal: 0 jika D0 - W/2 <= D <= D0 + W/2
+# - Butterworth: 1 / (1 + (D W / (D^2 - D0^2))^(2n))
+# - Gaussian: 1 - exp(-((D^2 - D0^2) / (D W))^2)
+def bandreject_response(distance, family, cutoff, order, width):
+    if family == "Ideal":
+        return (np.abs(distance - cutoff) > width / 2).astype(np.float32)
+    
+    # Pembagian nol (D = D0 atau D = 0) menghasilkan inf, yang memberi
+    # limit yang benar (0 atau 1), jadi warning diabaikan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = distance * np.float32(width) / (np.square(distance) - np.float32(cutoff) ** 2)
+        if family == "Butterworth":
+            response = np.power(ratio, 2 * order)
+            response += 1
+            return np.reciprocal(response, out=response)
+        response = np.reciprocal(ratio, out=ratio)
+        np.square(response, out=response)
+        response *= -1
+        np.exp(response, out=response)
+        return np.subtract(1, response, out=response)
+
+# Fungsi untuk membuat mask (transfer function) filter frekuensi
+# Semua mask dihitung tervektorisasi dari grid frekuensi (tanpa loop per pixel)
+# - grid: hasil frequency_grid()
+# - kind: salah satu FREQ_TYPES
+# - cutoff: D0 (cutoff lowpass/highpass, pusat band, atau radius notch)
+# - order: orde Butterworth (diabaikan untuk Ideal/Gaussian)
+# - width: lebar band untuk Bandpass/Bandreject
+# - notch: (u0, v0) posisi notch; pasangan simetrisnya (-u0, -v0) ikut di-reject
+def frequency_mask(grid, family, kind, cutoff, order=2, width=20, notch=(0, 0)):
+    """Transfer function H(u,v) float32 untuk spektrum rfft2"""
+    fy, fx, distance = grid
+    
+    if kind in ("Lowpass", "Highpass"):
+        mask = lowpass_response(distance, family, cutoff, order)
+    elif kind in ("Bandpass", "Bandreject"):
+        mask = bandreject_response(distance, family, cutoff, order, width)
+    else:
+        # Notch reject = perkalian dua highpass yang berpusat di (u0, v0) dan (-u0, -v0)
+        u0, v0 = notch
+        mask = None
+        for sign in (1, -1):
+            notch_distance = np.sqrt((fy - sign * u0) ** 2 + (fx - sign * v0) ** 2)
+            reject = lowpass_response(notch_distance, family, cutoff, order)
+            np.subtract(1, reject, out=reject)
+            mask = reject if mask is None else np.multiply(mask, reject, out=mask)
+    
+    # Highpass = 1 - lowpass, Bandpass = 1 - bandreject, Notch Pass = 1 - notch reject
+    if kind in ("Highpass", "Bandpass", "Notch Pass"):
+        np.subtract(1, mask, out=mask)
+    
+    return mask
+
+# Fungsi untuk menyusun spektrum penuh (layout fft2) dari spektrum rfft2
+# Gambar real: F(-u, -v) = conj(F(u, v)), sehingga kolom frekuensi negatif
+# diambil dari kolom positif (simetri Hermitian)
+# - half: hasil rfft2 (HxW//2+1, atau HxW//2+1xC)
+# - cols: lebar gambar asli W
+def full_spectrum(half, cols):
+    """Spektrum fft2 lengkap (belum di-shift) dari hasil rfft2"""
+    rows, half_cols = half.shape[:2]
+    full = np.empty((rows, cols) + half.shape[2:], dtype=half.dtype)
+    full[:, :half_cols] = half
+    
+    # Kolom v (negatif) = conj(F(-u, W - v))
+    mirror_rows = -np.arange(rows) % rows
+    mirror_cols = cols - np.arange(half_cols, cols)
+    full[:, half_cols:] = np.conj(half[mirror_rows][:, mirror_cols])
+    return full
+
+# Fungsi untuk membuat gambar log-magnitude dari spektrum
+# log(1 + |F|) dinormalisasi min-max ke 0-255 (rentang dinamis penuh, tidak ada
+# bagian yang saturasi)
+def magnitude_image(spectrum):
+    """Gambar uint8 log-magnitude untuk visualisasi spektrum"""
+    magnitude = np.log1p(np.abs(spectrum))
+    return cv2.normalize(magnitude, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+
+# Fungsi untuk membuat gambar log-magnitude dan phase dari spektrum (sudah di-shift)
+# - Log-magnitude: lihat magnitude_image()
+# - Phase: sudut -pi..pi dipetakan linear ke 0-255
+def spectrum_images(spectrum):
+    """Gambar uint8 (log-magnitude, phase) untuk visualisasi spektrum"""
+    magnitude = magnitude_image(spectrum)
+    
+    phase = np.angle(spectrum).astype(np.float32)
+    phase = cv2.convertScaleAbs(phase, alpha=255 / (2 * np.pi), beta=127.5)
+    return magnitude, phase
+
+# Fungsi untuk menerapkan mask pada spektrum rfft2 dan kembali ke domain spasial
+# - spectrum: hasil rfft2 (HxW//2+1, atau HxW//2+1xC untuk gambar berwarna)
+# - shape: ukuran gambar asli (H, W)
+# Hasil: magnitude |ifft| di-clip ke 0-255 (uint8), sama seperti filter sebelumnya
+def apply_frequency_mask(spectrum, mask, shape):
+    """Filter spektrum dengan mask, hasil gambar uint8"""
+    if spectrum.ndim == 3:
+        mask = mask[..., None]
+    
+    result = irfft2(spectrum * mask, s=shape, axes=(0, 1), workers=-1)
+    np.abs(result, out=result)
+    np.clip(result, 0, 255, out=result)
+    return result.astype(np.uint8)
+
+# ========== GRADIENT (INT16) ==========
+# Kernel gradient dalam bentuk korelasi (yang dipakai cv2.filter2D):
+# (kernel_x, kernel_y, anchor). Arah positif = intensitas naik ke kanan/bawah.
+# Hasil identik (magnitude) dengan ndimage.convolve sebelumnya:
+# - convolve membalik kernel, sehingga Prewitt di sini = kernel lama dibalik
+#   (tanda berlawanan, magnitude sama)
+# - Roberts 2x2: convolve memakai pixel (i, j) dan (i+1, j+1), sama dengan
+#   filter2D kernel dibalik + anchor (0, 0) (sudah dicek numerik)
+# - border mode 'reflect' ndimage = cv2.BORDER_REFLECT
+GRADIENT_KERNELS = {
+    "Prewitt": (np.array([[-1, 0, 1],
+                          [-1, 0, 1],
+                          [-1, 0, 1]], dtype=np.float32),
+                np.array([[-1, -1, -1],
+                          [0, 0, 0],
+                          [1, 1, 1]], dtype=np.float32),
+                (-1, -1)),
+    "Roberts": (np.array([[-1, 0],
+                          [0, 1]], dtype=np.float32),
+                np.array([[0, -1],
+                          [1, 0]], dtype=np.float32),
+                (0, 0)),
+}
+GRADIENT_OPERATORS = ("Sobel",) + tuple(GRADIENT_KERNELS)
+
+# Fungsi untuk menghitung gradient Gx, Gy dalam int16
+# Nilai maksimum |G| = 4 * 255 (Sobel), jauh di bawah batas int16, sehingga
+# hasil exact dengan memori 2 byte per pixel (bukan 8 byte float64)
+def image_gradients(img_gray, operator):
+    """Gradient (Gx, Gy) int16 untuk operator Sobel/Prewitt/Roberts"""
+    if operator == "Sobel":
+        # Border default cv2 (BORDER_REFLECT_101), sama seperti sebelumnya
+        return (cv2.Sobel(img_gray, cv2.CV_16S, 1, 0, ksize=3),
+                cv2.Sobel(img_gray, cv2.CV_16S, 0, 1, ksize=3))
+    
+    kernel_x, kernel_y, anchor = GRADIENT_KERNELS[operator]
+    return (cv2.filter2D(img_gray, cv2.CV_16S, kernel_x, anchor=anchor, borderType=cv2.BORDER_REFLECT),
+            cv2.filter2D(img_gray, cv2.CV_16S, kernel_y, anchor=anchor, borderType=cv2.BORDER_REFLECT))
+
+# Fungsi untuk menghitung gradient dx, dy int16 persis seperti di dalam cv2.Canny
+# (Sobel BORDER_REPLICATE, skala 1/16 untuk aperture 7), sehingga
+# cv2.Canny(dx, dy, low, high) sama dengan cv2.Canny(img, low, high, apertureSize)
+# sigma > 0: Gaussian blur tambahan sebelum gradient
+def canny_gradients(img_gray, aperture=3, sigma=0):
+    """Gradient (dx, dy) int16 untuk overload cv2.Canny(dx, dy, ...)"""
+    if sigma > 0:
+        img_gray = gaussian_blur(img_gray, sigma)
+    
+    scale = 1 / 16 if aperture == 7 else 1
+    return (cv2.Sobel(img_gray, cv2.CV_16S, 1, 0, ksize=aperture, scale=scale, borderType=cv2.BORDER_REPLICATE),
+            cv2.Sobel(img_gray, cv2.CV_16S, 0, 1, ksize=aperture, scale=scale, borderType=cv2.BORDER_REPLICATE))
+
+# Fungsi untuk menggabungkan Gx, Gy menjadi magnitude uint8 (+ orientasi opsional)
+# - norm "L2": sqrt(Gx^2 + Gy^2) dalam float32, dibulatkan ke bawah dan di-clip
+#   255 (sama seperti np.clip(...).astype(np.uint8)). np.sqrt dipakai, bukan
+#   cv2.magnitude: sqrt cepat cv2.magnitude bisa meleset 1 ulp (121.99999 untuk
+#   122), sehingga pembulatan ke bawah bergeser satu level
+# - norm "L1": |Gx| + |Gy| langsung di uint8 dengan saturasi
+# - orientation: True untuk juga mengembalikan arah gradient (derajat 0-360, float32)
+def gradient_magnitude(gx, gy, norm="L2", orientation=False):
+    """Magnitude gradient uint8 dan orientasi (atau None)"""
+    angle = None
+    if norm == "L1":
+        magnitude = cv2.add(cv2.convertScaleAbs(gx), cv2.convertScaleAbs(gy))
+        if orientation:
+            angle = cv2.phase(gx.astype(np.float32), gy.astype(np.float32), angleInDegrees=True)
+    else:
+        gx = gx.astype(np.float32)
+        gy = gy.astype(np.float32)
+        if orientation:
+            angle = cv2.phase(gx, gy, angleInDegrees=True)
+        
+        # Gx^2 + Gy^2 exact di float32 (maksimum 2 * 1020^2 < 2^24)
+        magnitude = cv2.multiply(gx, gx)
+        magnitude += cv2.multiply(gy, gy)
+        np.sqrt(magnitude, out=magnitude)
+        np.minimum(magnitude, 255, out=magnitude)
+        magnitude = magnitude.astype(np.uint8)
+    
+    return magnitude, angle
+
+# Fungsi untuk visualisasi orientasi gradient sebagai warna HSV
+# Hue = arah gradient, Value = magnitude (tepi lemah gelap)
+def orientation_image(magnitude, angle):
+    """Gambar RGB arah gradient (hue) dengan kecerahan magnitude"""
+    # Hue OpenCV 8-bit: 0-180 untuk 0-360 derajat
+    hue = cv2.convertScaleAbs(angle, alpha=0.5)
+    hsv = cv2.merge([hue, np.full_like(magnitude, 255), magnitude])
+    return cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB)
+
+# ========== SCALE SPACE (LoG / DoG) ==========
+# Gaussian scale-space: level i = gambar di-blur dengan sigma
+# SCALE_SPACE_BASE_SIGMA * SCALE_SPACE_FACTOR^i (dalam pixel gambar asli)
+# Factor sqrt(2): sigma naik 2x setiap 2 level
+SCALE_SPACE_BASE_SIGMA = 1.0
+SCALE_SPACE_FACTOR = 2 ** 0.5
+SCALE_SPACE_LEVELS = 8
+SCALE_SPACE_METHODS = ("LoG", "DoG", "Zero Crossing")
+
+# Class untuk Gaussian stack yang dibangun bertahap (lazy) dan di-cache
+# Level baru dihitung dari level sebelumnya: blur Gaussian bersifat aditif
+# (sigma_a^2 + sigma_b^2), sehingga level i cukup di-blur dengan
+# sqrt(sigma_i^2 - sigma_(i-1)^2) dari level i-1, bukan dari gambar asli
+class GaussianStack:
+    """Gaussian scale-space float32 yang dihitung bertahap"""
+    
+    def __init__(self, img_gray, base_sigma=SCALE_SPACE_BASE_SIGMA, factor=SCALE_SPACE_FACTOR):
+        # base_sigma dalam pixel gambar ini (sudah disesuaikan untuk proxy)
+        self.image = img_gray.astype(np.float32)
+        self.base_sigma = base_sigma
+        self.factor = factor
+        self.levels = []
+    
+    # Sigma level i
+    def sigma(self, i):
+        return self.base_sigma * self.factor ** i
+    
+    # Gambar blur level i, level yang belum ada dihitung dari level terakhir
+    def level(self, i):
+        while len(self.levels) <= i:
+            n = len(self.levels)
+            if n == 0:
+                self.levels.append(gaussian_blur(self.image, self.sigma(0)))
+            else:
+                step = (self.sigma(n) ** 2 - self.sigma(n - 1) ** 2) ** 0.5
+                self.levels.append(gaussian_blur(self.levels[-1], step))
+        return self.levels[i]
+    
+    # Laplacian of Gaussian ternormalisasi skala: sigma^2 * Laplacian(level i)
+    # Normalisasi membuat respon antar level sebanding
+    def log(self, i):
+        return cv2.Laplacian(self.level(i), cv2.CV_32F, scale=self.sigma(i) ** 2)
+    
+    # Difference of Gaussian: level i+1 - level i ~ (k - 1) * sigma^2 * Laplacian
+    # Dibagi (k - 1) agar skalanya sama dengan LoG ternormalisasi
+    def dog(self, i):
+        return cv2.subtract(self.level(i + 1), self.level(i)) * np.float32(1 / (self.factor - 1))
+
+# Fungsi untuk mendeteksi zero crossing pada respon LoG/DoG
+# Pixel ditandai bila tanda berbeda dengan tetangga kanan atau bawah dan
+# selisih keduanya melebihi threshold (menekan crossing akibat noise)
+# Return: array uint8 0/255
+def zero_crossings(response, threshold=0):
+    positive = response > 0
+    edges = np.zeros(response.shape, dtype=bool)
+    
+    # Tetangga horizontal dan vertikal
+    for axis in (1, 0):
+        here = [slice(None), slice(None)]
+        there = [slice(None), slice(None)]
+        here[axis] = slice(None, -1)
+        there[axis] = slice(1, None)
+        here, there = tuple(here), tuple(there)
+        
+        crossing = positive[here] != positive[there]
+        crossing &= np.abs(response[here] - response[there]) > threshold
+        edges[here] |= crossing
+    
+    return edges.view(np.uint8) * np.uint8(255)
+
+# ========== KOREKSI GEOMETRIS (REMAP) ==========
+# Jumlah maksimum pasangan map remap yang disimpan di cache aplikasi
+# (satu koreksi = map gambar penuh + map proxy untuk preview)
+REMAP_CACHE_SIZE = 4
+
+# Fungsi untuk mengurutkan 4 titik sudut menjadi kiri atas, kanan atas,
+# kanan bawah, kiri bawah (urutan klik user bebas)
+# - kiri atas: x + y terkecil, kanan bawah: x + y terbesar
+# - kanan atas: y - x terkecil, kiri bawah: y - x terbesar
+def order_corners(points):
+    """Array float32 (4, 2) titik sudut berurutan TL, TR, BR, BL"""
+    points = np.asarray(points, dtype=np.float32)
+    total = points.sum(axis=1)
+    diff = points[:, 1] - points[:, 0]
+    return points[[np.argmin(total), np.argmin(diff), np.argmax(total), np.argmax(diff)]]
+
+# Fungsi untuk menghitung ukuran hasil koreksi: sisi terpanjang dari pasangan
+# sisi yang berhadapan, sehingga dokumen tidak mengecil
+def rectified_size(corners):
+    """(width, height) gambar hasil koreksi perspektif"""
+    tl, tr, br, bl = corners
+    width = max(np.linalg.norm(tr - tl), np.linalg.norm(br - bl))
+    height = max(np.linalg.norm(bl - tl), np.linalg.norm(br - tr))
+    return max(1, int(round(width))), max(1, int(round(height)))
+
+# Fungsi untuk menghitung map remap koreksi perspektif (homography)
+# H memetakan pixel hasil (x, y) ke koordinat sumber, sama seperti
+# cv2.warpPerspective(..., WARP_INVERSE_MAP)
+# Map float32 dikonversi ke fixed-point (CV_16SC2 + CV_16UC1) dengan
+# cv2.convertMaps: memori setengahnya dan cv2.remap lebih cepat
+def perspective_maps(corners, size):
+    """Map fixed-point (map1, map2) untuk cv2.remap"""
+    width, height = size
+    target = np.float32([[0, 0], [width - 1, 0], [width - 1, height - 1], [0, height - 1]])
+    h = cv2.getPerspectiveTransform(target, corners).astype(np.float32)
+    
+    # Koordinat homogen per pixel lewat broadcasting baris x kolom
+    xs = np.arange(width, dtype=np.float32)
+    ys = np.arange(height, dtype=np.float32)[:, None]
+    w = h[2, 0] * xs + (h[2, 1] * ys + h[2, 2])
+    map_x = (h[0, 0] * xs + (h[0, 1] * ys + h[0, 2])) / w
+    map_y = (h[1, 0] * xs + (h[1, 1] * ys + h[1, 2])) / w
+    
+    return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+# Fungsi untuk matriks kamera perkiraan bila data kalibrasi tidak tersedia:
+# focal length = sisi terpanjang gambar, titik pusat = tengah gambar
+# Koefisien distorsi relatif terhadap focal ini, sehingga nilai yang sama
+# memberi koreksi yang sama di gambar penuh maupun proxy
+def lens_camera_matrix(size):
+    """Matriks kamera 3x3 float64 untuk gambar ukuran (width, height)"""
+    width, height = size
+    focal = max(width, height)
+    return np.array([[focal, 0, (width - 1) / 2],
+                     [0, focal, (height - 1) / 2],
+                     [0, 0, 1]], dtype=np.float64)
+
+# Fungsi untuk menghitung map undistort fixed-point (CV_16SC2 + CV_16UC1)
+# - coefficients: (k1, k2, p1, p2), radial k1/k2 dan tangensial p1/p2
+def undistort_maps(size, coefficients):
+    """Map (map1, map2) cv2.remap untuk koreksi distorsi lensa"""
+    camera = lens_camera_matrix(size)
+    return cv2.initUndistortRectifyMap(camera, np.array(coefficients, dtype=np.float64), None,
+                                       camera, size, cv2.CV_16SC2)
+
+# ========== BACKGROUND WORKER ==========
+# Exception yang dilempar oleh callback progress saat user menekan Cancel
+# Komputasi di worker thread berhenti di checkpoint progress berikutnya
+class OperationCancelled(Exception):
+    """Operasi dibatalkan oleh user"""
+
+# ========== BINARY MASK (BIT-PACKED) ==========
+# Class untuk gambar biner (hanya hitam 0 / putih 255) yang disimpan 1 bit per pixel
+# np.packbits(): 8 pixel digabung menjadi 1 byte, memori 8x lebih kecil dari uint8
+# Operasi AND/OR/XOR dijalankan langsung pada byte hasil packing (8 pixel sekaligus)
+# Unpack ke uint8 hanya dilakukan saat gambar perlu ditampilkan atau disimpan
+class BinaryMask:
+    """Gambar biner 1 bit per pixel (bit-packed)"""
+    
+    def __init__(self, packed, shape):
+        # packed: array uint8 (tinggi, ceil(lebar / 8)), setiap baris di-pack terpisah
+        # shape: ukuran asli (tinggi, lebar) sebelum packing
+        self.packed = packed
+        self.shape = tuple(shape)
+    
+    # Membuat BinaryMask dari array 2D: pixel bukan nol dianggap putih
+    @classmethod
+    def from_array(cls, array):
+        # axis=1: packing per baris, sisa bit di akhir baris diisi 0
+        return cls(np.packbits(array != 0, axis=1), array.shape)
+    
+    # Ukuran (width, height) seperti PIL Image.size
+    @property
+    def size(self):
+        return (self.shape[1], self.shape[0])
+    
+    # Jumlah byte yang dipakai data packed
+    @property
+    def nbytes(self):
+        return self.packed.nbytes
+    
+    # Operasi boolean dengan mask lain berukuran sama
+    # op: np.bitwise_and / np.bitwise_or / np.bitwise_xor
+    # Bit sisa di akhir baris ikut dioperasikan tapi dibuang saat unpack
+    def combine(self, other, op):
+        if self.shape != other.shape:
+            raise ValueError(f"Mask size mismatch: {self.size} vs {other.size}")
+        return BinaryMask(op(self.packed, other.packed), self.shape)
+    
+    def __and__(self, other):
+        return self.combine(other, np.bitwise_and)
+    
+    def __or__(self, other):
+        return self.combine(other, np.bitwise_or)
+    
+    def __xor__(self, other):
+        return self.combine(other, np.bitwise_xor)
+    
+    # Unpack ke array uint8 0/255 (ukuran penuh)
+    def to_array(self):
+        # count: buang bit sisa packing di akhir setiap baris
+        bits = np.unpackbits(self.packed, axis=1, count=self.shape[1])
+        
+        # 0/1 -> 0/255 in-place (tanpa alokasi array baru)
+        return np.multiply(bits, 255, out=bits)
+    
+    # Unpack ke PIL Image mode "L" (untuk display/save)
+    def to_image(self):
+        return Image.fromarray(self.to_array())
+
+# Fungsi untuk mengecek apakah array grayscale hanya berisi 0 dan 255
+def is_binary_array(array):
+    # cv2.inRange(): 255 untuk pixel bernilai 1-254 (bukan hitam/putih murni)
+    return cv2.countNonZero(cv2.inRange(array, 1, 254)) == 0
+
+# Fungsi untuk mendapatkan array grayscale dari operand (array atau BinaryMask)
+def operand_to_gray(operand):
+    if isinstance(operand, BinaryMask):
+        return operand.to_array()
+    return operand
+
+# ========== CACHE OPERAND KEDUA (MASK) ==========
+# Operasi boolean yang tersedia untuk batch dan combine
+# Semua fungsi mendukung parameter out= untuk operasi in-place
+BOOLEAN_OPS = {
+    "AND": np.bitwise_and,
+    "OR": np.bitwise_or,
+    "XOR": np.bitwise_xor,
+}
+
+# Jumlah maksimum operand (kombinasi file + ukuran target) yang disimpan di cache
+MASK_CACHE_SIZE = 8
+
+# Cache LRU: (path, waktu modifikasi, ukuran) -> array grayscale uint8,
+# atau BinaryMask jika gambar biner (8x lebih hemat memori)
+MASK_CACHE = OrderedDict()
+
+# Lock karena cache bisa diakses dari worker thread (batch mode)
+MASK_CACHE_LOCK = threading.Lock()
+
+# Fungsi untuk memuat gambar kedua operasi boolean (mask)
+# Gambar di-decode, di-resize ke ukuran target, dan dikonversi ke grayscale
+# hanya sekali per ukuran target, lalu dipakai ulang dari cache
+# Hasil berupa BinaryMask jika gambar hanya berisi 0/255, selain itu array grayscale
+# - path: path file gambar kedua
+# - size: ukuran target (width, height), biasanya ukuran gambar pertama
+# - cache: False untuk gambar yang hanya dipakai sekali (tidak menggusur mask di cache)
+def load_mask_operand(path, size, cache=True):
+    """Memuat gambar kedua (mask) sebagai array grayscale/BinaryMask dengan cache per ukuran target"""
+    
+    # Key cache: path absolut + waktu modifikasi (cache otomatis invalid jika file
+    # berubah) + ukuran target
+    key = (os.path.abspath(path), os.path.getmtime(path), tuple(size))
+    
+    with MASK_CACHE_LOCK:
+        if key in MASK_CACHE:
+            # Tandai sebagai paling baru dipakai
+            MASK_CACHE.move_to_end(key)
+            return MASK_CACHE[key]
+    
+    # Decode, resize, dan konversi grayscale (sama seperti operasi boolean biasa)
+    with Image.open(path) as img:
+        array = np.array(img.resize(tuple(size)).convert("L"))
+    
+    # Gambar biner disimpan dalam bentuk bit-packed
+    # Selain itu, array dipakai bersama oleh banyak operasi, jadi dibuat read-only
+    if is_binary_array(array):
+        array = BinaryMask.from_array(array)
+        array.packed.flags.writeable = False
+    else:
+        array.flags.writeable = False
+    
+    if cache:
+        with MASK_CACHE_LOCK:
+            MASK_CACHE[key] = array
+            
+            # Buang entry paling lama jika cache penuh
+            while len(MASK_CACHE) > MASK_CACHE_SIZE:
+                MASK_CACHE.popitem(last=False)
+    
+    return array
+
 # ========== DEFINISI CLASS UTAMA ==========
 # Mendefinisikan class ImageProcessingApp sebagai blueprint aplikasi
 class ImageProcessingApp:
@@ -60,6 +1479,31 @@ class ImageProcessingApp:
         # Mengatur ukuran window awal: lebar 1200px, tinggi 800px
         self.root.geometry("1200x800")
         
+        # State aplikasi (gambar, cache, log timing) tanpa widget Tkinter
+        self.init_state()
+        
+        # Opsi untuk mengukur memori puncak (tracemalloc memperlambat operasi)
+        self.track_memory = tk.BooleanVar(value=True)
+        
+        # Toggle untuk mem-profile menu command berikutnya (termasuk preview-nya)
+        self.profile_next = tk.BooleanVar(value=False)
+        
+        # Memanggil method untuk membuat struktur menu
+        self.create_menu()
+        
+        # Memanggil method untuk membuat status bar (dibuat sebelum canvas
+        # agar selalu mendapat tempat di bagian bawah window)
+        self.create_status_bar()
+        
+        # Memanggil method untuk membuat area tampilan gambar
+        self.create_canvas()
+    
+    # Method untuk mengisi state aplikasi yang tidak bergantung pada Tkinter
+    # Dipanggil oleh __init__ dan oleh HeadlessApp di benchmark.py, sehingga
+    # atribut baru cukup ditambahkan di sini
+    def init_state(self):
+        """Inisialisasi gambar, cache, dan log timing"""
+        
         # Membuat atribut untuk menyimpan gambar asli/original
         # Diinisialisasi None karena belum ada gambar yang dimuat
         self.original_image = None
@@ -67,6 +1511,34 @@ class ImageProcessingApp:
         # Membuat atribut untuk menyimpan gambar hasil pemrosesan
         self.processed_image = None
         
+        # Hasil pemrosesan berupa gambar biner disimpan bit-packed (BinaryMask)
+        # Diisi oleh thresholding, binary, canny, region growing, dan boolean biner
+        # Hanya salah satu dari processed_image / processed_mask yang terisi
+        self.processed_mask = None
+        
+        # Cache BinaryMask dari gambar original: (gambar, mask atau None)
+        self._original_mask = (None, None)
+        
+        # Cache hasil konversi color space terakhir gambar original: (gambar, space, array)
+        # Hanya satu entry agar tidak menahan banyak array HxWx3 ukuran penuh
+        self._color_cache = (None, None, None)
+        
+        # Cache gambar proxy untuk preview: (gambar original, proxy)
+        self._proxy_image = (None, None)
+        
+        # Cache spektrum rfft2 dan grid frekuensi gambar original: (gambar, {key: hasil})
+        self._spectrum_cache = (None, {})
+        
+        # Cache map remap koreksi geometris: key parameter -> (map1, map2)
+        self._remap_cache = OrderedDict()
+        
+        # Cache histogram: (id gambar, mode) -> (gambar, HistogramStats)
+        self._hist_cache = OrderedDict()
+        
+        # Jendela histogram (None jika tertutup) dan histogram preview dari LUT
+        self.histogram_window = None
+        self.temp_histogram = None
+        
         # Membuat atribut untuk menyimpan gambar sementara (untuk preview slider)
         self.temp_image = None  # Untuk preview saat slider bergerak
         
@@ -74,11 +1546,15 @@ class ImageProcessingApp:
         # Berguna untuk fitur save
         self.image_path = None
         
-        # Memanggil method untuk membuat struktur menu
-        self.create_menu()
+        # Log bergulir berisi record timing setiap operasi (instrumentasi performa)
+        self.perf_log = deque(maxlen=PERF_LOG_SIZE)
         
-        # Memanggil method untuk membuat area tampilan gambar
-        self.create_canvas()
+        # Stack record operasi yang sedang berjalan
+        # Preview slider berjalan di dalam menu command, sehingga record bisa bersarang
+        self._perf_stack = []
+        
+        # Profiler yang sedang aktif (dipakai juga oleh worker thread)
+        self._active_profiler = None
     
     # ========== METHOD MEMBUAT CANVAS ==========
     # Method untuk membuat area canvas (area tampilan gambar)
@@ -127,6 +1603,18 @@ class ImageProcessingApp:
         # Menempatkan canvas processed di baris 1, kolom 1 (sebelah kanan canvas_original)
         self.canvas_processed.grid(row=1, column=1, padx=5, pady=5)
     
+    # ========== METHOD MEMBUAT STATUS BAR ==========
+    # Method untuk membuat status bar di bagian bawah window
+    def create_status_bar(self):
+        """Membuat status bar untuk menampilkan timing operasi terakhir"""
+        
+        # relief=tk.SUNKEN: tampilan cekung seperti status bar pada umumnya
+        # anchor=tk.W: teks rata kiri
+        self.status_bar = tk.Label(self.root, text="Ready", relief=tk.SUNKEN, anchor=tk.W, font=("Arial", 9))
+        
+        # side=tk.BOTTOM, fill=tk.X: menempel di bawah dan selebar window
+        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+    
     # ========== METHOD MEMBUAT MENU ==========
     # Method untuk membuat struktur menu lengkap
     def create_menu(self):
@@ -151,13 +1639,14 @@ class ImageProcessingApp:
         
         # Menambahkan item "Open..." ke menu File
         # command=self.open_image: fungsi yang dipanggil saat menu diklik
-        menu_file.add_command(label="Open...", command=self.open_image)
+        # self.instrument(): membungkus command agar waktu dan memori operasi dicatat
+        menu_file.add_command(label="Open...", command=self.instrument("Open...", self.open_image))
         
         # Menambahkan item "Save" yang memanggil self.save_image
-        menu_file.add_command(label="Save", command=self.save_image)
+        menu_file.add_command(label="Save", command=self.instrument("Save", self.save_image))
         
         # Menambahkan item "Save As" yang memanggil self.save_as_image
-        menu_file.add_command(label="Save As", command=self.save_as_image)
+        menu_file.add_command(label="Save As", command=self.instrument("Save As", self.save_as_image))
         
         # Menambahkan garis pemisah horizontal di menu
         # Untuk memisahkan grup menu yang berbeda
@@ -172,7 +1661,7 @@ class ImageProcessingApp:
         menubar.add_cascade(label="Basic Ops", menu=menu_basic)
         
         # Menu item "Negative" untuk membuat gambar negatif
-        menu_basic.add_command(label="Negative", command=self.negative)
+        menu_basic.add_command(label="Negative", command=self.instrument("Negative", self.negative))
         
         # ===== Submenu Arithmetic =====
         # Membuat submenu "Arithmetic" di dalam menu_basic
@@ -183,16 +1672,16 @@ class ImageProcessingApp:
         menu_basic.add_cascade(label="Arithmetic", menu=menu_arithmetic)
         
         # Item "Add (+)" untuk operasi penambahan
-        menu_arithmetic.add_command(label="Add (+)", command=self.arithmetic_add)
+        menu_arithmetic.add_command(label="Add (+)", command=self.instrument("Add (+)", self.arithmetic_add))
         
         # Item "Subtract (-)" untuk operasi pengurangan
-        menu_arithmetic.add_command(label="Subtract (-)", command=self.arithmetic_subtract)
+        menu_arithmetic.add_command(label="Subtract (-)", command=self.instrument("Subtract (-)", self.arithmetic_subtract))
         
         # Item "Multiply (*)" untuk operasi perkalian
-        menu_arithmetic.add_command(label="Multiply (*)", command=self.arithmetic_multiply)
+        menu_arithmetic.add_command(label="Multiply (*)", command=self.instrument("Multiply (*)", self.arithmetic_multiply))
         
         # Item "Divide (/)" untuk operasi pembagian
-        menu_arithmetic.add_command(label="Divide (/)", command=self.arithmetic_divide)
+        menu_arithmetic.add_command(label="Divide (/)", command=self.instrument("Divide (/)", self.arithmetic_divide))
         
         # ===== Submenu Boolean =====
         # Membuat submenu "Boolean" untuk operasi boolean
@@ -200,16 +1689,23 @@ class ImageProcessingApp:
         menu_basic.add_cascade(label="Boolean", menu=menu_boolean)
         
         # Item operasi NOT (inversi)
-        menu_boolean.add_command(label="NOT", command=self.boolean_not)
+        menu_boolean.add_command(label="NOT", command=self.instrument("NOT", self.boolean_not))
         
         # Item operasi AND (irisan)
-        menu_boolean.add_command(label="AND", command=self.boolean_and)
+        menu_boolean.add_command(label="AND", command=self.instrument("AND", self.boolean_and))
         
         # Item operasi OR (gabungan)
-        menu_boolean.add_command(label="OR", command=self.boolean_or)
+        menu_boolean.add_command(label="OR", command=self.instrument("OR", self.boolean_or))
         
         # Item operasi XOR (exclusive or)
-        menu_boolean.add_command(label="XOR", command=self.boolean_xor)
+        menu_boolean.add_command(label="XOR", command=self.instrument("XOR", self.boolean_xor))
+        menu_boolean.add_separator()
+        
+        # Batch: satu mask diterapkan ke banyak gambar sekaligus
+        menu_boolean.add_command(label="Batch with Mask...", command=self.instrument("Batch with Mask...", self.boolean_batch))
+        
+        # Combine: gabungkan gambar original dengan N gambar dalam satu reduction pass
+        menu_boolean.add_command(label="Combine N Images...", command=self.instrument("Combine N Images...", self.boolean_combine))
         
         # ===== Submenu Geometrics =====
         # Membuat submenu "Geometrics" untuk transformasi geometris
@@ -217,28 +1713,31 @@ class ImageProcessingApp:
         menu_basic.add_cascade(label="Geometrics", menu=menu_geometrics)
         
         # Translation: menggeser gambar secara horizontal/vertikal
-        menu_geometrics.add_command(label="Translation", command=self.geometric_translation)
+        menu_geometrics.add_command(label="Translation", command=self.instrument("Translation", self.geometric_translation))
         
         # Rotation: memutar gambar
-        menu_geometrics.add_command(label="Rotation", command=self.geometric_rotation)
+        menu_geometrics.add_command(label="Rotation", command=self.instrument("Rotation", self.geometric_rotation))
         
         # Zooming: memperbesar/memperkecil gambar
-        menu_geometrics.add_command(label="Zooming", command=self.geometric_zooming)
+        menu_geometrics.add_command(label="Zooming", command=self.instrument("Zooming", self.geometric_zooming))
         
         # Flipping: membalik gambar (horizontal/vertikal)
-        menu_geometrics.add_command(label="Flipping", command=self.geometric_flipping)
+        menu_geometrics.add_command(label="Flipping", command=self.instrument("Flipping", self.geometric_flipping))
         
         # Cropping: memotong bagian gambar
-        menu_geometrics.add_command(label="Cropping", command=self.geometric_cropping)
+        menu_geometrics.add_command(label="Cropping", command=self.instrument("Cropping", self.geometric_cropping))
         
         # Thresholding: mengubah gambar jadi hitam-putih berdasarkan nilai threshold
-        menu_basic.add_command(label="Thresholding", command=self.thresholding)
+        menu_basic.add_command(label="Thresholding", command=self.instrument("Thresholding", self.thresholding))
         
         # Convolution: operasi konvolusi dengan kernel
-        menu_basic.add_command(label="Convolution", command=self.convolution)
+        menu_basic.add_command(label="Convolution", command=self.instrument("Convolution", self.convolution))
         
         # Fourier Transform: transformasi ke domain frekuensi
-        menu_basic.add_command(label="Fourier Transform", command=self.fourier_transform)
+        menu_basic.add_command(label="Fourier Transform", command=self.instrument("Fourier Transform", self.fourier_transform))
+        
+        # Spectrum Viewer: log-magnitude & phase, radius frekuensi di bawah mouse, export .npy
+        menu_basic.add_command(label="Spectrum Viewer...", command=self.instrument("Spectrum Viewer", self.show_spectrum))
         
         # ===== Submenu Colouring =====
         # Membuat submenu "Colouring" untuk konversi color space
@@ -246,28 +1745,34 @@ class ImageProcessingApp:
         menu_basic.add_cascade(label="Colouring", menu=menu_colouring)
         
         # Binary: konversi ke gambar hitam-putih
-        menu_colouring.add_command(label="Binary", command=self.color_binary)
+        menu_colouring.add_command(label="Binary", command=self.instrument("Binary", self.color_binary))
         
         # Grayscale: konversi ke skala abu-abu
-        menu_colouring.add_command(label="Grayscale", command=self.color_grayscale)
+        menu_colouring.add_command(label="Grayscale", command=self.instrument("Grayscale", self.color_grayscale))
         
         # RGB: konversi ke color space RGB (Red Green Blue)
-        menu_colouring.add_command(label="RGB", command=self.color_rgb)
+        menu_colouring.add_command(label="RGB", command=self.instrument("RGB", self.color_rgb))
         
         # HSV: konversi ke color space HSV (Hue Saturation Value)
-        menu_colouring.add_command(label="HSV", command=self.color_hsv)
+        menu_colouring.add_command(label="HSV", command=self.instrument("HSV", self.color_hsv))
         
         # CMY: konversi ke color space CMY (Cyan Magenta Yellow)
-        menu_colouring.add_command(label="CMY", command=self.color_cmy)
+        menu_colouring.add_command(label="CMY", command=self.instrument("CMY", self.color_cmy))
         
         # YUV: konversi ke color space YUV (luminance chrominance)
-        menu_colouring.add_command(label="YUV", command=self.color_yuv)
+        menu_colouring.add_command(label="YUV", command=self.instrument("YUV", self.color_yuv))
         
         # YIQ: konversi ke color space YIQ (digunakan di TV analog)
-        menu_colouring.add_command(label="YIQ", command=self.color_yiq)
+        menu_colouring.add_command(label="YIQ", command=self.instrument("YIQ", self.color_yiq))
+        
+        # Lab: konversi ke color space CIE Lab (lightness + 2 chrominance)
+        menu_colouring.add_command(label="Lab", command=self.instrument("Lab", self.color_lab))
+        
+        # Channel View: menampilkan 3 channel color space berdampingan
+        menu_colouring.add_command(label="Channel View...", command=self.instrument("Channel View", self.color_channel_view))
         
         # Pseudo: konversi ke pseudocolor (colormap)
-        menu_colouring.add_command(label="Pseudo", command=self.color_pseudo)
+        menu_colouring.add_command(label="Pseudo", command=self.instrument("Pseudo", self.color_pseudo))
         
         # ===== MENU ENHANCEMENT =====
         # Membuat menu "Enhancement" untuk peningkatan kualitas gambar
@@ -275,13 +1780,16 @@ class ImageProcessingApp:
         menubar.add_cascade(label="Enhancement", menu=menu_enhancement)
         
         # Brightness: mengatur kecerahan gambar
-        menu_enhancement.add_command(label="Brightness", command=self.enhance_brightness)
+        menu_enhancement.add_command(label="Brightness", command=self.instrument("Brightness", self.enhance_brightness))
         
         # Contrast: mengatur kontras gambar
-        menu_enhancement.add_command(label="Contrast", command=self.enhance_contrast)
+        menu_enhancement.add_command(label="Contrast", command=self.instrument("Contrast", self.enhance_contrast))
         
         # Histogram Equalization: menyeimbangkan histogram untuk meningkatkan kontras
-        menu_enhancement.add_command(label="Hist. Equalization", command=self.histogram_equalization)
+        menu_enhancement.add_command(label="Hist. Equalization", command=self.instrument("Hist. Equalization", self.histogram_equalization))
+        
+        # Histogram: jendela histogram per channel (original dan hasil/preview)
+        menu_enhancement.add_command(label="Show Histogram", command=self.instrument("Show Histogram", self.show_histogram))
         
         # ===== Submenu Smoothing =====
         # Membuat submenu "Smoothing" untuk menghaluskan gambar (mengurangi noise)
@@ -293,20 +1801,30 @@ class ImageProcessingApp:
         menu_smoothing.add_cascade(label="Spatial Domain", menu=menu_smoothing_spatial)
         
         # Lowpass Filtering: melewatkan frekuensi rendah (blur)
-        menu_smoothing_spatial.add_command(label="Lowpass Filtering", command=self.smoothing_lowpass)
+        menu_smoothing_spatial.add_command(label="Lowpass Filtering", command=self.instrument("Lowpass Filtering", self.smoothing_lowpass))
         
         # Median Filtering: filter median untuk menghilangkan salt-pepper noise
-        menu_smoothing_spatial.add_command(label="Median Filtering", command=self.smoothing_median)
+        menu_smoothing_spatial.add_command(label="Median Filtering", command=self.instrument("Median Filtering", self.smoothing_median))
+        
+        # Gaussian: blur Gaussian dengan slider sigma
+        menu_smoothing_spatial.add_command(label="Gaussian Blur", command=self.instrument("Gaussian Blur", self.smoothing_gaussian))
+        
+        # Bilateral & Guided: smoothing yang mempertahankan tepi (edge-preserving)
+        menu_smoothing_spatial.add_command(label="Bilateral Filter", command=self.instrument("Bilateral Filter", self.smoothing_bilateral))
+        menu_smoothing_spatial.add_command(label="Guided Filter", command=self.instrument("Guided Filter", self.smoothing_guided))
         
         # Sub-submenu Frequency Domain untuk filtering di domain frekuensi
         menu_smoothing_freq = Menu(menu_smoothing, tearoff=0)
         menu_smoothing.add_cascade(label="Frequency Domain", menu=menu_smoothing_freq)
         
         # ILPF: Ideal Lowpass Filter (filter frekuensi rendah ideal)
-        menu_smoothing_freq.add_command(label="ILPF", command=self.smoothing_ilpf)
+        menu_smoothing_freq.add_command(label="ILPF", command=self.instrument("ILPF", self.smoothing_ilpf))
         
         # BLPF: Butterworth Lowpass Filter (filter frekuensi rendah Butterworth)
-        menu_smoothing_freq.add_command(label="BLPF", command=self.smoothing_blpf)
+        menu_smoothing_freq.add_command(label="BLPF", command=self.instrument("BLPF", self.smoothing_blpf))
+        
+        # GLPF: Gaussian Lowpass Filter
+        menu_smoothing_freq.add_command(label="GLPF", command=self.instrument("GLPF", self.smoothing_glpf))
         
         # ===== Submenu Sharpening =====
         # Membuat submenu "Sharpening" untuk mempertajam gambar (meningkatkan edge)
@@ -318,23 +1836,40 @@ class ImageProcessingApp:
         menu_sharpening.add_cascade(label="Spatial Domain", menu=menu_sharpening_spatial)
         
         # Highpass Filtering: melewatkan frekuensi tinggi (sharpen)
-        menu_sharpening_spatial.add_command(label="Highpass Filtering", command=self.sharpening_highpass)
+        menu_sharpening_spatial.add_command(label="Highpass Filtering", command=self.instrument("Highpass Filtering", self.sharpening_highpass))
         
         # Highboost Filtering: amplifikasi frekuensi tinggi
-        menu_sharpening_spatial.add_command(label="Highboost Filtering", command=self.sharpening_highboost)
+        menu_sharpening_spatial.add_command(label="Highboost Filtering", command=self.instrument("Highboost Filtering", self.sharpening_highboost))
+        
+        # Unsharp Mask: sharpening dengan radius, amount, dan threshold
+        menu_sharpening_spatial.add_command(label="Unsharp Mask", command=self.instrument("Unsharp Mask", self.sharpening_unsharp))
         
         # Sub-submenu Frequency Domain untuk sharpening di domain frekuensi
         menu_sharpening_freq = Menu(menu_sharpening, tearoff=0)
         menu_sharpening.add_cascade(label="Frequency Domain", menu=menu_sharpening_freq)
         
         # IHPF: Ideal Highpass Filter
-        menu_sharpening_freq.add_command(label="IHPF", command=self.sharpening_ihpf)
+        menu_sharpening_freq.add_command(label="IHPF", command=self.instrument("IHPF", self.sharpening_ihpf))
         
         # BHPF: Butterworth Highpass Filter
-        menu_sharpening_freq.add_command(label="BHPF", command=self.sharpening_bhpf)
+        menu_sharpening_freq.add_command(label="BHPF", command=self.instrument("BHPF", self.sharpening_bhpf))
+        
+        # GHPF: Gaussian Highpass Filter
+        menu_sharpening_freq.add_command(label="GHPF", command=self.instrument("GHPF", self.sharpening_ghpf))
+        
+        # Frequency Filter: semua filter frekuensi (lowpass, highpass, band, notch)
+        menu_enhancement.add_command(label="Frequency Filter...", command=self.instrument("Frequency Filter", self.frequency_filter_custom))
         
-        # Geometrics Correction: koreksi geometris
-        menu_enhancement.add_command(label="Geometrics Correction", command=self.geometric_correction)
+        # ===== Submenu Geometrics Correction =====
+        # Submenu untuk koreksi geometris (perspektif dan distorsi lensa)
+        menu_correction = Menu(menu_enhancement, tearoff=0)
+        menu_enhancement.add_cascade(label="Geometrics Correction", menu=menu_correction)
+        
+        # Perspective: koreksi perspektif / keystone dari 4 titik sudut
+        menu_correction.add_command(label="Perspective (4 Points)...", command=self.instrument("Perspective Correction", self.geometric_correction))
+        
+        # Lens Distortion: koreksi distorsi lensa (k1, k2, p1, p2)
+        menu_correction.add_command(label="Lens Distortion...", command=self.instrument("Lens Distortion", self.geometric_lens_correction))
         
         # ===== MENU NOISE =====
         # Membuat menu "Noise" untuk menambahkan berbagai jenis noise ke gambar
@@ -342,22 +1877,22 @@ class ImageProcessingApp:
         menubar.add_cascade(label="Noise", menu=menu_noise)
         
         # Gaussian Noise: noise dengan distribusi normal/Gaussian
-        menu_noise.add_command(label="Gaussian Noise", command=self.noise_gaussian)
+        menu_noise.add_command(label="Gaussian Noise", command=self.instrument("Gaussian Noise", self.noise_gaussian))
         
         # Rayleigh Noise: noise dengan distribusi Rayleigh
-        menu_noise.add_command(label="Rayleigh Noise", command=self.noise_rayleigh)
+        menu_noise.add_command(label="Rayleigh Noise", command=self.instrument("Rayleigh Noise", self.noise_rayleigh))
         
         # Erlang (Gamma) Noise: noise dengan distribusi gamma
-        menu_noise.add_command(label="Erlang (Gamma) Noise", command=self.noise_erlang)
+        menu_noise.add_command(label="Erlang (Gamma) Noise", command=self.instrument("Erlang (Gamma) Noise", self.noise_erlang))
         
         # Exponential Noise: noise dengan distribusi eksponensial
-        menu_noise.add_command(label="Exponential Noise", command=self.noise_exponential)
+        menu_noise.add_command(label="Exponential Noise", command=self.instrument("Exponential Noise", self.noise_exponential))
         
         # Uniform Noise: noise dengan distribusi uniform (rata)
-        menu_noise.add_command(label="Uniform Noise", command=self.noise_uniform)
+        menu_noise.add_command(label="Uniform Noise", command=self.instrument("Uniform Noise", self.noise_uniform))
         
         # Impulse Noise: salt and pepper noise (titik hitam-putih acak)
-        menu_noise.add_command(label="Impulse Noise", command=self.noise_impulse)
+        menu_noise.add_command(label="Impulse Noise", command=self.instrument("Impulse Noise", self.noise_impulse))
         
         # ===== MENU EDGE DETECTION =====
         # Membuat menu "Edge Detection" untuk mendeteksi tepi/edge dalam gambar
@@ -370,13 +1905,16 @@ class ImageProcessingApp:
         menu_edge.add_cascade(label="1st Differential Gradient", menu=menu_1st_diff)
         
         # Sobel: operator Sobel untuk deteksi edge
-        menu_1st_diff.add_command(label="Sobel", command=self.edge_sobel)
+        menu_1st_diff.add_command(label="Sobel", command=self.instrument("Sobel", self.edge_sobel))
         
         # Prewitt: operator Prewitt (mirip Sobel, kernel berbeda)
-        menu_1st_diff.add_command(label="Prewitt", command=self.edge_prewitt)
+        menu_1st_diff.add_command(label="Prewitt", command=self.instrument("Prewitt", self.edge_prewitt))
         
         # Robert: operator Robert (kernel 2x2)
-        menu_1st_diff.add_command(label="Robert", command=self.edge_robert)
+        menu_1st_diff.add_command(label="Robert", command=self.instrument("Robert", self.edge_robert))
+        
+        # Gradient: pilihan operator, magnitude L1/L2, dan orientasi
+        menu_1st_diff.add_command(label="Gradient...", command=self.instrument("Gradient", self.edge_gradient_options))
         
         # ===== Submenu 2nd Differential Gradient =====
         # Submenu untuk metode deteksi edge menggunakan turunan kedua
@@ -384,16 +1922,38 @@ class ImageProcessingApp:
         menu_edge.add_cascade(label="2nd Differential Gradient", menu=menu_2nd_diff)
         
         # Laplacian: operator Laplacian
-        menu_2nd_diff.add_command(label="Laplacian", command=self.edge_laplacian)
+        menu_2nd_diff.add_command(label="Laplacian", command=self.instrument("Laplacian", self.edge_laplacian))
         
         # LoG: Laplacian of Gaussian (Gaussian blur + Laplacian)
-        menu_2nd_diff.add_command(label="Laplacian of Gaussian (LoG)", command=self.edge_log)
+        menu_2nd_diff.add_command(label="Laplacian of Gaussian (LoG)", command=self.instrument("Laplacian of Gaussian (LoG)", self.edge_log))
+        
+        # Scale Space: LoG/DoG/zero crossing dari Gaussian stack
+        menu_2nd_diff.add_command(label="Scale Space (LoG/DoG)...", command=self.instrument("Scale Space (LoG/DoG)", self.edge_scale_space))
         
         # Canny: algoritma Canny (deteksi edge multi-stage)
-        menu_2nd_diff.add_command(label="Canny", command=self.edge_canny)
+        menu_2nd_diff.add_command(label="Canny", command=self.instrument("Canny", self.edge_canny))
         
         # Compass: deteksi edge dengan operator Kirsch (8 arah)
-        menu_edge.add_command(label="Compass", command=self.edge_compass)
+        menu_edge.add_command(label="Compass", command=self.instrument("Compass", self.edge_compass))
+        
+        # ===== MENU MORPHOLOGY =====
+        # Membuat menu "Morphology" untuk operasi morfologi (erosi, dilasi, dst.)
+        menu_morphology = Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Morphology", menu=menu_morphology)
+        
+        # Erosion & Dilation: operasi dasar morfologi
+        menu_morphology.add_command(label="Erosion", command=self.instrument("Erosion", self.morphology_erosion))
+        menu_morphology.add_command(label="Dilation", command=self.instrument("Dilation", self.morphology_dilation))
+        
+        # Opening & Closing: kombinasi erosi dan dilasi
+        menu_morphology.add_command(label="Opening", command=self.instrument("Opening", self.morphology_opening))
+        menu_morphology.add_command(label="Closing", command=self.instrument("Closing", self.morphology_closing))
+        menu_morphology.add_separator()
+        
+        # Gradient, Top-hat, Black-hat: selisih hasil morfologi dengan gambar
+        menu_morphology.add_command(label="Gradient", command=self.instrument("Morphological Gradient", self.morphology_gradient))
+        menu_morphology.add_command(label="Top-hat", command=self.instrument("Top-hat", self.morphology_tophat))
+        menu_morphology.add_command(label="Black-hat", command=self.instrument("Black-hat", self.morphology_blackhat))
         
         # ===== MENU SEGMENTATION =====
         # Membuat menu "Segmentation" untuk memisahkan objek dari background
@@ -401,10 +1961,35 @@ class ImageProcessingApp:
         menubar.add_cascade(label="Segmentation", menu=menu_segmentation)
         
         # Region Growing: segmentasi berdasarkan pertumbuhan region dari seed point
-        menu_segmentation.add_command(label="Region Growing", command=self.segmentation_region_growing)
+        menu_segmentation.add_command(label="Region Growing", command=self.instrument("Region Growing", self.segmentation_region_growing))
         
         # Watershed: segmentasi dengan algoritma watershed (seperti aliran air)
-        menu_segmentation.add_command(label="Watershed", command=self.segmentation_watershed)
+        menu_segmentation.add_command(label="Watershed", command=self.instrument("Watershed", self.segmentation_watershed))
+        
+        # Label Regions: connected component labeling + tabel statistik region
+        menu_segmentation.add_separator()
+        menu_segmentation.add_command(label="Label Regions...", command=self.instrument("Label Regions", self.segmentation_label_regions))
+        
+        # Batch Label Regions: labeling semua gambar dalam satu folder
+        menu_segmentation.add_command(label="Batch Label Regions...", command=self.instrument("Batch Label Regions", self.segmentation_label_batch))
+        
+        # ===== MENU TOOLS =====
+        # Membuat menu "Tools" untuk instrumentasi performa
+        menu_tools = Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Tools", menu=menu_tools)
+        
+        # Checkbutton untuk mengaktifkan pengukuran memori puncak (tracemalloc)
+        menu_tools.add_checkbutton(label="Track Peak Memory", variable=self.track_memory)
+        
+        # Checkbutton untuk mem-profile operasi berikutnya (otomatis mati setelah dipakai)
+        menu_tools.add_checkbutton(label="Profile Next Operation", variable=self.profile_next)
+        menu_tools.add_separator()
+        
+        # Export log timing ke file JSON/CSV untuk sesi profiling
+        menu_tools.add_command(label="Export Timing Log...", command=self.export_perf_log)
+        
+        # Hapus semua record di log timing
+        menu_tools.add_command(label="Clear Timing Log", command=self.clear_perf_log)
         
         # ===== MENU ABOUT =====
         # Membuat menu "About" untuk informasi aplikasi dan tim
@@ -473,6 +2058,9 @@ class ImageProcessingApp:
         value_label = Label(dialog, text=f"Value: {default_val}", font=("Arial", 10))
         value_label.pack(pady=5)
         
+        # Bungkus callback preview agar setiap preview dicatat di log timing
+        preview = self.instrument(f"{title} (preview)", callback) if callback else None
+        
         # Inner function (fungsi di dalam fungsi)
         # Dipanggil setiap kali slider bergerak
         def on_slider_change(val):
@@ -481,9 +2069,9 @@ class ImageProcessingApp:
             value_label.config(text=f"Value: {float(val):.2f}")
             
             # Cek apakah callback function ada (not None)
-            if callback:
+            if preview:
                 # Panggil callback function dengan nilai slider untuk preview real-time
-                callback(float(val))
+                preview(float(val))
         
         # Membuat widget slider (Scale)
         # from_: nilai minimum (pakai underscore karena "from" adalah keyword Python)
@@ -548,11 +2136,241 @@ class ImageProcessingApp:
         
         # Wait for dialog to close (menunggu hingga dialog ditutup)
         # Eksekusi program akan berhenti di sini sampai dialog ditutup
-        dialog.wait_window()
+        # Waktu menunggu user dicatat sebagai idle (tidak masuk timing operasi)
+        with self.perf_phase("idle"):
+            dialog.wait_window()
         
         # Mengembalikan dictionary result yang berisi nilai dan status konfirmasi
         return result
     
+    # ========== PARAMETER DIALOG ==========
+    # Method untuk membuat dialog dengan beberapa parameter sekaligus
+    # (slider, pilihan, dan checkbox) dengan preview real-time
+    # Parameters:
+    # - title: judul window dialog
+    # - params: list spesifikasi parameter (tuple), jenis yang didukung:
+    #   ("slider", key, label, min, max, default, resolution)
+    #   ("choice", key, label, options, default)
+    #   ("check", key, label, default)
+    # - callback: fungsi preview, dipanggil dengan dictionary {key: nilai}
+    #   setiap kali salah satu parameter berubah
+    # Return: {'value': {key: nilai} atau None, 'confirmed': True/False}
+    def create_params_dialog(self, title, params, callback=None):
+        """Membuat dialog dengan beberapa parameter, OK, dan Reset button"""
+        
+        dialog = Toplevel(self.root)
+        dialog.title(title)
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        # Variabel Tkinter untuk setiap parameter
+        variables = {}
+        
+        # Dictionary hasil (sama seperti create_slider_dialog)
+        result = {'value': None, 'confirmed': False}
+        
+        # Bungkus callback preview agar setiap preview dicatat di log timing
+        preview = self.instrument(f"{title} (preview)", callback) if callback else None
+        
+        # Ambil semua nilai parameter saat ini
+        def current_values():
+            values = {}
+            for param in params:
+                value = variables[param[1]].get()
+                
+                # Slider dengan resolution bulat dikembalikan sebagai int
+                if param[0] == "slider" and float(param[6]).is_integer():
+                    value = int(value)
+                values[param[1]] = value
+            return values
+        
+        # Dipanggil setiap kali salah satu parameter berubah
+        def on_change(*args):
+            if preview:
+                preview(current_values())
+        
+        # Satu baris per parameter: label di kiri, widget di kanan
+        form = tk.Frame(dialog)
+        form.pack(padx=15, pady=10)
+        
+        for row, param in enumerate(params):
+            kind, key, label_text = param[:3]
+            Label(form, text=label_text, font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
+            
+            if kind == "slider":
+                min_val, max_val, default_val, resolution = param[3:7]
+                variables[key] = tk.DoubleVar(value=default_val)
+                Scale(form, from_=min_val, to=max_val, orient=tk.HORIZONTAL, resolution=resolution,
+                      length=250, variable=variables[key], command=on_change).grid(row=row, column=1, padx=5)
+            elif kind == "choice":
+                options, default_val = param[3:5]
+                variables[key] = tk.StringVar(value=default_val)
+                tk.OptionMenu(form, variables[key], *options, command=on_change).grid(row=row, column=1, sticky=tk.W, padx=5)
+            else:
+                variables[key] = tk.BooleanVar(value=param[3])
+                tk.Checkbutton(form, variable=variables[key], command=on_change).grid(row=row, column=1, sticky=tk.W, padx=5)
+        
+        # Frame untuk tombol OK dan Reset
+        btn_frame = tk.Frame(dialog)
+        btn_frame.pack(pady=15)
+        
+        def on_ok():
+            result['value'] = current_values()
+            result['confirmed'] = True
+            dialog.destroy()
+        
+        def on_reset():
+            result['value'] = None
+            result['confirmed'] = False
+            dialog.destroy()
+        
+        Button(btn_frame, text="OK", command=on_ok, width=10, bg="green", fg="white").pack(side=tk.LEFT, padx=10)
+        Button(btn_frame, text="Reset", command=on_reset, width=10, bg="red", fg="white").pack(side=tk.LEFT, padx=10)
+        
+        # Tunggu dialog ditutup (dicatat sebagai idle)
+        with self.perf_phase("idle"):
+            dialog.wait_window()
+        
+        return result
+    
+    # ========== OPTION DIALOG ==========
+    # Method untuk membuat dialog pilihan dengan satu tombol per opsi
+    # (seperti dialog Flipping)
+    # Parameters:
+    # - title: judul window dialog
+    # - label_text: teks instruksi
+    # - options: list teks opsi
+    # Return: opsi yang dipilih, atau None jika dialog ditutup
+    def choose_option_dialog(self, title, label_text, options):
+        """Membuat dialog dengan satu tombol untuk setiap opsi"""
+        
+        dialog = Toplevel(self.root)
+        dialog.title(title)
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        # Label instruksi
+        Label(dialog, text=label_text, font=("Arial", 10, "bold")).pack(padx=20, pady=15)
+        
+        # Dictionary untuk menyimpan pilihan user
+        result = {'value': None}
+        
+        # Frame untuk tombol
+        btn_frame = tk.Frame(dialog)
+        btn_frame.pack(padx=10, pady=10)
+        
+        # Satu tombol per opsi
+        # option=option: "membekukan" nilai option untuk setiap lambda
+        for option in options:
+            def on_select(option=option):
+                result['value'] = option
+                dialog.destroy()
+            Button(btn_frame, text=option, command=on_select, width=10, bg="blue", fg="white").pack(side=tk.LEFT, padx=5)
+        
+        # Tunggu dialog ditutup (dicatat sebagai idle)
+        with self.perf_phase("idle"):
+            dialog.wait_window()
+        
+        return result['value']
+    
+    # ========== BACKGROUND WORKER ==========
+    # Method untuk menjalankan komputasi final di worker thread
+    # Selama komputasi berjalan, dialog progress ditampilkan dan window utama
+    # tetap repaint (tidak "Not Responding")
+    # Parameters:
+    # - title: judul dialog progress
+    # - compute: fungsi compute(progress) yang mengembalikan hasil (PIL Image)
+    #   progress(fraction): laporkan progress 0.0-1.0, melempar OperationCancelled
+    #   jika user menekan Cancel
+    # Return: hasil compute, atau None jika di-cancel / terjadi error
+    def run_in_background(self, title, compute):
+        """Menjalankan compute(progress) di worker thread dengan progress bar dan Cancel"""
+        
+        # State yang dibagi antara worker thread dan thread utama (Tkinter)
+        # Worker hanya menulis state ini, tidak pernah menyentuh widget Tkinter
+        state = {'progress': 0.0, 'result': None, 'error': None, 'done': False}
+        cancel_event = threading.Event()
+        
+        # Callback progress untuk compute (dipanggil dari worker thread)
+        def progress(fraction):
+            if cancel_event.is_set():
+                raise OperationCancelled()
+            state['progress'] = fraction
+        
+        # Fungsi yang dijalankan worker thread
+        # Jika profiler aktif (Profile Next Operation), worker ikut di-profile
+        profiler = self._active_profiler
+        def worker():
+            try:
+                if profiler is not None:
+                    state['result'] = profiler.profile_thread(compute, progress)
+                else:
+                    state['result'] = compute(progress)
+            except OperationCancelled:
+                pass
+            except Exception as e:
+                state['error'] = e
+            finally:
+                state['done'] = True
+        
+        # Dialog progress (modal agar user tidak menjalankan operasi lain)
+        dialog = Toplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("350x130")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        status_label = Label(dialog, text=f"Processing {title}...", font=("Arial", 10, "bold"))
+        status_label.pack(pady=10)
+        
+        # Progressbar mode determinate: 0-100%
+        progress_bar = ttk.Progressbar(dialog, orient=tk.HORIZONTAL, length=300, mode="determinate", maximum=100)
+        progress_bar.pack(pady=5)
+        
+        # Tombol Cancel: set flag, worker berhenti di checkpoint progress berikutnya
+        # Dialog tetap terbuka sampai worker benar-benar berhenti
+        def on_cancel():
+            cancel_event.set()
+            status_label.config(text="Cancelling...")
+            btn_cancel.config(state=tk.DISABLED)
+        
+        btn_cancel = Button(dialog, text="Cancel", command=on_cancel, width=10, bg="red", fg="white")
+        btn_cancel.pack(pady=10)
+        
+        # Tombol close window diperlakukan sama dengan Cancel
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+        
+        # Polling state worker setiap 50 ms dari thread utama
+        # after(): menjadwalkan fungsi di event loop Tkinter
+        def poll():
+            if state['done']:
+                dialog.destroy()
+                return
+            progress_bar['value'] = state['progress'] * 100
+            dialog.after(50, poll)
+        
+        # daemon=True: thread tidak menahan aplikasi saat ditutup
+        threading.Thread(target=worker, daemon=True).start()
+        poll()
+        
+        # Tunggu sampai worker selesai (event loop tetap berjalan, window tetap repaint)
+        dialog.wait_window()
+        
+        # Error dari worker ditampilkan di thread utama
+        if state['error'] is not None:
+            with self.perf_phase("idle"):
+                messagebox.showerror("Error", f"{title} failed: {state['error']}")
+            return None
+        
+        # Hasil dibuang jika user menekan Cancel
+        if cancel_event.is_set():
+            return None
+        
+        return state['result']
+    
     # ========== IMPLEMENTASI FUNGSI FILE ==========
     # Method untuk membuka file gambar
     def open_image(self):
@@ -561,10 +2379,11 @@ class ImageProcessingApp:
         # Menampilkan dialog pemilihan file
         # title: judul dialog
         # filetypes: filter tipe file yang bisa dipilih
-        file_path = filedialog.askopenfilename(
-            title="Pilih Gambar",
-            filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
-        )
+        with self.perf_phase("idle"):
+            file_path = filedialog.askopenfilename(
+                title="Pilih Gambar",
+                filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
+            )
         
         # Cek apakah user memilih file (tidak cancel)
         if file_path:
@@ -572,7 +2391,11 @@ class ImageProcessingApp:
             self.image_path = file_path
             
             # Buka gambar menggunakan PIL dan simpan ke original_image
-            self.original_image = Image.open(file_path)
+            # Image.open() bersifat lazy, load() memaksa decode sekarang
+            # agar waktu decode tercatat sebagai fase "convert"
+            with self.perf_phase("convert"):
+                self.original_image = Image.open(file_path)
+                self.original_image.load()
             
             # Copy gambar original ke processed_image
             self.processed_image = self.original_image.copy()
@@ -584,143 +2407,665 @@ class ImageProcessingApp:
     def save_image(self):
         """Menyimpan gambar yang telah diproses"""
         
-        # Cek apakah ada gambar processed
-        if self.processed_image:
+        # Cek apakah ada gambar processed (gambar biasa atau mask biner)
+        if self.processed_image or self.processed_mask is not None:
             # Cek apakah ada path file (sudah pernah dibuka)
             if self.image_path:
                 # Simpan gambar ke path yang sama
-                self.processed_image.save(self.image_path)
+                self.get_processed_image().save(self.image_path)
                 
                 # Tampilkan pesan sukses
-                messagebox.showinfo("Success", "Image saved successfully!")
+                with self.perf_phase("idle"):
+                    messagebox.showinfo("Success", "Image saved successfully!")
             else:
                 # Jika belum ada path, panggil save_as
                 self.save_as_image()
         else:
             # Jika tidak ada gambar, tampilkan warning
-            messagebox.showwarning("Warning", "No processed image to save!")
+            with self.perf_phase("idle"):
+                messagebox.showwarning("Warning", "No processed image to save!")
     
     # Method untuk menyimpan gambar dengan nama baru
     def save_as_image(self):
         """Menyimpan gambar dengan nama baru"""
         
-        # Cek apakah ada gambar processed
-        if self.processed_image:
+        # Cek apakah ada gambar processed (gambar biasa atau mask biner)
+        if self.processed_image or self.processed_mask is not None:
             # Menampilkan dialog save file
             # defaultextension: ekstensi default jika user tidak mengetik ekstensi
             # filetypes: pilihan format file
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".png",
-                filetypes=[("PNG", "*.png"), ("JPEG", "*.jpg"), ("BMP", "*.bmp"), ("All Files", "*.*")]
-            )
+            with self.perf_phase("idle"):
+                file_path = filedialog.asksaveasfilename(
+                    defaultextension=".png",
+                    filetypes=[("PNG", "*.png"), ("JPEG", "*.jpg"), ("BMP", "*.bmp"), ("All Files", "*.*")]
+                )
             
             # Cek apakah user memilih lokasi (tidak cancel)
             if file_path:
                 # Simpan gambar ke path yang dipilih
-                self.processed_image.save(file_path)
+                self.get_processed_image().save(file_path)
                 
                 # Tampilkan pesan sukses
-                messagebox.showinfo("Success", "Image saved successfully!")
+                with self.perf_phase("idle"):
+                    messagebox.showinfo("Success", "Image saved successfully!")
         else:
             # Jika tidak ada gambar, tampilkan warning
-            messagebox.showwarning("Warning", "No processed image to save!")
+            with self.perf_phase("idle"):
+                messagebox.showwarning("Warning", "No processed image to save!")
     
     # Method untuk keluar dari aplikasi
     def exit_app(self):
         """Keluar dari aplikasi"""
         
-        # Tampilkan dialog konfirmasi
-        # askokcancel: mengembalikan True jika OK, False jika Cancel
-        if messagebox.askokcancel("Exit", "Do you want to exit?"):
-            # Tutup window dan keluar aplikasi
-            self.root.destroy()
+        # Tampilkan dialog konfirmasi
+        # askokcancel: mengembalikan True jika OK, False jika Cancel
+        if messagebox.askokcancel("Exit", "Do you want to exit?"):
+            # Tutup window dan keluar aplikasi
+            self.root.destroy()
+    
+    # Method untuk menampilkan gambar di canvas
+    def display_images(self):
+        """Menampilkan gambar di canvas"""
+        
+        # Seluruh proses resize dan render dicatat sebagai fase "display"
+        with self.perf_phase("display"):
+            # Cek apakah ada gambar original
+            if self.original_image:
+                # Resize gambar agar fit di canvas (540x640)
+                orig_resized = self.resize_for_canvas(self.original_image, 540, 640)
+                
+                # Konversi gambar PIL ke format Tkinter PhotoImage
+                orig_photo = ImageTk.PhotoImage(orig_resized)
+                
+                # Tampilkan gambar di canvas original pada koordinat (275, 325) - tengah canvas
+                self.canvas_original.create_image(275, 325, image=orig_photo)
+                
+                # Simpan referensi gambar agar tidak di-garbage collect
+                # Tkinter memerlukan referensi gambar tetap hidup
+                self.canvas_original.image = orig_photo
+            
+            # Ambil gambar processed (mask biner di-unpack sementara untuk display)
+            processed = self.get_processed_image()
+            
+            # Cek apakah ada gambar processed
+            if processed:
+                # Resize gambar processed
+                proc_resized = self.resize_for_canvas(processed, 540, 640)
+                
+                # Konversi ke PhotoImage
+                proc_photo = ImageTk.PhotoImage(proc_resized)
+                
+                # Tampilkan di canvas processed
+                self.canvas_processed.create_image(275, 325, image=proc_photo)
+                
+                # Simpan referensi
+                self.canvas_processed.image = proc_photo
+        
+        # Perbarui jendela histogram (jika terbuka)
+        self.update_histogram_view()
+    
+    # Method untuk menampilkan gambar temporary (preview)
+    def display_temp_image(self):
+        """Menampilkan gambar temporary untuk preview"""
+        
+        # Seluruh proses resize dan render dicatat sebagai fase "display"
+        with self.perf_phase("display"):
+            # Cek apakah ada temp_image
+            if self.temp_image:
+                # Resize temp image
+                proc_resized = self.resize_for_canvas(self.temp_image, 540, 640)
+                
+                # Konversi ke PhotoImage
+                proc_photo = ImageTk.PhotoImage(proc_resized)
+                
+                # Tampilkan di canvas processed (menimpa gambar sebelumnya)
+                self.canvas_processed.create_image(275, 325, image=proc_photo)
+                
+                # Simpan referensi
+                self.canvas_processed.image = proc_photo
+        
+        # Perbarui histogram preview (jika jendela histogram terbuka)
+        self.update_histogram_view(preview=True)
+    
+    # Method untuk posisi gambar yang ditampilkan di canvas (lihat display_images)
+    # Gambar di-resize dengan resize_for_canvas(540, 640) lalu diletakkan
+    # dengan titik tengah di (275, 325)
+    # Return: (left, top, scale_x, scale_y), koordinat canvas = left + x * scale_x
+    def canvas_geometry(self, image):
+        """Posisi kiri atas dan skala gambar di canvas"""
+        img_width, img_height = image.size
+        ratio = min(540/img_width, 640/img_height)
+        new_width, new_height = int(img_width*ratio), int(img_height*ratio)
+        return 275 - new_width // 2, 325 - new_height // 2, new_width / img_width, new_height / img_height
+    
+    # Method untuk mengubah koordinat klik di canvas original ke koordinat pixel
+    # gambar original (di-clip ke dalam gambar)
+    def canvas_to_image(self, x, y):
+        """Koordinat (x, y) gambar original dari koordinat canvas"""
+        left, top, scale_x, scale_y = self.canvas_geometry(self.original_image)
+        img_width, img_height = self.original_image.size
+        return (min(max((x - left) / scale_x, 0), img_width - 1),
+                min(max((y - top) / scale_y, 0), img_height - 1))
+    
+    # Method untuk resize gambar agar fit di canvas
+    # max_width: lebar maksimum canvas
+    # max_height: tinggi maksimum canvas
+    def resize_for_canvas(self, image, max_width, max_height):
+        """Resize gambar agar fit di canvas"""
+        
+        # Ambil ukuran gambar original
+        img_width, img_height = image.size
+        
+        # Hitung rasio resize (pilih yang terkecil agar gambar fit)
+        # min(): memilih rasio terkecil agar gambar tidak keluar canvas
+        ratio = min(max_width/img_width, max_height/img_height)
+        
+        # Hitung ukuran baru berdasarkan rasio
+        # int(): konversi ke integer karena ukuran harus bilangan bulat
+        new_size = (int(img_width*ratio), int(img_height*ratio))
+        
+        # Resize gambar dengan algoritma LANCZOS (kualitas tinggi)
+        # Image.Resampling.LANCZOS: algoritma interpolasi berkualitas tinggi
+        return image.resize(new_size, Image.Resampling.LANCZOS)
+    
+    # Method untuk mengecek apakah gambar sudah dimuat
+    def check_image_loaded(self):
+        """Cek apakah gambar sudah dimuat"""
+        
+        # Cek apakah original_image masih None (belum ada gambar)
+        if self.original_image is None:
+            # Tampilkan warning jika belum ada gambar
+            with self.perf_phase("idle"):
+                messagebox.showwarning("Warning", "Please load an image first!")
+            
+            # Kembalikan False (gambar belum dimuat)
+            return False
+        
+        # Kembalikan True (gambar sudah dimuat)
+        return True
+    
+    # ========== HASIL PEMROSESAN ==========
+    # Property processed_image: mengisi gambar hasil biasa otomatis membuang
+    # hasil biner (processed_mask) agar hanya ada satu hasil
+    @property
+    def processed_image(self):
+        return self._processed_image
+    
+    @processed_image.setter
+    def processed_image(self, image):
+        self._processed_image = image
+        self.processed_mask = None
+    
+    # Method untuk menyimpan hasil biner dalam bentuk bit-packed
+    def set_processed_mask(self, mask):
+        """Menyimpan hasil biner sebagai BinaryMask"""
+        self._processed_image = None
+        self.processed_mask = mask
+    
+    # Method untuk mendapatkan hasil sebagai PIL Image
+    # Hasil biner di-unpack sementara (hanya untuk display/save), data tetap bit-packed
+    def get_processed_image(self):
+        """Hasil pemrosesan sebagai PIL Image (unpack mask jika perlu)"""
+        if self.processed_mask is not None:
+            return self.processed_mask.to_image()
+        return self._processed_image
+    
+    # Method untuk mendapatkan BinaryMask dari gambar original
+    # Hanya berisi mask jika gambar original biner (0/255), selain itu None
+    # Hasil di-cache per gambar agar pengecekan dan packing hanya dilakukan sekali
+    def original_binary_mask(self):
+        """BinaryMask gambar original (None jika bukan gambar biner)"""
+        image, mask = self._original_mask
+        
+        if image is not self.original_image:
+            img_gray = self.load_array("L")
+            mask = BinaryMask.from_array(img_gray) if is_binary_array(img_gray) else None
+            self._original_mask = (self.original_image, mask)
+        
+        return mask
+    
+    # ========== INSTRUMENTASI PERFORMA ==========
+    # Method untuk membungkus menu command / preview callback dengan pengukuran
+    # Setiap pemanggilan menghasilkan satu record di self.perf_log berisi:
+    # - convert: waktu decode/konversi PIL -> numpy
+    # - display: waktu resize dan render ke canvas
+    # - compute: sisa waktu (total - convert - display)
+    # - peak_bytes: memori puncak yang dialokasikan selama operasi
+    # Waktu menunggu input user (dialog) dicatat sebagai idle dan tidak dihitung
+    def instrument(self, name, func):
+        """Membungkus func agar waktu dan memori setiap pemanggilan dicatat"""
+        
+        def wrapper(*args, **kwargs):
+            # Record untuk pemanggilan ini
+            record = {'name': name, 'convert': 0.0, 'display': 0.0, 'idle': 0.0, 'peak': 0}
+            
+            # Mulai tracemalloc jika belum aktif
+            # Jika sudah aktif (record bersarang, misal preview di dalam dialog),
+            # simpan peak record luar dulu lalu reset peak untuk record ini
+            measure_memory = self.track_memory.get()
+            started_tracing = False
+            if measure_memory:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    started_tracing = True
+                else:
+                    self._save_outer_peak()
+                    tracemalloc.reset_peak()
+                record['base'] = tracemalloc.get_traced_memory()[0]
+            
+            # Profiling hanya untuk menu command terluar (preview di dalamnya ikut
+            # ter-profile karena berjalan di dalam event loop dialog)
+            profiler = None
+            if self.profile_next.get() and not self._perf_stack:
+                self.profile_next.set(False)
+                profiler = OperationProfiler()
+                profiler.start()
+                self._active_profiler = profiler
+            
+            self._perf_stack.append(record)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._perf_stack.pop()
+                
+                if profiler is not None:
+                    profiler.stop()
+                    self._active_profiler = None
+                
+                if measure_memory and tracemalloc.is_tracing():
+                    # Peak relatif terhadap memori saat operasi dimulai
+                    peak = tracemalloc.get_traced_memory()[1] - record['base']
+                    record['peak'] = max(record['peak'], peak)
+                    if started_tracing:
+                        tracemalloc.stop()
+                    else:
+                        # Record luar melanjutkan pengukuran dari titik ini
+                        tracemalloc.reset_peak()
+                
+                self._finish_perf_record(record, elapsed)
+                
+                if profiler is not None:
+                    self.save_profile(name, profiler)
+        
+        return wrapper
+    
+    # Method untuk menyimpan peak record luar sebelum peak di-reset oleh record bersarang
+    def _save_outer_peak(self):
+        if self._perf_stack and 'base' in self._perf_stack[-1]:
+            outer = self._perf_stack[-1]
+            outer['peak'] = max(outer['peak'], tracemalloc.get_traced_memory()[1] - outer['base'])
+    
+    # Method untuk menyelesaikan record dan menambahkannya ke log
+    def _finish_perf_record(self, record, elapsed):
+        # Waktu aktif = total - waktu menunggu user
+        total = max(elapsed - record['idle'], 0.0)
+        compute = max(total - record['convert'] - record['display'], 0.0)
+        
+        entry = {
+            'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'operation': record['name'],
+            'image_size': list(self.original_image.size) if self.original_image else None,
+            'total_s': total,
+            'convert_s': record['convert'],
+            'compute_s': compute,
+            'display_s': record['display'],
+            'peak_bytes': record['peak'] if 'base' in record else None,
+        }
+        self.perf_log.append(entry)
+        
+        # Tampilkan timing operasi terakhir di status bar
+        text = (f"{entry['operation']}: {total * 1000:.1f} ms  "
+                f"(convert {entry['convert_s'] * 1000:.1f} ms | "
+                f"compute {compute * 1000:.1f} ms | "
+                f"display {entry['display_s'] * 1000:.1f} ms)")
+        if entry['peak_bytes'] is not None:
+            text += f"  peak {entry['peak_bytes'] / 2**20:.1f} MiB"
+        self.status_bar.config(text=text)
+    
+    # Context manager untuk mengukur satu fase dari operasi yang sedang berjalan
+    # phase: "convert", "display", atau "idle" (menunggu input user)
+    # Contoh: with self.perf_phase("display"): ...
+    @contextmanager
+    def perf_phase(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # Waktu fase ditambahkan ke record operasi paling dalam yang aktif
+            if self._perf_stack:
+                self._perf_stack[-1][phase] += time.perf_counter() - start
+    
+    # Method untuk konversi original_image ke numpy array
+    # Waktu konversi dicatat sebagai fase "convert"
+    # - mode: mode PIL tujuan ("L", "RGB"), None = mode asli
+    # - dtype: tipe data numpy, None = tipe asli (biasanya uint8)
+    # - proxy: True untuk memakai gambar proxy (untuk preview)
+    def load_array(self, mode=None, dtype=None, proxy=False):
+        """Konversi original_image ke numpy array (array baru setiap pemanggilan)"""
+        with self.perf_phase("convert"):
+            image = self.get_proxy_image() if proxy else self.original_image
+            image = image.convert(mode) if mode else image
+            return np.array(image, dtype=dtype)
+    
+    # Method untuk memilih mode kerja filter dari mode gambar original
+    # Grayscale ("1", "L", "LA", "I", "I;16", "F") -> "L", lainnya (RGB, RGBA, P, ...) -> "RGB"
+    # Filter cv2 hanya menerima 1 atau 3 channel uint8, sehingga alpha dibuang
+    def filter_mode(self):
+        """Mode PIL ("L" atau "RGB") untuk load_array sebelum filtering"""
+        return "L" if self.original_image.mode in ("1", "L", "LA", "I", "I;16", "F") else "RGB"
+    
+    # Method untuk mendapatkan gambar proxy (versi kecil gambar original)
+    # Dibuat sekali per gambar original, lalu dipakai ulang oleh setiap preview
+    def get_proxy_image(self):
+        """Gambar original yang diperkecil hingga sisi terpanjang <= PROXY_MAX_SIZE"""
+        image, proxy = self._proxy_image
+        
+        if image is not self.original_image:
+            # Faktor pengecilan bulat, BOX: rata-rata blok pixel (cepat, tanpa aliasing)
+            # Mode "1" dan "P" otomatis memakai NEAREST oleh PIL
+            factor = -(-max(self.original_image.size) // PROXY_MAX_SIZE)
+            if factor > 1:
+                width, height = self.original_image.size
+                proxy = self.original_image.resize((max(1, width // factor), max(1, height // factor)),
+                                                   Image.Resampling.BOX)
+            else:
+                proxy = self.original_image
+            self._proxy_image = (self.original_image, proxy)
+        
+        return proxy
+    
+    # Method untuk mendapatkan spektrum (rfft2) gambar original
+    # FFT maju dihitung sekali per gambar + mode + resolusi, lalu dipakai ulang
+    # oleh setiap filter frekuensi (mengganti cutoff/orde/keluarga tanpa FFT ulang)
+    def get_spectrum(self, mode="L", proxy=False):
+        """Spektrum rfft2 complex64 dari gambar original (dengan cache)"""
+        image, cache = self._spectrum_cache
+        
+        # Gambar original berganti: buang semua spektrum lama
+        if image is not self.original_image:
+            cache = {}
+            self._spectrum_cache = (self.original_image, cache)
+        
+        key = (mode, proxy)
+        if key not in cache:
+            img_array = self.load_array(mode, np.float32, proxy=proxy)
+            
+            # axes=(0, 1): gambar berwarna di-transform per channel sekaligus
+            spectrum = rfft2(img_array, axes=(0, 1), workers=-1)
+            cache[key] = (spectrum, img_array.shape[:2])
+        
+        return cache[key]
+    
+    # Method untuk mendapatkan grid frekuensi (jarak dari DC) ukuran tertentu
+    # Disimpan di cache spektrum yang sama (ukuran gambar tetap selama gambar sama)
+    def get_frequency_grid(self, shape):
+        """Grid frekuensi untuk spektrum rfft2 ukuran shape (dengan cache)"""
+        _, cache = self._spectrum_cache
+        
+        key = ("grid", shape)
+        if key not in cache:
+            cache[key] = frequency_grid(shape)
+        
+        return cache[key]
+    
+    # Method untuk mendapatkan map remap (fixed-point) dengan cache LRU
+    # Map hanya bergantung pada parameter koreksi dan ukuran gambar, sehingga
+    # koreksi yang sama untuk banyak gambar (preview ulang, batch folder
+    # dengan ukuran sama) cukup dihitung sekali
+    # - key: tuple parameter koreksi (termasuk ukuran)
+    # - compute: fungsi tanpa argumen yang mengembalikan (map1, map2)
+    def get_remap_maps(self, key, compute):
+        """Map cv2.remap dari cache, dihitung dengan compute() jika belum ada"""
+        maps = self._remap_cache.get(key)
+        if maps is not None:
+            self._remap_cache.move_to_end(key)
+            return maps
+        
+        maps = compute()
+        self._remap_cache[key] = maps
+        
+        # Buang entry paling lama jika cache penuh
+        while len(self._remap_cache) > REMAP_CACHE_SIZE:
+            self._remap_cache.popitem(last=False)
+        
+        return maps
+    
+    # Method untuk koreksi perspektif array gambar dengan 4 titik sudut
+    # - corners: float32 (4, 2) TL, TR, BR, BL dalam koordinat img_array
+    def perspective_correct(self, img_array, corners):
+        """Warp perspektif lewat cv2.remap dengan map dari cache"""
+        key = ("perspective", corners.tobytes())
+        maps = self.get_remap_maps(key, lambda: perspective_maps(corners, rectified_size(corners)))
+        return cv2.remap(img_array, *maps, cv2.INTER_LINEAR)
+    
+    # Method untuk koreksi distorsi lensa array gambar
+    # - coefficients: tuple (k1, k2, p1, p2)
+    def lens_correct(self, img_array, coefficients):
+        """Undistort lewat cv2.remap dengan map dari cache"""
+        size = (img_array.shape[1], img_array.shape[0])
+        key = ("lens", size, coefficients)
+        maps = self.get_remap_maps(key, lambda: undistort_maps(size, coefficients))
+        return cv2.remap(img_array, *maps, cv2.INTER_LINEAR)
+    
+    # Method untuk export log timing ke file JSON atau CSV
+    def export_perf_log(self):
+        """Export log timing ke file JSON/CSV"""
+        
+        if not self.perf_log:
+            messagebox.showwarning("Warning", "Timing log is empty!")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("CSV", "*.csv"), ("All Files", "*.*")]
+        )
+        if not file_path:
+            return
+        
+        entries = list(self.perf_log)
+        if file_path.lower().endswith(".csv"):
+            # CSV: satu baris per record, kolom sesuai key record
+            with open(file_path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(entries[0].keys()))
+                writer.writeheader()
+                writer.writerows(entries)
+        else:
+            with open(file_path, "w") as f:
+                json.dump(entries, f, indent=2)
+        
+        messagebox.showinfo("Success", f"Exported {len(entries)} timing records!")
+    
+    # Method untuk menyimpan hasil profiling dan menampilkan ringkasannya
+    def save_profile(self, name, profiler):
+        """Menyimpan .pstats/.collapsed dan menampilkan fungsi paling lambat"""
+        
+        # Nama file: <timestamp>_<nama operasi> (karakter non-alfanumerik diganti "_")
+        safe_name = "".join(c if c.isalnum() else "_" for c in name).strip("_")
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base_path = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d_%H%M%S')}_{safe_name}")
+        pstats_path, collapsed_path = profiler.save(base_path)
+        
+        # Dialog ringkasan dengan Text widget (bisa di-scroll dan di-copy)
+        dialog = Toplevel(self.root)
+        dialog.title(f"Profile: {name}")
+        dialog.geometry("900x500")
+        dialog.transient(self.root)
+        
+        Label(dialog, text=f"Saved: {os.path.abspath(pstats_path)}\n{os.path.abspath(collapsed_path)}",
+              font=("Arial", 9), justify=tk.LEFT).pack(anchor=tk.W, padx=10, pady=5)
+        
+        # Scrollbar vertikal untuk Text
+        text_frame = tk.Frame(dialog)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        scrollbar = tk.Scrollbar(text_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # wrap=tk.NONE: baris panjang tidak dipotong (kolom pstats tetap rapi)
+        text = tk.Text(text_frame, font=("Courier", 9), wrap=tk.NONE, yscrollcommand=scrollbar.set)
+        text.insert(tk.END, profiler.summary())
+        text.config(state=tk.DISABLED)
+        text.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=text.yview)
+        
+        Button(dialog, text="Close", command=dialog.destroy, width=10).pack(pady=5)
     
-    # Method untuk menampilkan gambar di canvas
-    def display_images(self):
-        """Menampilkan gambar di canvas"""
-        
-        # Cek apakah ada gambar original
-        if self.original_image:
-            # Resize gambar agar fit di canvas (540x640)
-            orig_resized = self.resize_for_canvas(self.original_image, 540, 640)
-            
-            # Konversi gambar PIL ke format Tkinter PhotoImage
-            orig_photo = ImageTk.PhotoImage(orig_resized)
-            
-            # Tampilkan gambar di canvas original pada koordinat (275, 325) - tengah canvas
-            self.canvas_original.create_image(275, 325, image=orig_photo)
+    # Method untuk menghapus semua record di log timing
+    def clear_perf_log(self):
+        self.perf_log.clear()
+        self.status_bar.config(text="Timing log cleared")
+    
+    # ========== HISTOGRAM ==========
+    # Method untuk mendapatkan histogram gambar (dengan cache per gambar)
+    # - source: PIL Image atau BinaryMask
+    # - mode: mode konversi PIL sebelum histogram dihitung (None = mode gambar)
+    # - cache: False untuk gambar sementara (temp_image preview): histogram dihitung
+    #   tanpa disimpan, agar cache tidak menahan gambar preview ukuran penuh
+    # Gambar PIL tidak pernah diubah in-place di aplikasi ini (setiap operasi membuat
+    # gambar baru), jadi objek gambar yang sama berarti isi pixel yang sama
+    def get_histogram(self, source, mode=None, cache=True):
+        """HistogramStats dari gambar atau mask (dengan cache)"""
+        
+        key = (id(source), mode)
+        entry = self._hist_cache.get(key) if cache else None
+        
+        # Objek disimpan di entry cache, jadi id tidak bisa dipakai ulang objek lain
+        if entry is not None and entry[0] is source:
+            self._hist_cache.move_to_end(key)
+            return entry[1]
+        
+        if isinstance(source, BinaryMask):
+            stats = HistogramStats.from_mask(source)
+        else:
+            image = source.convert(mode) if mode else source
             
-            # Simpan referensi gambar agar tidak di-garbage collect
-            # Tkinter memerlukan referensi gambar tetap hidup
-            self.canvas_original.image = orig_photo
+            # Mode lain (palette, 16-bit, dll) dikonversi ke L/RGB dulu
+            if image.mode not in ("L", "RGB"):
+                image = image.convert("L" if image.mode in ("1", "I", "I;16", "F") else "RGB")
+            stats = HistogramStats.from_array(np.asarray(image))
         
-        # Cek apakah ada gambar processed
-        if self.processed_image:
-            # Resize gambar processed
-            proc_resized = self.resize_for_canvas(self.processed_image, 540, 640)
-            
-            # Konversi ke PhotoImage
-            proc_photo = ImageTk.PhotoImage(proc_resized)
-            
-            # Tampilkan di canvas processed
-            self.canvas_processed.create_image(275, 325, image=proc_photo)
-            
-            # Simpan referensi
-            self.canvas_processed.image = proc_photo
-    
-    # Method untuk menampilkan gambar temporary (preview)
-    def display_temp_image(self):
-        """Menampilkan gambar temporary untuk preview"""
+        if not cache:
+            return stats
         
-        # Cek apakah ada temp_image
-        if self.temp_image:
-            # Resize temp image
-            proc_resized = self.resize_for_canvas(self.temp_image, 540, 640)
-            
-            # Konversi ke PhotoImage
-            proc_photo = ImageTk.PhotoImage(proc_resized)
-            
-            # Tampilkan di canvas processed (menimpa gambar sebelumnya)
-            self.canvas_processed.create_image(275, 325, image=proc_photo)
-            
-            # Simpan referensi
-            self.canvas_processed.image = proc_photo
+        self._hist_cache[key] = (source, stats)
+        
+        # Buang entry paling lama jika cache penuh
+        while len(self._hist_cache) > HIST_CACHE_SIZE:
+            self._hist_cache.popitem(last=False)
+        
+        return stats
     
-    # Method untuk resize gambar agar fit di canvas
-    # max_width: lebar maksimum canvas
-    # max_height: tinggi maksimum canvas
-    def resize_for_canvas(self, image, max_width, max_height):
-        """Resize gambar agar fit di canvas"""
+    # Method untuk operasi titik (point operation) lewat lookup table (LUT)
+    # formula hanya dihitung untuk 256 nilai pixel, lalu cv2.LUT memetakan setiap pixel
+    # Histogram preview diturunkan dari histogram original lewat LUT yang sama
+    # (O(256), tanpa scan ulang pixel)
+    # - formula: fungsi x (array float32) -> array uint8, dihitung per elemen
+    # - mode: mode konversi gambar original (None = mode gambar)
+    # - proxy: True untuk preview (LUT diterapkan ke gambar proxy; histogram
+    #   tetap diturunkan dari histogram gambar penuh)
+    def apply_point_lut(self, formula, mode=None, proxy=False):
+        """Menerapkan point operation ke gambar original lewat LUT"""
+        
+        img_array = self.load_array(mode, proxy=proxy)
+        
+        # Gambar bukan 8-bit (mis. 16-bit): formula dihitung langsung per pixel
+        if img_array.dtype != np.uint8:
+            return formula(img_array.astype(np.float32))
+        
+        # Lookup table: hasil formula untuk setiap nilai 0-255
+        lut = formula(np.arange(256, dtype=np.float32))
+        
+        # Histogram hasil hanya dihitung jika jendela histogram terbuka
+        if self.histogram_window is not None and (mode or self.original_image.mode) in ("L", "RGB"):
+            self.temp_histogram = self.get_histogram(self.original_image, mode).apply_lut(lut)
+        
+        # cv2.LUT(): result[i] = lut[img_array[i]] untuk semua channel
+        return cv2.LUT(img_array, lut)
+    
+    # Method untuk menampilkan jendela histogram
+    # Jendela menampilkan histogram gambar original dan hasil (atau preview),
+    # diperbarui otomatis setiap kali gambar ditampilkan
+    def show_histogram(self):
+        """Menampilkan histogram per channel gambar original dan hasil"""
+        if not self.check_image_loaded(): return
         
-        # Ambil ukuran gambar original
-        img_width, img_height = image.size
+        # Jendela sudah terbuka: cukup bawa ke depan
+        if self.histogram_window is not None:
+            self.histogram_window.lift()
+            return
         
-        # Hitung rasio resize (pilih yang terkecil agar gambar fit)
-        # min(): memilih rasio terkecil agar gambar tidak keluar canvas
-        ratio = min(max_width/img_width, max_height/img_height)
+        window = Toplevel(self.root)
+        window.title("Histogram")
+        window.resizable(False, False)
         
-        # Hitung ukuran baru berdasarkan rasio
-        # int(): konversi ke integer karena ukuran harus bilangan bulat
-        new_size = (int(img_width*ratio), int(img_height*ratio))
+        # Canvas untuk 2 plot (original di atas, hasil di bawah)
+        self.histogram_canvas = tk.Canvas(window, width=HIST_PLOT_WIDTH + 20,
+                                          height=2 * (HIST_PLOT_HEIGHT + 70), bg="white")
+        self.histogram_canvas.pack(padx=5, pady=5)
         
-        # Resize gambar dengan algoritma LANCZOS (kualitas tinggi)
-        # Image.Resampling.LANCZOS: algoritma interpolasi berkualitas tinggi
-        return image.resize(new_size, Image.Resampling.LANCZOS)
+        # Saat jendela ditutup, hentikan update histogram
+        def on_close():
+            self.histogram_window = None
+            window.destroy()
+        
+        window.protocol("WM_DELETE_WINDOW", on_close)
+        self.histogram_window = window
+        
+        self.update_histogram_view()
     
-    # Method untuk mengecek apakah gambar sudah dimuat
-    def check_image_loaded(self):
-        """Cek apakah gambar sudah dimuat"""
+    # Method untuk menggambar ulang histogram di jendela histogram
+    # - preview: True jika dipanggil dari preview slider (pakai temp_image)
+    def update_histogram_view(self, preview=False):
+        """Menggambar histogram original dan hasil/preview"""
         
-        # Cek apakah original_image masih None (belum ada gambar)
-        if self.original_image is None:
-            # Tampilkan warning jika belum ada gambar
-            messagebox.showwarning("Warning", "Please load an image first!")
-            
-            # Kembalikan False (gambar belum dimuat)
-            return False
+        # LUT histogram dari preview hanya berlaku untuk satu kali tampil
+        temp_histogram, self.temp_histogram = self.temp_histogram, None
         
-        # Kembalikan True (gambar sudah dimuat)
-        return True
+        if self.histogram_window is None or self.original_image is None:
+            return
+        
+        # Histogram hasil: dari LUT preview, temp_image (tidak di-cache, setiap
+        # tick slider membuat temp_image baru), atau hasil akhir
+        if preview:
+            processed = temp_histogram or (self.get_histogram(self.temp_image, cache=False) if self.temp_image else None)
+            title = "Preview"
+        elif self.processed_mask is not None:
+            processed = self.get_histogram(self.processed_mask)
+            title = "Processed"
+        else:
+            processed = self.get_histogram(self.processed_image) if self.processed_image else None
+            title = "Processed"
+        
+        canvas = self.histogram_canvas
+        canvas.delete("all")
+        
+        plots = [("Original", self.get_histogram(self.original_image)), (title, processed)]
+        for row, (name, stats) in enumerate(plots):
+            # Posisi kiri-atas plot
+            x0 = 10
+            y0 = 10 + row * (HIST_PLOT_HEIGHT + 70)
+            
+            canvas.create_text(x0, y0, text=name, anchor=tk.NW, font=("Arial", 10, "bold"))
+            canvas.create_rectangle(x0, y0 + 20, x0 + HIST_PLOT_WIDTH, y0 + 20 + HIST_PLOT_HEIGHT, outline="gray")
+            
+            if stats is None:
+                continue
+            
+            # Tinggi bar dinormalisasi terhadap bin tertinggi di semua channel
+            peak = max(int(stats.counts.max()), 1)
+            xs = x0 + np.arange(256) * HIST_PLOT_WIDTH / 255
+            colors = HIST_CHANNEL_COLORS[len(stats.counts)]
+            
+            for counts, color in zip(stats.counts, colors):
+                ys = y0 + 20 + HIST_PLOT_HEIGHT * (1 - counts / peak)
+                
+                # Satu polyline per channel: (x0, y0, x1, y1, ...)
+                canvas.create_line(*np.column_stack([xs, ys]).ravel().tolist(), fill=color)
+            
+            # Statistik per channel di bawah plot
+            canvas.create_text(x0, y0 + 25 + HIST_PLOT_HEIGHT, text=stats.summary(),
+                               anchor=tk.NW, font=("Courier", 8))
     
     # ========== BASIC OPS FUNCTIONS ==========
     # Method untuk membuat gambar negatif dengan slider
@@ -730,30 +3075,31 @@ class ImageProcessingApp:
         # Cek apakah gambar sudah dimuat, jika belum return (keluar dari fungsi)
         if not self.check_image_loaded(): return
         
-        # Inner function untuk preview negative saat slider bergerak
-        # val: nilai slider (0-100)
-        def preview_negative(val):
-            # Hitung strength (kekuatan efek) dari 0.0 sampai 1.0
-            strength = val / 100.0
-            
-            # Konversi gambar PIL ke numpy array dengan tipe float32
-            # convert("RGB"): pastikan gambar dalam format RGB
-            # dtype=np.float32: tipe data float untuk operasi matematika
-            img_array = np.array(self.original_image.convert("RGB"), dtype=np.float32)
-            
+        # Rumus negative untuk nilai pixel x (float32)
+        # Dihitung hanya untuk 256 nilai, lalu dipetakan ke semua pixel (apply_point_lut)
+        def negative_formula(x, strength):
             # Hitung inversi (negative): 255 - nilai pixel
-            inverted = 255 - img_array
+            inverted = 255 - x
             
             # Interpolasi linear antara gambar original dan inverted
             # result = original + strength * (inverted - original)
             # strength=0: hasil = original
             # strength=1: hasil = inverted
-            result = img_array + strength * (inverted - img_array)
+            result = x + strength * (inverted - x)
             
             # Clip nilai ke range 0-255 dan konversi ke uint8
             # np.clip(): membatasi nilai dalam range tertentu
             # astype(np.uint8): konversi ke tipe data unsigned 8-bit integer
-            result = np.clip(result, 0, 255).astype(np.uint8)
+            return np.clip(result, 0, 255).astype(np.uint8)
+        
+        # Inner function untuk preview negative saat slider bergerak
+        # val: nilai slider (0-100)
+        def preview_negative(val):
+            # Hitung strength (kekuatan efek) dari 0.0 sampai 1.0
+            strength = val / 100.0
+            
+            # Terapkan rumus ke gambar RGB lewat lookup table
+            result = self.apply_point_lut(lambda x: negative_formula(x, strength), "RGB")
             
             # Konversi numpy array kembali ke gambar PIL
             self.temp_image = Image.fromarray(result)
@@ -771,17 +3117,8 @@ class ImageProcessingApp:
             # Hitung strength dari nilai slider
             strength = result['value'] / 100.0
             
-            # Konversi gambar ke numpy array
-            img_array = np.array(self.original_image.convert("RGB"), dtype=np.float32)
-            
-            # Hitung inversi
-            inverted = 255 - img_array
-            
-            # Interpolasi linear
-            final_result = img_array + strength * (inverted - img_array)
-            
-            # Clip dan konversi tipe data
-            final_result = np.clip(final_result, 0, 255).astype(np.uint8)
+            # Terapkan rumus negative ke gambar RGB
+            final_result = self.apply_point_lut(lambda x: negative_formula(x, strength), "RGB")
             
             # Simpan hasil ke processed_image
             self.processed_image = Image.fromarray(final_result)
@@ -800,12 +3137,9 @@ class ImageProcessingApp:
         
         # Inner function untuk preview
         def preview_add(val):
-            # Konversi gambar ke numpy array float32
-            img_array = np.array(self.original_image, dtype=np.float32)
-            
-            # Operasi penambahan: setiap pixel + val
+            # Operasi penambahan: setiap pixel + val (lewat lookup table)
             # np.clip(): batasi hasil dalam range 0-255
-            result = np.clip(img_array + val, 0, 255).astype(np.uint8)
+            result = self.apply_point_lut(lambda x: np.clip(x + val, 0, 255).astype(np.uint8))
             
             # Simpan ke temp_image dan tampilkan
             self.temp_image = Image.fromarray(result)
@@ -817,8 +3151,7 @@ class ImageProcessingApp:
         # Jika OK diklik
         if result['confirmed'] and result['value'] is not None:
             # Lakukan operasi penambahan final
-            img_array = np.array(self.original_image, dtype=np.float32)
-            final_result = np.clip(img_array + result['value'], 0, 255).astype(np.uint8)
+            final_result = self.apply_point_lut(lambda x: np.clip(x + result['value'], 0, 255).astype(np.uint8))
             self.processed_image = Image.fromarray(final_result)
         else:
             # Jika Cancel/Reset, kembalikan ke original
@@ -833,11 +3166,8 @@ class ImageProcessingApp:
         
         # Inner function untuk preview
         def preview_subtract(val):
-            # Konversi ke numpy array
-            img_array = np.array(self.original_image, dtype=np.float32)
-            
-            # Operasi pengurangan: setiap pixel - val
-            result = np.clip(img_array - val, 0, 255).astype(np.uint8)
+            # Operasi pengurangan: setiap pixel - val (lewat lookup table)
+            result = self.apply_point_lut(lambda x: np.clip(x - val, 0, 255).astype(np.uint8))
             
             # Tampilkan preview
             self.temp_image = Image.fromarray(result)
@@ -848,8 +3178,7 @@ class ImageProcessingApp:
         
         # Jika OK diklik
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image, dtype=np.float32)
-            final_result = np.clip(img_array - result['value'], 0, 255).astype(np.uint8)
+            final_result = self.apply_point_lut(lambda x: np.clip(x - result['value'], 0, 255).astype(np.uint8))
             self.processed_image = Image.fromarray(final_result)
         else:
             self.processed_image = self.original_image.copy()
@@ -862,11 +3191,8 @@ class ImageProcessingApp:
         
         # Inner function untuk preview
         def preview_multiply(val):
-            # Konversi ke numpy array
-            img_array = np.array(self.original_image, dtype=np.float32)
-            
-            # Operasi perkalian: setiap pixel * val
-            result = np.clip(img_array * val, 0, 255).astype(np.uint8)
+            # Operasi perkalian: setiap pixel * val (lewat lookup table)
+            result = self.apply_point_lut(lambda x: np.clip(x * val, 0, 255).astype(np.uint8))
             
             # Tampilkan preview
             self.temp_image = Image.fromarray(result)
@@ -877,8 +3203,7 @@ class ImageProcessingApp:
         
         # Jika OK diklik
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image, dtype=np.float32)
-            final_result = np.clip(img_array * result['value'], 0, 255).astype(np.uint8)
+            final_result = self.apply_point_lut(lambda x: np.clip(x * result['value'], 0, 255).astype(np.uint8))
             self.processed_image = Image.fromarray(final_result)
         else:
             self.processed_image = self.original_image.copy()
@@ -891,11 +3216,8 @@ class ImageProcessingApp:
         
         # Inner function untuk preview
         def preview_divide(val):
-            # Konversi ke numpy array
-            img_array = np.array(self.original_image, dtype=np.float32)
-            
-            # Operasi pembagian: setiap pixel / val
-            result = np.clip(img_array / val, 0, 255).astype(np.uint8)
+            # Operasi pembagian: setiap pixel / val (lewat lookup table)
+            result = self.apply_point_lut(lambda x: np.clip(x / val, 0, 255).astype(np.uint8))
             
             # Tampilkan preview
             self.temp_image = Image.fromarray(result)
@@ -906,8 +3228,7 @@ class ImageProcessingApp:
         
         # Jika OK diklik
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image, dtype=np.float32)
-            final_result = np.clip(img_array / result['value'], 0, 255).astype(np.uint8)
+            final_result = self.apply_point_lut(lambda x: np.clip(x / result['value'], 0, 255).astype(np.uint8))
             self.processed_image = Image.fromarray(final_result)
         else:
             self.processed_image = self.original_image.copy()
@@ -919,21 +3240,23 @@ class ImageProcessingApp:
     def boolean_not(self):
         if not self.check_image_loaded(): return
         
+        # Rumus NOT dengan strength untuk nilai pixel x (dipakai lewat lookup table)
+        def not_formula(x, strength):
+            # Inversi (NOT operation)
+            inverted = 255 - x
+            
+            # Interpolasi berdasarkan strength
+            result = x + strength * (inverted - x)
+            return np.clip(result, 0, 255).astype(np.uint8)
+        
         # Inner function untuk preview
         def preview_not(val):
             # Hitung strength dari slider
             strength = val / 100.0
             
-            # Konversi ke grayscale dulu
-            # convert("L"): convert ke grayscale (L = Luminance)
-            img_array = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            # Inversi (NOT operation)
-            inverted = 255 - img_array
-            
-            # Interpolasi berdasarkan strength
-            result = img_array + strength * (inverted - img_array)
-            result = np.clip(result, 0, 255).astype(np.uint8)
+            # Konversi ke grayscale dulu, lalu terapkan rumus NOT
+            # "L": convert ke grayscale (L = Luminance)
+            result = self.apply_point_lut(lambda x: not_formula(x, strength), "L")
             
             # Tampilkan preview
             self.temp_image = Image.fromarray(result)
@@ -945,10 +3268,7 @@ class ImageProcessingApp:
         # Jika OK diklik
         if result['confirmed'] and result['value'] is not None:
             strength = result['value'] / 100.0
-            img_array = np.array(self.original_image.convert("L"), dtype=np.float32)
-            inverted = 255 - img_array
-            final_result = img_array + strength * (inverted - img_array)
-            final_result = np.clip(final_result, 0, 255).astype(np.uint8)
+            final_result = self.apply_point_lut(lambda x: not_formula(x, strength), "L")
             self.processed_image = Image.fromarray(final_result)
         else:
             self.processed_image = self.original_image.copy()
@@ -960,29 +3280,23 @@ class ImageProcessingApp:
         if not self.check_image_loaded(): return
         
         # Minta user memilih gambar kedua
-        file_path = filedialog.askopenfilename(
-            title="Pilih Gambar Kedua untuk Operasi AND",
-            filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
-        )
+        with self.perf_phase("idle"):
+            file_path = filedialog.askopenfilename(
+                title="Pilih Gambar Kedua untuk Operasi AND",
+                filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
+            )
         
         # Jika user memilih file
         if file_path:
-            # Buka gambar kedua
-            img2 = Image.open(file_path)
-            
-            # Resize gambar kedua agar sama dengan gambar original
-            img2 = img2.resize(self.original_image.size)
-            
-            # Konversi kedua gambar ke grayscale
-            img1_gray = np.array(self.original_image.convert("L"))
-            img2_gray = np.array(img2.convert("L"))
-            
-            # Operasi bitwise AND
-            # np.bitwise_and(): AND setiap bit pixel
-            result = np.bitwise_and(img1_gray, img2_gray)
-            
-            # Simpan hasil
-            self.processed_image = Image.fromarray(result)
+            # Decode, resize, dan konversi gambar kedua dicatat sebagai fase "convert"
+            # load_mask_operand(): gambar kedua di-resize ke ukuran original dan
+            # dikonversi ke grayscale (atau BinaryMask jika biner), hasilnya di-cache
+            # untuk pemakaian berikutnya
+            with self.perf_phase("convert"):
+                operand = load_mask_operand(file_path, self.original_image.size)
+            
+            # Operasi bitwise AND (langsung pada bit-packed jika kedua gambar biner)
+            self.apply_boolean("AND", operand)
             self.display_images()
     
     # Method untuk operasi Boolean OR
@@ -990,24 +3304,19 @@ class ImageProcessingApp:
         if not self.check_image_loaded(): return
         
         # Minta user memilih gambar kedua
-        file_path = filedialog.askopenfilename(
-            title="Pilih Gambar Kedua untuk Operasi OR",
-            filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
-        )
+        with self.perf_phase("idle"):
+            file_path = filedialog.askopenfilename(
+                title="Pilih Gambar Kedua untuk Operasi OR",
+                filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
+            )
         
         if file_path:
-            # Buka dan resize gambar kedua
-            img2 = Image.open(file_path)
-            img2 = img2.resize(self.original_image.size)
+            # Buka, resize, dan konversi gambar kedua ke grayscale (dengan cache)
+            with self.perf_phase("convert"):
+                operand = load_mask_operand(file_path, self.original_image.size)
             
-            # Konversi ke grayscale
-            img1_gray = np.array(self.original_image.convert("L"))
-            img2_gray = np.array(img2.convert("L"))
-            
-            # Operasi bitwise OR
-            result = np.bitwise_or(img1_gray, img2_gray)
-            
-            self.processed_image = Image.fromarray(result)
+            # Operasi bitwise OR (langsung pada bit-packed jika kedua gambar biner)
+            self.apply_boolean("OR", operand)
             self.display_images()
     
     # Method untuk operasi Boolean XOR
@@ -1015,25 +3324,169 @@ class ImageProcessingApp:
         if not self.check_image_loaded(): return
         
         # Minta user memilih gambar kedua
-        file_path = filedialog.askopenfilename(
-            title="Pilih Gambar Kedua untuk Operasi XOR",
-            filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
-        )
+        with self.perf_phase("idle"):
+            file_path = filedialog.askopenfilename(
+                title="Pilih Gambar Kedua untuk Operasi XOR",
+                filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
+            )
         
         if file_path:
-            # Buka dan resize gambar kedua
-            img2 = Image.open(file_path)
-            img2 = img2.resize(self.original_image.size)
-            
-            # Konversi ke grayscale
-            img1_gray = np.array(self.original_image.convert("L"))
-            img2_gray = np.array(img2.convert("L"))
+            # Buka, resize, dan konversi gambar kedua ke grayscale (dengan cache)
+            with self.perf_phase("convert"):
+                operand = load_mask_operand(file_path, self.original_image.size)
             
-            # Operasi bitwise XOR (Exclusive OR)
-            result = np.bitwise_xor(img1_gray, img2_gray)
+            # Operasi bitwise XOR (Exclusive OR) (langsung pada bit-packed jika kedua gambar biner)
+            self.apply_boolean("XOR", operand)
+            self.display_images()
+    
+    # Method untuk menerapkan operasi boolean antara gambar original dan operand kedua
+    # Jika kedua gambar biner, operasi dijalankan langsung pada bentuk bit-packed
+    # (8 pixel per byte) dan hasilnya tetap disimpan sebagai BinaryMask
+    # - op_name: "AND", "OR", atau "XOR"
+    # - operand: hasil load_mask_operand() (array grayscale atau BinaryMask)
+    def apply_boolean(self, op_name, operand):
+        """Operasi boolean gambar original dengan operand kedua"""
+        op = BOOLEAN_OPS[op_name]
+        original_mask = self.original_binary_mask()
+        
+        if original_mask is not None and isinstance(operand, BinaryMask):
+            self.set_processed_mask(original_mask.combine(operand, op))
+        else:
+            # Konversi gambar original ke grayscale
+            img1_gray = self.load_array("L")
             
+            # out=img1_gray: hasil ditulis langsung ke array pertama (tanpa alokasi baru)
+            result = op(img1_gray, operand_to_gray(operand), out=img1_gray)
             self.processed_image = Image.fromarray(result)
-            self.display_images()
+    
+    # Method untuk operasi boolean batch: satu mask diterapkan ke banyak gambar
+    # Mask hanya di-decode dan di-resize sekali per ukuran gambar (load_mask_operand),
+    # gambar input diproses satu per satu (streaming) sehingga memori tetap kecil
+    def boolean_batch(self):
+        """Batch AND/OR/XOR banyak gambar terhadap satu mask"""
+        
+        # Pilih operasi boolean
+        op_name = self.choose_option_dialog("Batch with Mask", "Select Operation:", list(BOOLEAN_OPS))
+        if op_name is None:
+            return
+        
+        with self.perf_phase("idle"):
+            # Pilih gambar mask (operand kedua)
+            mask_path = filedialog.askopenfilename(
+                title="Pilih Gambar Mask",
+                filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
+            )
+            if not mask_path:
+                return
+            
+            # Pilih banyak gambar input sekaligus
+            # askopenfilenames(): mengembalikan tuple path
+            input_paths = filedialog.askopenfilenames(
+                title="Pilih Gambar yang Akan Diproses",
+                filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
+            )
+            if not input_paths:
+                return
+            
+            # Pilih folder output
+            output_dir = filedialog.askdirectory(title="Pilih Folder Output")
+            if not output_dir:
+                return
+        
+        op = BOOLEAN_OPS[op_name]
+        
+        # Mask biner (bit-packed) di-unpack sekali per ukuran gambar
+        gray_masks = {}
+        
+        # Proses semua gambar di worker thread
+        def compute(progress):
+            for i, path in enumerate(input_paths):
+                progress(i / len(input_paths))
+                
+                # Decode gambar input ke grayscale
+                with Image.open(path) as img:
+                    img_gray = np.array(img.convert("L"))
+                
+                # Mask dengan ukuran yang sama (diambil dari cache jika sudah ada)
+                size = (img_gray.shape[1], img_gray.shape[0])
+                if size not in gray_masks:
+                    gray_masks[size] = operand_to_gray(load_mask_operand(mask_path, size))
+                mask = gray_masks[size]
+                
+                # Operasi boolean in-place
+                op(img_gray, mask, out=img_gray)
+                
+                # Simpan sebagai PNG (lossless) dengan suffix nama operasi
+                name = os.path.splitext(os.path.basename(path))[0]
+                Image.fromarray(img_gray).save(os.path.join(output_dir, f"{name}_{op_name.lower()}.png"))
+            
+            return len(input_paths)
+        
+        count = self.run_in_background(f"Batch {op_name}", compute)
+        
+        if count is not None:
+            with self.perf_phase("idle"):
+                messagebox.showinfo("Success", f"{count} images saved to {output_dir}")
+    
+    # Method untuk menggabungkan gambar original dengan N gambar lain
+    # Reduction pass: hasil diakumulasi in-place di satu array, sehingga hanya
+    # satu gambar input yang ada di memori pada satu waktu
+    def boolean_combine(self):
+        """Combine AND/OR/XOR gambar original dengan N gambar"""
+        if not self.check_image_loaded(): return
+        
+        # Pilih operasi boolean
+        op_name = self.choose_option_dialog("Combine N Images", "Select Operation:", list(BOOLEAN_OPS))
+        if op_name is None:
+            return
+        
+        # Pilih gambar-gambar yang akan digabungkan
+        with self.perf_phase("idle"):
+            paths = filedialog.askopenfilenames(
+                title=f"Pilih Gambar untuk Operasi {op_name}",
+                filetypes=[("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"), ("All Files", "*.*")]
+            )
+        if not paths:
+            return
+        
+        op = BOOLEAN_OPS[op_name]
+        size = self.original_image.size
+        
+        def compute(progress):
+            # Akumulator dimulai dari gambar original
+            # Selama semua gambar biner, akumulasi dilakukan pada bentuk bit-packed
+            # copy(): mask original di-cache, jadi tidak boleh diubah in-place
+            original_mask = self.original_binary_mask()
+            packed = original_mask.packed.copy() if original_mask is not None else None
+            result = None if original_mask is not None else self.load_array("L")
+            
+            for i, path in enumerate(paths):
+                progress(i / len(paths))
+                
+                # cache=False: gambar ini hanya dipakai sekali
+                operand = load_mask_operand(path, size, cache=False)
+                
+                if result is None and isinstance(operand, BinaryMask):
+                    op(packed, operand.packed, out=packed)
+                    continue
+                
+                # Ada gambar non-biner: lanjutkan akumulasi dalam grayscale
+                if result is None:
+                    result = BinaryMask(packed, original_mask.shape).to_array()
+                op(result, operand_to_gray(operand), out=result)
+            
+            if result is None:
+                return BinaryMask(packed, original_mask.shape)
+            return Image.fromarray(result)
+        
+        final_result = self.run_in_background(f"Combine {op_name}", compute)
+        
+        # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+        if isinstance(final_result, BinaryMask):
+            self.set_processed_mask(final_result)
+        elif final_result is not None:
+            self.processed_image = final_result
+        self.display_images()
     
     # ========== Geometric Operations ==========
     # Method untuk translasi (menggeser gambar)
@@ -1169,8 +3622,9 @@ class ImageProcessingApp:
         # Tombol Vertical
         Button(btn_frame, text="Vertical", command=on_vertical, width=12, bg="blue", fg="white").pack(side=tk.LEFT, padx=10)
         
-        # Tunggu dialog ditutup
-        dialog.wait_window()
+        # Tunggu dialog ditutup (dicatat sebagai idle)
+        with self.perf_phase("idle"):
+            dialog.wait_window()
         
         # Lakukan flipping sesuai pilihan
         if result['value'] == 'horizontal':
@@ -1194,21 +3648,23 @@ class ImageProcessingApp:
         # Minta input koordinat crop menggunakan simpledialog
         # askinteger(): dialog input angka integer
         
-        # X1 (left): koordinat kiri
-        x1 = simpledialog.askinteger("Crop", "Enter X1 (left):", initialvalue=0)
-        if x1 is None: return  # Jika cancel, keluar
-        
-        # Y1 (top): koordinat atas
-        y1 = simpledialog.askinteger("Crop", "Enter Y1 (top):", initialvalue=0)
-        if y1 is None: return
-        
-        # X2 (right): koordinat kanan
-        x2 = simpledialog.askinteger("Crop", "Enter X2 (right):", initialvalue=self.original_image.width)
-        if x2 is None: return
-        
-        # Y2 (bottom): koordinat bawah
-        y2 = simpledialog.askinteger("Crop", "Enter Y2 (bottom):", initialvalue=self.original_image.height)
-        if y2 is None: return
+        # Waktu mengisi dialog dicatat sebagai idle
+        with self.perf_phase("idle"):
+            # X1 (left): koordinat kiri
+            x1 = simpledialog.askinteger("Crop", "Enter X1 (left):", initialvalue=0)
+            if x1 is None: return  # Jika cancel, keluar
+            
+            # Y1 (top): koordinat atas
+            y1 = simpledialog.askinteger("Crop", "Enter Y1 (top):", initialvalue=0)
+            if y1 is None: return
+            
+            # X2 (right): koordinat kanan
+            x2 = simpledialog.askinteger("Crop", "Enter X2 (right):", initialvalue=self.original_image.width)
+            if x2 is None: return
+            
+            # Y2 (bottom): koordinat bawah
+            y2 = simpledialog.askinteger("Crop", "Enter Y2 (bottom):", initialvalue=self.original_image.height)
+            if y2 is None: return
         
         # Crop gambar dengan koordinat (x1, y1, x2, y2)
         # crop(): memotong gambar dalam rectangle
@@ -1216,41 +3672,83 @@ class ImageProcessingApp:
         
         self.display_images()
     
-    # Method untuk thresholding (konversi ke binary berdasarkan threshold)
-    def thresholding(self):
-        if not self.check_image_loaded(): return
+    # Method dialog thresholding bersama untuk menu Thresholding dan Binary
+    # Mode:
+    # - Manual: threshold dari slider
+    # - Otsu / Triangle: threshold dihitung otomatis dari histogram yang di-cache
+    #   (O(256), tanpa membaca ulang pixel)
+    # - Adaptive Mean / Gaussian: threshold lokal per pixel dari integral image
+    # Hasil disimpan sebagai BinaryMask (bit-packed)
+    # - title: judul dialog
+    # - label_text: label slider threshold
+    def binary_threshold(self, title, label_text):
+        """Thresholding binary manual, otomatis (Otsu/Triangle), atau adaptive"""
+        
+        # Integral image di-cache per gambar (proxy/penuh) dengan radius block
+        # maksimum, sehingga perubahan block size tidak menghitung ulang integral
+        integrals = {}
+        
+        # Threshold global untuk mode Manual/Otsu/Triangle
+        # Histogram diambil dari gambar penuh agar preview dan hasil akhir sama
+        def global_threshold(values):
+            if values['method'] == "Otsu":
+                return self.get_histogram(self.original_image, "L").otsu_threshold()
+            if values['method'] == "Triangle":
+                return self.get_histogram(self.original_image, "L").triangle_threshold()
+            return int(values['threshold'])
+        
+        # Thresholding sesuai parameter dialog
+        # - proxy: True untuk preview (gambar proxy, block size ikut diperkecil)
+        def apply_threshold(values, proxy=False):
+            if not values['method'].startswith("Adaptive"):
+                # cv2.threshold(..., cv2.THRESH_BINARY) lewat lookup table
+                # Pixel > threshold = 255 (putih), pixel <= threshold = 0 (hitam)
+                threshold = global_threshold(values)
+                return self.apply_point_lut(lambda x: np.where(x > threshold, 255, 0).astype(np.uint8), "L", proxy)
+            
+            img_gray = self.load_array("L", proxy=proxy)
+            
+            # Block size dalam pixel gambar penuh; untuk proxy diperkecil sesuai
+            # rasio ukuran (tetap ganjil, minimal 3)
+            block_size = int(values['block_size'])
+            if proxy:
+                scale = img_gray.shape[1] / self.original_image.size[0]
+                block_size = max(3, int(round(block_size * scale)) | 1)
+            
+            if values['method'] == "Adaptive Mean":
+                if proxy not in integrals:
+                    integrals[proxy] = padded_integral(img_gray, ADAPTIVE_MAX_BLOCK // 2)
+                return adaptive_threshold(img_gray, "mean", block_size, values['c'], integrals[proxy])
+            return adaptive_threshold(img_gray, "gaussian", block_size, values['c'])
         
-        # Inner function untuk preview thresholding
-        def preview_threshold(val):
-            # Konversi ke grayscale
-            img_gray = np.array(self.original_image.convert("L"))
-            
-            # cv2.threshold(): fungsi thresholding OpenCV
-            # int(val): nilai threshold
-            # 255: nilai maximum (putih)
-            # cv2.THRESH_BINARY: tipe thresholding binary
-            # Pixel > threshold = 255 (putih), pixel <= threshold = 0 (hitam)
-            _, result = cv2.threshold(img_gray, int(val), 255, cv2.THRESH_BINARY)
-            
-            # Tampilkan preview
-            self.temp_image = Image.fromarray(result)
+        # Inner function untuk preview
+        def preview_threshold(values):
+            self.temp_image = Image.fromarray(apply_threshold(values, proxy=True))
             self.display_temp_image()
         
-        # Slider threshold 0-255, default 127 (tengah), step 1
-        result = self.create_slider_dialog("Thresholding", "Threshold Value: 0-255", 0, 255, 127, 1, preview_threshold)
+        # Default: Manual 127 (sama seperti slider threshold sebelumnya)
+        result = self.create_params_dialog(title, [
+            ("choice", "method", "Method:", ["Manual", "Otsu", "Triangle", "Adaptive Mean", "Adaptive Gaussian"], "Manual"),
+            ("slider", "threshold", label_text, 0, 255, 127, 1),
+            ("slider", "block_size", "Block Size (adaptive):", 3, ADAPTIVE_MAX_BLOCK, 11, 2),
+            ("slider", "c", "Offset C (adaptive):", -20, 20, 2, 1),
+        ], preview_threshold)
         
-        # Jika OK diklik
         if result['confirmed'] and result['value'] is not None:
-            img_gray = np.array(self.original_image.convert("L"))
-            
-            # Lakukan thresholding final
-            _, final_result = cv2.threshold(img_gray, int(result['value']), 255, cv2.THRESH_BINARY)
-            self.processed_image = Image.fromarray(final_result)
+            # Hasil biner disimpan bit-packed (1 bit per pixel)
+            self.set_processed_mask(BinaryMask.from_array(apply_threshold(result['value'])))
         else:
             self.processed_image = self.original_image.copy()
         
         self.display_images()
     
+    # Method untuk thresholding (konversi ke binary berdasarkan threshold)
+    def thresholding(self):
+        if not self.check_image_loaded(): return
+        
+        # Dialog threshold manual, otomatis (Otsu/Triangle), atau adaptive
+        self.binary_threshold("Thresholding", "Threshold Value: 0-255")
+    
     # Method untuk konvolusi dengan kernel
     def convolution(self):
         if not self.check_image_loaded(): return
@@ -1262,7 +3760,7 @@ class ImageProcessingApp:
                           [-1, -1, -1]])
         
         # Konversi gambar ke grayscale dan float32
-        img_array = np.array(self.original_image.convert("L"), dtype=np.float32)
+        img_array = self.load_array("L", np.float32)
         
         # ndimage.convolve(): fungsi konvolusi dari scipy
         # Mengaplikasikan kernel ke seluruh gambar
@@ -1275,59 +3773,129 @@ class ImageProcessingApp:
         self.display_images()
     
     # Method untuk Fourier Transform
+    # Hasil: log-magnitude spectrum ukuran penuh (DC di tengah), dinormalisasi
+    # sama seperti Spectrum Viewer. Spektrum rfft2 diambil dari cache
+    # get_spectrum(), sehingga filter frekuensi dan export memakai ulang FFT ini
     def fourier_transform(self):
         if not self.check_image_loaded(): return
         
-        # Konversi gambar ke grayscale float32
-        img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
+        # Gambar berwarna diproses per channel RGB (spectrum berwarna),
+        # gambar grayscale/biner sebagai satu channel float32
+        mode = self.filter_mode()
+        
+        # FFT ukuran penuh dijalankan di worker thread
+        def compute(progress):
+            half, (rows, cols) = self.get_spectrum(mode)
+            progress(0.5)
+            
+            # |F(-u, -v)| = |F(u, v)|: log-magnitude cukup dihitung (dan
+            # dinormalisasi) pada setengah spektrum rfft2, lalu dicerminkan
+            # sebagai uint8 ke ukuran penuh
+            magnitude = full_spectrum(magnitude_image(half), cols)
+            progress(0.9)
+            
+            # fftshift(): menggeser komponen DC (frekuensi 0) ke tengah
+            return Image.fromarray(fftshift(magnitude, axes=(0, 1)))
+        
+        final_image = self.run_in_background("Fourier Transform", compute)
         
-        # fft2(): 2D Fast Fourier Transform
-        # Mengubah gambar dari domain spasial ke domain frekuensi
-        f = fft2(img_gray)
+        # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+        if final_image is not None:
+            self.processed_image = final_image
+            self.display_images()
+    
+    # Method untuk Spectrum Viewer (log-magnitude dan phase)
+    # Tampilan dihitung dari spektrum proxy yang di-cache (tidak ada FFT ukuran
+    # penuh hanya untuk tampilan); FFT penuh baru dihitung saat export, di
+    # worker thread
+    def show_spectrum(self):
+        """Spectrum viewer: log-magnitude, phase, radius di bawah mouse, export .npy"""
+        if not self.check_image_loaded(): return
         
-        # fftshift(): menggeser komponen DC (frekuensi 0) ke tengah
-        # Agar spectrum lebih mudah divisualisasikan
-        fshift = fftshift(f)
+        # Gambar berwarna: spektrum per channel RGB, grayscale: satu channel
+        mode = self.filter_mode()
         
-        # Hitung magnitude spectrum
-        # np.abs(): nilai absolut untuk mendapatkan magnitude
-        # 20 * np.log(): konversi ke skala logaritmik untuk visualisasi lebih baik
-        # +1: untuk menghindari log(0)
-        magnitude_spectrum = 20 * np.log(np.abs(fshift) + 1)
+        # Spektrum lengkap yang di-shift (DC di tengah) dari spektrum proxy
+        half, (rows, cols) = self.get_spectrum(mode, proxy=True)
+        spectrum = fftshift(full_spectrum(half, cols), axes=(0, 1))
+        magnitude, phase = spectrum_images(spectrum)
         
-        # Normalisasi untuk display (0-255)
-        magnitude_spectrum = np.clip(magnitude_spectrum, 0, 255).astype(np.uint8)
+        # Resize ke ukuran panel (sekali untuk kedua gambar)
+        ratio = min(CHANNEL_PANEL_SIZE[0] / cols, CHANNEL_PANEL_SIZE[1] / rows, 1.0)
+        panel_size = (max(1, int(cols * ratio)), max(1, int(rows * ratio)))
+        with self.perf_phase("display"):
+            panels = [("Log Magnitude", cv2.resize(magnitude, panel_size, interpolation=cv2.INTER_AREA)),
+                      ("Phase", cv2.resize(phase, panel_size, interpolation=cv2.INTER_AREA))]
         
-        self.processed_image = Image.fromarray(magnitude_spectrum)
-        self.display_images()
+        dialog = Toplevel(self.root)
+        dialog.title("Spectrum Viewer")
+        dialog.transient(self.root)
+        
+        # Referensi PhotoImage disimpan agar tidak di-garbage collect
+        dialog.photos = []
+        
+        # Label untuk posisi frekuensi di bawah mouse
+        readout = Label(dialog, text="Move the mouse over the spectrum", font=("Arial", 10))
+        
+        # Posisi mouse -> frekuensi (u, v) relatif terhadap DC dan radius D
+        # Satuan siklus per gambar: sama untuk proxy dan gambar penuh, dan sama
+        # dengan satuan cutoff (D0) di dialog filter frekuensi
+        def show_radius(event):
+            u = int(event.y / ratio) - rows // 2
+            v = int(event.x / ratio) - cols // 2
+            readout.config(text=f"u = {u:+d}, v = {v:+d}, radius D = {np.hypot(u, v):.1f}")
+        
+        panel_frame = tk.Frame(dialog)
+        panel_frame.pack(padx=5, pady=5)
+        for name, image in panels:
+            frame = tk.Frame(panel_frame)
+            frame.pack(side=tk.LEFT, padx=5)
+            
+            Label(frame, text=name, font=("Arial", 10, "bold")).pack()
+            
+            with self.perf_phase("display"):
+                photo = ImageTk.PhotoImage(Image.fromarray(image))
+            dialog.photos.append(photo)
+            panel = Label(frame, image=photo, borderwidth=0)
+            panel.pack()
+            panel.bind("<Motion>", show_radius)
+        
+        readout.pack(pady=5)
+        
+        # Export spektrum kompleks resolusi penuh ke file .npy
+        # Layout sama dengan np.fft.fft2 (belum di-shift): np.fft.ifft2 pada array
+        # hasil load mengembalikan gambar (per channel untuk gambar berwarna: axes=(0, 1))
+        def export_spectrum():
+            with self.perf_phase("idle"):
+                file_path = filedialog.asksaveasfilename(
+                    defaultextension=".npy",
+                    filetypes=[("NumPy Array", "*.npy"), ("All Files", "*.*")]
+                )
+            if not file_path:
+                return
+            
+            # FFT ukuran penuh dan penulisan file di worker thread
+            def compute(progress):
+                half_full, (full_rows, full_cols) = self.get_spectrum(mode)
+                progress(0.5)
+                np.save(file_path, full_spectrum(half_full, full_cols))
+                return full_rows, full_cols
+            
+            shape = self.run_in_background("Export Spectrum", compute)
+            if shape is not None:
+                with self.perf_phase("idle"):
+                    messagebox.showinfo("Success", f"Spectrum ({shape[0]}x{shape[1]}, complex64) exported!", parent=dialog)
+        
+        Button(dialog, text="Export Spectrum (.npy)...",
+               command=self.instrument("Export Spectrum", export_spectrum), width=25).pack(pady=5)
     
     # ========== COLOR OPERATIONS ==========
     # Method untuk konversi ke Binary
     def color_binary(self):
         if not self.check_image_loaded(): return
         
-        # Inner function untuk preview
-        def preview_binary(val):
-            # Konversi ke grayscale
-            img_gray = np.array(self.original_image.convert("L"))
-            
-            # Thresholding untuk binary
-            _, result = cv2.threshold(img_gray, int(val), 255, cv2.THRESH_BINARY)
-            
-            self.temp_image = Image.fromarray(result)
-            self.display_temp_image()
-        
-        # Slider threshold untuk binary
-        result = self.create_slider_dialog("Binary", "Threshold: 0-255", 0, 255, 127, 1, preview_binary)
-        
-        if result['confirmed'] and result['value'] is not None:
-            img_gray = np.array(self.original_image.convert("L"))
-            _, final_result = cv2.threshold(img_gray, int(result['value']), 255, cv2.THRESH_BINARY)
-            self.processed_image = Image.fromarray(final_result)
-        else:
-            self.processed_image = self.original_image.copy()
-        
-        self.display_images()
+        # Thresholding untuk binary (manual, otomatis, atau adaptive)
+        self.binary_threshold("Binary", "Threshold: 0-255")
     
     # Method untuk konversi ke Grayscale
     def color_grayscale(self):
@@ -1354,12 +3922,11 @@ class ImageProcessingApp:
         if not self.check_image_loaded(): return
         
         # Konversi gambar ke numpy array RGB
-        img_rgb = np.array(self.original_image.convert("RGB"))
+        img_rgb = self.load_array("RGB")
         
-        # cv2.cvtColor(): fungsi konversi color space OpenCV
-        # COLOR_RGB2HSV: konversi dari RGB ke HSV (Hue Saturation Value)
-        # HSV lebih intuitif untuk manipulasi warna
-        img_hsv = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2HSV)
+        # convert_color(): konversi color space per chunk (cv2.cvtColor)
+        # HSV (Hue Saturation Value) lebih intuitif untuk manipulasi warna
+        img_hsv = convert_color(img_rgb, "HSV")
         
         self.processed_image = Image.fromarray(img_hsv)
         self.display_images()
@@ -1368,17 +3935,14 @@ class ImageProcessingApp:
     def color_cmy(self):
         if not self.check_image_loaded(): return
         
-        # Konversi ke RGB dan normalisasi ke range 0-1
-        img_rgb = np.array(self.original_image.convert("RGB"), dtype=np.float32) / 255.0
-        
-        # CMY = 1 - RGB
-        # C (Cyan) = 1 - R
-        # M (Magenta) = 1 - G
-        # Y (Yellow) = 1 - B
-        img_cmy = 1.0 - img_rgb
+        # Konversi ke numpy array RGB (uint8, tanpa normalisasi float)
+        img_rgb = self.load_array("RGB")
         
-        # Konversi kembali ke range 0-255
-        img_cmy = (img_cmy * 255).astype(np.uint8)
+        # CMY = 255 - RGB
+        # C (Cyan) = 255 - R
+        # M (Magenta) = 255 - G
+        # Y (Yellow) = 255 - B
+        img_cmy = convert_color(img_rgb, "CMY")
         
         self.processed_image = Image.fromarray(img_cmy)
         self.display_images()
@@ -1388,12 +3952,12 @@ class ImageProcessingApp:
         if not self.check_image_loaded(): return
         
         # Konversi ke numpy array RGB
-        img_rgb = np.array(self.original_image.convert("RGB"))
+        img_rgb = self.load_array("RGB")
         
-        # cv2.cvtColor(): konversi RGB ke YUV
+        # Konversi RGB ke YUV (cv2.cvtColor per chunk)
         # YUV: Y (luminance), U dan V (chrominance)
         # Digunakan dalam kompresi video (JPEG, MPEG)
-        img_yuv = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2YUV)
+        img_yuv = convert_color(img_rgb, "YUV")
         
         self.processed_image = Image.fromarray(img_yuv)
         self.display_images()
@@ -1402,33 +3966,111 @@ class ImageProcessingApp:
     def color_yiq(self):
         if not self.check_image_loaded(): return
         
-        # Konversi ke RGB dan normalisasi
-        img_rgb = np.array(self.original_image.convert("RGB"), dtype=np.float32) / 255.0
+        # Konversi ke numpy array RGB (uint8)
+        img_rgb = self.load_array("RGB")
         
-        # Transformation matrix RGB to YIQ
-        # YIQ: digunakan di sistem TV analog NTSC
-        # Y = luminance, I dan Q = chrominance
-        transform_matrix = np.array([[0.299, 0.587, 0.114],
-                                    [0.596, -0.275, -0.321],
-                                    [0.212, -0.523, 0.311]])
+        # Transformation matrix RGB to YIQ (COLOR_MATRICES["YIQ"])
+        # cv2.transform(): perkalian matrix untuk setiap pixel dalam float32,
+        # hasil langsung di-clip ke 0-255 (I dan Q negatif menjadi 0)
+        img_yiq = convert_color(img_rgb, "YIQ")
         
-        # np.dot(): perkalian matrix
-        # Mengaplikasikan transformation matrix ke setiap pixel
-        # .T: transpose matrix
-        img_yiq = np.dot(img_rgb, transform_matrix.T)
+        self.processed_image = Image.fromarray(img_yiq)
+        self.display_images()
+    
+    # Method untuk konversi ke Lab
+    def color_lab(self):
+        if not self.check_image_loaded(): return
         
-        # Clip dan konversi kembali ke 0-255
-        img_yiq = np.clip(img_yiq * 255, 0, 255).astype(np.uint8)
+        # Konversi ke numpy array RGB
+        img_rgb = self.load_array("RGB")
         
-        self.processed_image = Image.fromarray(img_yiq)
+        # Konversi RGB ke CIE Lab (cv2.cvtColor per chunk)
+        # L = lightness, a = hijau-merah, b = biru-kuning (encoding 8-bit OpenCV)
+        img_lab = convert_color(img_rgb, "Lab")
+        
+        self.processed_image = Image.fromarray(img_lab)
         self.display_images()
     
+    # Method untuk mendapatkan hasil konversi color space gambar original (uint8)
+    # Hasil konversi terakhir dipakai ulang selama gambar dan color space sama
+    # Channel bertanda (COLOR_SIGNED_CHANNELS) dinormalisasi min-max ke 0-255
+    def get_color_planes(self, space):
+        """Array HxWx3 uint8 gambar original dalam color space tertentu (dengan cache)"""
+        image, cached_space, planes = self._color_cache
+        if image is self.original_image and cached_space == space:
+            return planes
+        
+        signed = COLOR_SIGNED_CHANNELS.get(space, ())
+        if signed:
+            converted = convert_color(self.load_array("RGB"), space, dtype=np.float32)
+            planes = np.empty(converted.shape, dtype=np.uint8)
+            for i in range(converted.shape[2]):
+                plane = np.ascontiguousarray(converted[:, :, i])
+                if i in signed:
+                    planes[:, :, i] = cv2.normalize(plane, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+                else:
+                    planes[:, :, i] = cast_chunk(plane, np.uint8)
+        else:
+            planes = convert_color(self.load_array("RGB"), space)
+        
+        self._color_cache = (self.original_image, space, planes)
+        return planes
+    
+    # Method untuk menampilkan setiap channel color space secara berdampingan
+    # Setiap channel adalah slice [:, :, i] dari satu array hasil konversi (tanpa copy)
+    def color_channel_view(self):
+        """Menampilkan 3 channel color space berdampingan"""
+        if not self.check_image_loaded(): return
+        
+        # Pilih color space
+        space = self.choose_option_dialog("Channel View", "Select Color Space:", list(COLOR_SPACES))
+        if space is None:
+            return
+        
+        # Hasil konversi (dari cache jika sudah pernah dihitung)
+        converted = self.get_color_planes(space)
+        
+        # Resize sekali untuk 3 channel sekaligus ke ukuran panel
+        # INTER_AREA: downsampling rata-rata area (tanpa aliasing)
+        height, width = converted.shape[:2]
+        ratio = min(CHANNEL_PANEL_SIZE[0] / width, CHANNEL_PANEL_SIZE[1] / height, 1.0)
+        panel_size = (max(1, int(width * ratio)), max(1, int(height * ratio)))
+        with self.perf_phase("display"):
+            preview = cv2.resize(converted, panel_size, interpolation=cv2.INTER_AREA)
+        
+        dialog = Toplevel(self.root)
+        dialog.title(f"Channel View: {space}")
+        dialog.transient(self.root)
+        
+        # Referensi PhotoImage disimpan agar tidak di-garbage collect
+        dialog.photos = []
+        
+        # Satu panel per channel: nama, gambar grayscale, dan tombol untuk memakai
+        # channel tersebut sebagai hasil
+        for i, name in enumerate(COLOR_CHANNEL_NAMES[space]):
+            frame = tk.Frame(dialog)
+            frame.pack(side=tk.LEFT, padx=5, pady=5)
+            
+            Label(frame, text=name, font=("Arial", 10, "bold")).pack()
+            
+            with self.perf_phase("display"):
+                photo = ImageTk.PhotoImage(Image.fromarray(preview[:, :, i]))
+            dialog.photos.append(photo)
+            Label(frame, image=photo).pack()
+            
+            # i=i: "membekukan" nomor channel untuk setiap tombol
+            # Channel resolusi penuh baru di-copy saat tombol diklik
+            def use_channel(i=i):
+                self.processed_image = Image.fromarray(np.ascontiguousarray(converted[:, :, i]))
+                self.display_images()
+            Button(frame, text=f"Use {name}", command=use_channel, width=10).pack(pady=5)
+    
     # Method untuk konversi ke Pseudocolor
     def color_pseudo(self):
         if not self.check_image_loaded(): return
         
         # Konversi ke grayscale
-        img_gray = np.array(self.original_image.convert("L"))
+        img_gray = self.load_array("L")
         
         # cv2.applyColorMap(): aplikasikan colormap ke grayscale
         # COLORMAP_JET: colormap jet (biru-cyan-hijau-kuning-merah)
@@ -1499,18 +4141,62 @@ class ImageProcessingApp:
         self.display_images()
     
     # Method untuk histogram equalization
+    # Mode Global (cv2.equalizeHist) atau CLAHE (Contrast Limited Adaptive
+    # Histogram Equalization: equalization per tile dengan batas clip)
+    # Channel Gray memproses grayscale, YCrCb/Lab hanya meng-equalize channel
+    # luminance sehingga warna tetap terjaga
     def histogram_equalization(self):
         if not self.check_image_loaded(): return
         
-        # Konversi ke grayscale
-        img_gray = np.array(self.original_image.convert("L"))
+        # Equalization sesuai parameter dialog
+        # - img_array: RGB (untuk YCrCb/Lab) atau grayscale (untuk Gray)
+        def equalize(img_array, values):
+            if values['method'] == "CLAHE":
+                # cv2.createCLAHE(): histogram dihitung per tile (grid tiles x tiles),
+                # bin yang melebihi clip limit dipotong dan disebar ke bin lain
+                # (mencegah noise teramplifikasi), lalu hasil antar tile diinterpolasi
+                # bilinear. OpenCV memproses tile secara paralel di dalam apply()
+                clahe = cv2.createCLAHE(clipLimit=values['clip_limit'],
+                                        tileGridSize=(values['tiles'], values['tiles']))
+                equalize_plane = clahe.apply
+            else:
+                # cv2.equalizeHist(): histogram equalization global
+                # Menyeimbangkan distribusi intensitas pixel
+                equalize_plane = cv2.equalizeHist
+            
+            if values['channel'] == "Gray":
+                return equalize_plane(img_array)
+            
+            # Equalize channel luminance (Y atau L) saja, lalu kembalikan ke RGB
+            converted = convert_color(img_array, values['channel'])
+            converted[:, :, 0] = equalize_plane(np.ascontiguousarray(converted[:, :, 0]))
+            return convert_color(converted, values['channel'], inverse=True)
+        
+        # Mode konversi gambar original sesuai channel yang dipilih
+        def array_mode(values):
+            return "L" if values['channel'] == "Gray" else "RGB"
+        
+        # Preview dijalankan pada gambar proxy (resolusi kecil)
+        # Tile grid relatif terhadap ukuran gambar, jadi hasilnya mewakili gambar penuh
+        def preview_equalization(values):
+            img_array = self.load_array(array_mode(values), proxy=True)
+            self.temp_image = Image.fromarray(equalize(img_array, values))
+            self.display_temp_image()
+        
+        # Default: Global + Gray (sama seperti equalization sebelumnya)
+        result = self.create_params_dialog("Histogram Equalization", [
+            ("choice", "method", "Method:", ["Global", "CLAHE"], "Global"),
+            ("choice", "channel", "Channel:", ["Gray", "YCrCb", "Lab"], "Gray"),
+            ("slider", "tiles", "CLAHE Tiles:", 2, 32, 8, 1),
+            ("slider", "clip_limit", "CLAHE Clip Limit:", 0.5, 10.0, 2.0, 0.5),
+        ], preview_equalization)
         
-        # cv2.equalizeHist(): histogram equalization
-        # Menyeimbangkan distribusi intensitas pixel
-        # Meningkatkan kontras secara otomatis
-        img_eq = cv2.equalizeHist(img_gray)
+        if result['confirmed'] and result['value'] is not None:
+            img_array = self.load_array(array_mode(result['value']))
+            self.processed_image = Image.fromarray(equalize(img_array, result['value']))
+        else:
+            self.processed_image = self.original_image.copy()
         
-        self.processed_image = Image.fromarray(img_eq)
         self.display_images()
     
     # ========== SMOOTHING OPERATIONS ==========
@@ -1518,6 +4204,9 @@ class ImageProcessingApp:
     def smoothing_lowpass(self):
         if not self.check_image_loaded(): return
         
+        # Konversi gambar ke numpy array sekali saja untuk semua preview
+        img_array = self.load_array()
+        
         # Inner function untuk preview
         def preview_lowpass(val):
             # Kernel size untuk filter
@@ -1527,13 +4216,10 @@ class ImageProcessingApp:
             if kernel_size % 2 == 0:
                 kernel_size += 1
             
-            # Konversi gambar ke numpy array
-            img_array = np.array(self.original_image)
-            
-            # cv2.blur(): averaging/mean filter
+            # parallel_filter(): averaging/mean filter (cv2.blur) paralel per strip
             # (kernel_size, kernel_size): ukuran kernel
             # Filter ini merata-ratakan pixel dengan tetangganya
-            result = cv2.blur(img_array, (kernel_size, kernel_size))
+            result = parallel_filter(img_array, kernel_size, "box")
             
             self.temp_image = Image.fromarray(result)
             self.display_temp_image()
@@ -1546,8 +4232,7 @@ class ImageProcessingApp:
             if kernel_size % 2 == 0:
                 kernel_size += 1
             
-            img_array = np.array(self.original_image)
-            final_result = cv2.blur(img_array, (kernel_size, kernel_size))
+            final_result = parallel_filter(img_array, kernel_size, "box")
             self.processed_image = Image.fromarray(final_result)
         else:
             self.processed_image = self.original_image.copy()
@@ -1558,6 +4243,9 @@ class ImageProcessingApp:
     def smoothing_median(self):
         if not self.check_image_loaded(): return
         
+        # Konversi gambar ke numpy array sekali saja untuk semua preview
+        img_array = self.load_array()
+        
         # Inner function untuk preview
         def preview_median(val):
             kernel_size = int(val)
@@ -1566,12 +4254,10 @@ class ImageProcessingApp:
             if kernel_size % 2 == 0:
                 kernel_size += 1
             
-            img_array = np.array(self.original_image)
-            
-            # cv2.medianBlur(): median filter
+            # parallel_filter(): median filter (cv2.medianBlur) paralel per strip
             # Mengganti setiap pixel dengan median dari tetangganya
             # Sangat efektif untuk menghilangkan salt-and-pepper noise
-            result = cv2.medianBlur(img_array, kernel_size)
+            result = parallel_filter(img_array, kernel_size, "median")
             
             self.temp_image = Image.fromarray(result)
             self.display_temp_image()
@@ -1584,381 +4270,575 @@ class ImageProcessingApp:
             if kernel_size % 2 == 0:
                 kernel_size += 1
             
-            img_array = np.array(self.original_image)
-            final_result = cv2.medianBlur(img_array, kernel_size)
-            self.processed_image = Image.fromarray(final_result)
+            final_result = parallel_filter(img_array, kernel_size, "median")
+            self.processed_image = Image.fromarray(final_result)
+        else:
+            self.processed_image = self.original_image.copy()
+        
+        self.display_images()
+    
+    # Method untuk Gaussian Smoothing
+    # Implementasi (separable/FFT/IIR) dipilih otomatis oleh gaussian_blur()
+    def smoothing_gaussian(self):
+        if not self.check_image_loaded(): return
+        
+        # "L" atau "RGB" (alpha/palette/mode 1 tidak diterima filter cv2)
+        mode = self.filter_mode()
+        
+        # Preview pada gambar proxy, sigma diperkecil sesuai rasio ukuran
+        img_proxy = self.load_array(mode, proxy=True)
+        scale = img_proxy.shape[1] / self.original_image.size[0]
+        
+        # Inner function untuk preview
+        def preview_gaussian(val):
+            # Sigma: standar deviasi Gaussian (makin besar makin blur)
+            sigma = max(0.3, float(val) * scale)
+            result = gaussian_blur(img_proxy, sigma)
+            
+            self.temp_image = Image.fromarray(result)
+            self.display_temp_image()
+        
+        # Slider sigma 0.5-50, default 2, step 0.5
+        result = self.create_slider_dialog("Gaussian Blur", "Sigma: 0.5-50", 0.5, 50, 2, 0.5, preview_gaussian)
+        
+        if result['confirmed'] and result['value'] is not None:
+            sigma = float(result['value'])
+            
+            # Komputasi final di worker thread (sigma besar pada gambar besar)
+            def compute(progress):
+                img_array = self.load_array(mode)
+                progress(0.5)
+                return Image.fromarray(gaussian_blur(img_array, sigma))
+            
+            final_image = self.run_in_background("Gaussian Blur", compute)
+            
+            # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+            if final_image is not None:
+                self.processed_image = final_image
         else:
             self.processed_image = self.original_image.copy()
         
         self.display_images()
     
-    # Method untuk ILPF (Ideal Lowpass Filter)
-    def smoothing_ilpf(self):
-        """Ideal Lowpass Filter in Frequency Domain"""
+    # Method untuk Bilateral Filtering (smoothing yang mempertahankan tepi)
+    def smoothing_bilateral(self):
         if not self.check_image_loaded(): return
         
+        # "L" atau "RGB" (alpha/palette/mode 1 tidak diterima filter cv2)
+        mode = self.filter_mode()
+        
+        # Preview pada gambar proxy, sigma spatial diperkecil sesuai rasio ukuran
+        img_proxy = self.load_array(mode, proxy=True)
+        scale = img_proxy.shape[1] / self.original_image.size[0]
+        
         # Inner function untuk preview
-        def preview_ilpf(val):
-            # Konversi ke grayscale float32
-            img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            # FFT: transformasi ke domain frekuensi
-            f = fft2(img_gray)
-            fshift = fftshift(f)
-            
-            # Ambil ukuran gambar
-            rows, cols = img_gray.shape
-            crow, ccol = rows // 2, cols // 2  # Pusat gambar
-            
-            # Create ILPF mask
-            # Mask berbentuk lingkaran dengan radius val
-            mask = np.zeros((rows, cols), dtype=np.float32)
-            for i in range(rows):
-                for j in range(cols):
-                    # Hitung jarak dari pusat
-                    # Jika jarak <= cutoff frequency (val), pass (1)
-                    # Jika jarak > cutoff frequency, reject (0)
-                    if np.sqrt((i - crow)**2 + (j - ccol)**2) <= val:
-                        mask[i, j] = 1
-            
-            # Apply filter dengan mengalikan mask
-            fshift_filtered = fshift * mask
-            
-            # IFFT: transformasi kembali ke domain spasial
-            f_ishift = ifftshift(fshift_filtered)
-            img_back = ifft2(f_ishift)
-            img_back = np.abs(img_back)  # Ambil magnitude
+        def preview_bilateral(values):
+            sigma_space = max(0.5, values['sigma_space'] * scale)
+            result = bilateral_filter(img_proxy, values['sigma_color'], sigma_space)
             
-            # Clip dan konversi tipe data
-            result = np.clip(img_back, 0, 255).astype(np.uint8)
             self.temp_image = Image.fromarray(result)
             self.display_temp_image()
         
-        # Slider cutoff frequency 1-200, default 30, step 1
-        result = self.create_slider_dialog("ILPF", "Cutoff Frequency: 1-200", 1, 200, 30, 1, preview_ilpf)
+        # - sigma_color: beda intensitas yang masih dihaluskan (tepi > sigma dipertahankan)
+        # - sigma_space: jangkauan spatial filter dalam pixel
+        result = self.create_params_dialog("Bilateral Filter", [
+            ("slider", "sigma_color", "Sigma Color:", 1, 150, 50, 1),
+            ("slider", "sigma_space", "Sigma Space:", 1, 30, 5, 1),
+        ], preview_bilateral)
         
         if result['confirmed'] and result['value'] is not None:
-            img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            f = fft2(img_gray)
-            fshift = fftshift(f)
+            values = result['value']
             
-            rows, cols = img_gray.shape
-            crow, ccol = rows // 2, cols // 2
+            # Komputasi final di worker thread
+            def compute(progress):
+                img_array = self.load_array(mode)
+                progress(0.5)
+                return Image.fromarray(bilateral_filter(img_array, values['sigma_color'], values['sigma_space']))
             
-            mask = np.zeros((rows, cols), dtype=np.float32)
-            for i in range(rows):
-                for j in range(cols):
-                    if np.sqrt((i - crow)**2 + (j - ccol)**2) <= result['value']:
-                        mask[i, j] = 1
+            final_image = self.run_in_background("Bilateral Filter", compute)
             
-            fshift_filtered = fshift * mask
-            f_ishift = ifftshift(fshift_filtered)
-            img_back = ifft2(f_ishift)
-            img_back = np.abs(img_back)
-            
-            final_result = np.clip(img_back, 0, 255).astype(np.uint8)
-            self.processed_image = Image.fromarray(final_result)
+            # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+            if final_image is not None:
+                self.processed_image = final_image
         else:
             self.processed_image = self.original_image.copy()
         
         self.display_images()
     
-    # Method untuk BLPF (Butterworth Lowpass Filter)
-    def smoothing_blpf(self):
-        """Butterworth Lowpass Filter"""
+    # Method untuk Guided Filtering (smoothing yang mempertahankan tepi)
+    def smoothing_guided(self):
         if not self.check_image_loaded(): return
         
+        # "L" atau "RGB" (alpha/palette/mode 1 tidak diterima filter cv2)
+        mode = self.filter_mode()
+        
+        # Preview pada gambar proxy, radius diperkecil sesuai rasio ukuran
+        img_proxy = self.load_array(mode, proxy=True)
+        scale = img_proxy.shape[1] / self.original_image.size[0]
+        
         # Inner function untuk preview
-        def preview_blpf(val):
-            img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            f = fft2(img_gray)
-            fshift = fftshift(f)
-            
-            rows, cols = img_gray.shape
-            crow, ccol = rows // 2, cols // 2
-            
-            # Create BLPF mask
-            # Butterworth filter: transisi lebih smooth dari ILPF
-            # Formula: H(u,v) = 1 / (1 + (D(u,v) / D0)^(2n))
-            # D(u,v) = jarak dari pusat
-            # D0 = cutoff frequency (val)
-            # n = order (2 dalam kasus ini)
-            mask = np.zeros((rows, cols), dtype=np.float32)
-            for i in range(rows):
-                for j in range(cols):
-                    d = np.sqrt((i - crow)**2 + (j - ccol)**2)  # Jarak dari pusat
-                    mask[i, j] = 1 / (1 + (d / val)**(2 * 2))  # order = 2
-            
-            # Apply filter
-            fshift_filtered = fshift * mask
-            f_ishift = ifftshift(fshift_filtered)
-            img_back = ifft2(f_ishift)
-            img_back = np.abs(img_back)
-            
-            result = np.clip(img_back, 0, 255).astype(np.uint8)
+        # Epsilon dari slider dalam satuan intensitas, filter memakai eps = epsilon^2
+        def preview_guided(values):
+            radius = max(1, int(round(values['radius'] * scale)))
+            result = guided_filter(img_proxy, radius, float(values['epsilon']) ** 2)
+            
             self.temp_image = Image.fromarray(result)
             self.display_temp_image()
         
-        # Slider cutoff frequency 1-200, default 30, step 1
-        result = self.create_slider_dialog("BLPF", "Cutoff Frequency: 1-200", 1, 200, 30, 1, preview_blpf)
+        result = self.create_params_dialog("Guided Filter", [
+            ("slider", "radius", "Radius:", 1, 60, 8, 1),
+            ("slider", "epsilon", "Epsilon (intensity):", 1, 100, 20, 1),
+        ], preview_guided)
         
         if result['confirmed'] and result['value'] is not None:
-            img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
+            values = result['value']
             
-            f = fft2(img_gray)
-            fshift = fftshift(f)
+            # Komputasi final di worker thread
+            def compute(progress):
+                img_array = self.load_array(mode)
+                progress(0.5)
+                return Image.fromarray(guided_filter(img_array, values['radius'], float(values['epsilon']) ** 2))
             
-            rows, cols = img_gray.shape
-            crow, ccol = rows // 2, cols // 2
+            final_image = self.run_in_background("Guided Filter", compute)
             
-            mask = np.zeros((rows, cols), dtype=np.float32)
-            for i in range(rows):
-                for j in range(cols):
-                    d = np.sqrt((i - crow)**2 + (j - ccol)**2)
-                    mask[i, j] = 1 / (1 + (d / result['value'])**(2 * 2))
-            
-            fshift_filtered = fshift * mask
-            f_ishift = ifftshift(fshift_filtered)
-            img_back = ifft2(f_ishift)
-            img_back = np.abs(img_back)
-            
-            final_result = np.clip(img_back, 0, 255).astype(np.uint8)
-            self.processed_image = Image.fromarray(final_result)
+            # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+            if final_image is not None:
+                self.processed_image = final_image
         else:
             self.processed_image = self.original_image.copy()
         
         self.display_images()
     
-    # ========== SHARPENING OPERATIONS ==========
-    # Method untuk Highpass Filtering (Spatial Domain)
-    def sharpening_highpass(self):
-        if not self.check_image_loaded(): return
+    # Method umum untuk filter domain frekuensi
+    # Spektrum gambar dan grid frekuensi diambil dari cache, sehingga setiap
+    # perubahan parameter hanya membuat mask (vektor) + satu inverse FFT
+    # - title: judul dialog
+    # - family, kind, order: nilai awal keluarga, jenis, dan orde filter
+    def frequency_filter(self, title, family="Butterworth", kind="Lowpass", order=2):
+        """Filter domain frekuensi (Ideal/Butterworth/Gaussian)"""
+        
+        # Gambar YCrCb (untuk mode luminance) per resolusi, dibuat saat pertama dipakai
+        # Gambar penuh diambil dari cache color space gambar original
+        ycrcb_planes = {}
+        
+        def get_ycrcb(proxy):
+            if proxy not in ycrcb_planes:
+                if proxy:
+                    ycrcb_planes[proxy] = convert_color(self.load_array("RGB", proxy=True), "YCrCb")
+                else:
+                    ycrcb_planes[proxy] = self.get_color_planes("YCrCb")
+            return ycrcb_planes[proxy]
+        
+        # Filter sesuai parameter dialog pada gambar proxy atau penuh
+        # Cutoff dalam satuan siklus per gambar, sehingga nilai yang sama
+        # memberi efek yang sama pada proxy dan gambar penuh
+        def filter_image(values, proxy=False, progress=lambda fraction: None):
+            channels = values['channels']
+            
+            # Per channel: spektrum HxWx3 (tiga FFT dalam satu panggilan batch)
+            # Gray dan luminance: spektrum grayscale (L = luma BT.601, sama dengan Y)
+            mode = "RGB" if channels == "Per Channel (Color)" else "L"
+            spectrum, shape = self.get_spectrum(mode, proxy=proxy)
+            progress(1 / 3)
+            mask = frequency_mask(self.get_frequency_grid(shape), values['family'], values['kind'],
+                                  values['cutoff'], int(values['order']), values['width'],
+                                  (values['notch_u'], values['notch_v']))
+            progress(2 / 3)
+            result = apply_frequency_mask(spectrum, mask, shape)
+            
+            # Luminance: ganti channel Y hasil filter, gabungkan dengan Cr/Cb asli,
+            # lalu konversi kembali ke RGB
+            if channels == "Luminance (Color)":
+                ycrcb = get_ycrcb(proxy).copy()
+                ycrcb[..., 0] = result
+                result = convert_color(ycrcb, "YCrCb", inverse=True)
+            
+            return result
         
         # Inner function untuk preview
-        def preview_highpass(val):
-            # Hitung strength dari slider
-            strength = val / 100.0
-            
-            # Kernel highpass untuk edge enhancement
-            # Kernel ini mendeteksi perubahan intensitas (edges)
-            kernel = np.array([[-1, -1, -1],
-                              [-1,  8, -1],
-                              [-1, -1, -1]]) * strength
-            
-            # Konversi ke grayscale
-            img_array = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            # Konvolusi dengan kernel
-            result = ndimage.convolve(img_array, kernel)
-            result = np.clip(result, 0, 255).astype(np.uint8)
-            
-            self.temp_image = Image.fromarray(result)
+        def preview_filter(values):
+            self.temp_image = Image.fromarray(filter_image(values, proxy=True))
             self.display_temp_image()
         
-        # Slider strength 0-200%, default 100%, step 1
-        result = self.create_slider_dialog("Highpass", "Strength: 0-200%", 0, 200, 100, 1, preview_highpass)
+        # Cutoff default 30 (sama seperti slider ILPF/BLPF/IHPF/BHPF sebelumnya)
+        result = self.create_params_dialog(title, [
+            ("choice", "channels", "Channels:", list(FREQ_CHANNELS), "Gray"),
+            ("choice", "family", "Family:", list(FREQ_FAMILIES), family),
+            ("choice", "kind", "Type:", list(FREQ_TYPES), kind),
+            ("slider", "cutoff", "Cutoff / Center / Radius (D0):", 1, 500, 30, 1),
+            ("slider", "order", "Order (Butterworth):", 1, 10, order, 1),
+            ("slider", "width", "Band Width (W):", 1, 200, 20, 1),
+            ("slider", "notch_u", "Notch Offset u (vertical):", -200, 200, 0, 1),
+            ("slider", "notch_v", "Notch Offset v (horizontal):", 0, 200, 30, 1),
+        ], preview_filter)
         
         if result['confirmed'] and result['value'] is not None:
-            strength = result['value'] / 100.0
-            kernel = np.array([[-1, -1, -1],
-                              [-1,  8, -1],
-                              [-1, -1, -1]]) * strength
+            # Komputasi final dijalankan di worker thread agar window tetap responsif
+            # progress(): melaporkan progress dan berhenti jika user menekan Cancel
+            def compute_final(progress):
+                return Image.fromarray(filter_image(result['value'], progress=progress))
             
-            img_array = np.array(self.original_image.convert("L"), dtype=np.float32)
-            final_result = ndimage.convolve(img_array, kernel)
-            final_result = np.clip(final_result, 0, 255).astype(np.uint8)
-            self.processed_image = Image.fromarray(final_result)
+            final_image = self.run_in_background(title, compute_final)
+            
+            # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+            if final_image is not None:
+                self.processed_image = final_image
         else:
             self.processed_image = self.original_image.copy()
         
         self.display_images()
     
-    # Method untuk Highboost Filtering
-    def sharpening_highboost(self):
+    # Method untuk ILPF (Ideal Lowpass Filter)
+    def smoothing_ilpf(self):
+        """Ideal Lowpass Filter in Frequency Domain"""
+        if not self.check_image_loaded(): return
+        self.frequency_filter("ILPF", "Ideal", "Lowpass")
+    
+    # Method untuk BLPF (Butterworth Lowpass Filter)
+    def smoothing_blpf(self):
+        """Butterworth Lowpass Filter"""
+        if not self.check_image_loaded(): return
+        self.frequency_filter("BLPF", "Butterworth", "Lowpass")
+    
+    # Method untuk GLPF (Gaussian Lowpass Filter)
+    def smoothing_glpf(self):
+        """Gaussian Lowpass Filter"""
+        if not self.check_image_loaded(): return
+        self.frequency_filter("GLPF", "Gaussian", "Lowpass")
+    
+    # Method untuk filter frekuensi dengan semua pilihan (band dan notch)
+    def frequency_filter_custom(self):
+        """Frequency Filter (lowpass/highpass/band/notch)"""
         if not self.check_image_loaded(): return
+        self.frequency_filter("Frequency Filter")
+    
+    # ========== SHARPENING OPERATIONS ==========
+    # Method umum untuk sharpening di domain spasial (Highpass, Highboost, Unsharp Mask)
+    # Komponen dasar (Laplacian atau hasil blur) dihitung sekali per dialog dan
+    # di-cache; setiap gerakan slider hanya satu cv2.addWeighted (multiply-add
+    # dengan pembulatan dan saturasi ke uint8)
+    # - title: judul dialog
+    # - mode: "highpass", "highboost", atau "unsharp"
+    def sharpening_filter(self, title, mode):
+        """Sharpening spasial dengan komponen dasar yang di-cache"""
+        
+        # Cache per dialog: setiap nama menyimpan (key, hasil) terakhir
+        cache = {}
+        
+        # Ambil hasil dari cache, atau hitung dengan compute() jika key berubah
+        def cached(name, key, compute):
+            if name not in cache or cache[name][0] != key:
+                cache[name] = (key, compute())
+            return cache[name][1]
+        
+        # Gambar sumber: grayscale, atau RGB per channel untuk sharpening warna
+        def source(channels, dtype=None):
+            mode_name = "L" if channels == "Gray" else "RGB"
+            name = "image" if dtype is None else "image_float"
+            return cached(name, channels, lambda: self.load_array(mode_name, dtype))
+        
+        # Sharpening sesuai parameter dialog, hasil array uint8
+        def sharpen(values):
+            channels = values['channels']
+            img_array = source(channels, np.float32)
+            
+            if mode == "highpass":
+                # Kernel highpass (Laplacian 8-tetangga) untuk edge enhancement
+                # BORDER_REFLECT: sama dengan mode 'reflect' ndimage.convolve
+                def laplacian():
+                    kernel = np.array([[-1, -1, -1],
+                                       [-1,  8, -1],
+                                       [-1, -1, -1]], dtype=np.float32)
+                    return cv2.filter2D(img_array, -1, kernel, borderType=cv2.BORDER_REFLECT)
+                base = cached("laplacian", channels, laplacian)
+                
+                # Hasil = strength * Laplacian (beta=0: input kedua tidak dipakai)
+                strength = values['strength'] / 100.0
+                return cv2.addWeighted(base, strength, base, 0, 0, dtype=cv2.CV_8U)
+            
+            if mode == "highboost":
+                # Blur gambar untuk mendapatkan komponen lowpass
+                blurred = cached("blur", (channels, "5x5"), lambda: cv2.GaussianBlur(img_array, (5, 5), 0))
+                
+                # Highboost = A * original - blurred
+                # A > 1: amplifikasi detail
+                return cv2.addWeighted(img_array, values['amplification'], blurred, -1, 0, dtype=cv2.CV_8U)
+            
+            # Unsharp mask: original + amount * (original - blurred)
+            #             = (1 + amount) * original - amount * blurred
+            radius = values['radius']
+            blurred = cached("blur", (channels, radius), lambda: gaussian_blur(img_array, radius))
+            amount = values['amount'] / 100.0
+            result = cv2.addWeighted(img_array, 1 + amount, blurred, -amount, 0, dtype=cv2.CV_8U)
+            
+            # Threshold: pixel dengan |original - blurred| <= threshold tidak di-sharpen
+            # (area halus/noise tetap seperti original)
+            # Selisih disimpan uint8 (dibulatkan ke atas): untuk threshold bulat t,
+            # |d| <= t sama dengan ceil(|d|) <= t; mask dan copy lewat cv2 (per channel)
+            if values['threshold'] > 0:
+                difference = cached("difference", (channels, radius), lambda: np.ceil(
+                    cv2.absdiff(img_array, blurred)).astype(np.uint8))
+                keep = cv2.compare(difference, int(values['threshold']), cv2.CMP_LE)
+                cv2.copyTo(source(channels), keep, result)
+            
+            return result
         
         # Inner function untuk preview
-        def preview_highboost(val):
-            # A = Amplification factor
-            A = val
-            
-            # Konversi ke grayscale
-            img_array = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            # Blur gambar untuk mendapatkan komponen lowpass
-            blurred = cv2.GaussianBlur(img_array, (5, 5), 0)
-            
-            # Highboost = A * original - blurred
-            # A > 1: amplifikasi detail
-            # Highboost mempertahankan detail original sambil meningkatkan edges
-            result = A * img_array - blurred
-            result = np.clip(result, 0, 255).astype(np.uint8)
-            
-            self.temp_image = Image.fromarray(result)
+        def preview_sharpen(values):
+            self.temp_image = Image.fromarray(sharpen(values))
             self.display_temp_image()
         
-        # Slider amplification 1.0-5.0, default 1.5, step 0.1
-        result = self.create_slider_dialog("Highboost", "Amplification: 1.0-5.0", 1.0, 5.0, 1.5, 0.1, preview_highboost)
+        # Parameter per mode; default sama seperti slider sebelumnya
+        params = [("choice", "channels", "Channels:", ["Gray", "Per Channel (Color)"], "Gray")]
+        if mode == "highpass":
+            params.append(("slider", "strength", "Strength: 0-200%", 0, 200, 100, 1))
+        elif mode == "highboost":
+            params.append(("slider", "amplification", "Amplification: 1.0-5.0", 1.0, 5.0, 1.5, 0.1))
+        else:
+            params += [
+                ("slider", "radius", "Radius (sigma):", 0.5, 20, 2, 0.5),
+                ("slider", "amount", "Amount: 0-500%", 0, 500, 100, 1),
+                ("slider", "threshold", "Threshold: 0-255", 0, 255, 0, 1),
+            ]
+        
+        result = self.create_params_dialog(title, params, preview_sharpen)
         
         if result['confirmed'] and result['value'] is not None:
-            A = result['value']
-            img_array = np.array(self.original_image.convert("L"), dtype=np.float32)
-            blurred = cv2.GaussianBlur(img_array, (5, 5), 0)
-            final_result = A * img_array - blurred
-            final_result = np.clip(final_result, 0, 255).astype(np.uint8)
-            self.processed_image = Image.fromarray(final_result)
+            # Komponen dasar sudah ada di cache dari preview terakhir
+            self.processed_image = Image.fromarray(sharpen(result['value']))
         else:
             self.processed_image = self.original_image.copy()
         
         self.display_images()
     
+    # Method untuk Highpass Filtering (Spatial Domain)
+    def sharpening_highpass(self):
+        if not self.check_image_loaded(): return
+        self.sharpening_filter("Highpass", "highpass")
+    
+    # Method untuk Highboost Filtering
+    def sharpening_highboost(self):
+        if not self.check_image_loaded(): return
+        self.sharpening_filter("Highboost", "highboost")
+    
+    # Method untuk Unsharp Masking
+    def sharpening_unsharp(self):
+        if not self.check_image_loaded(): return
+        self.sharpening_filter("Unsharp Mask", "unsharp")
+    
     # Method untuk IHPF (Ideal Highpass Filter)
     def sharpening_ihpf(self):
         """Ideal Highpass Filter"""
         if not self.check_image_loaded(): return
+        self.frequency_filter("IHPF", "Ideal", "Highpass")
+    
+    # Method untuk BHPF (Butterworth Highpass Filter)
+    def sharpening_bhpf(self):
+        """Butterworth Highpass Filter"""
+        if not self.check_image_loaded(): return
+        self.frequency_filter("BHPF", "Butterworth", "Highpass")
+    
+    # Method untuk GHPF (Gaussian Highpass Filter)
+    def sharpening_ghpf(self):
+        """Gaussian Highpass Filter"""
+        if not self.check_image_loaded(): return
+        self.frequency_filter("GHPF", "Gaussian", "Highpass")
+    
+    # ========== GEOMETRIC CORRECTION ==========
+    # Method untuk koreksi perspektif / keystone (misalnya hasil scan dokumen)
+    # User mengklik 4 titik sudut dokumen di canvas original, lalu gambar
+    # di-warp sehingga 4 titik tersebut menjadi persegi panjang
+    def geometric_correction(self):
+        """Koreksi perspektif dari 4 titik sudut yang diklik di canvas original"""
+        if not self.check_image_loaded(): return
         
-        # Inner function untuk preview
-        def preview_ihpf(val):
-            img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            f = fft2(img_gray)
-            fshift = fftshift(f)
-            
-            rows, cols = img_gray.shape
-            crow, ccol = rows // 2, cols // 2
-            
-            # Create IHPF mask (inverse of ILPF)
-            # Mask berbentuk lingkaran terbalik
-            mask = np.ones((rows, cols), dtype=np.float32)  # Mulai dengan 1 (pass semua)
-            for i in range(rows):
-                for j in range(cols):
-                    # Jika jarak <= cutoff frequency, reject (0)
-                    # Jika jarak > cutoff frequency, pass (1)
-                    # Kebalikan dari ILPF
-                    if np.sqrt((i - crow)**2 + (j - ccol)**2) <= val:
-                        mask[i, j] = 0
-            
-            # Apply filter
-            fshift_filtered = fshift * mask
-            f_ishift = ifftshift(fshift_filtered)
-            img_back = ifft2(f_ishift)
-            img_back = np.abs(img_back)
-            
-            result = np.clip(img_back, 0, 255).astype(np.uint8)
-            self.temp_image = Image.fromarray(result)
-            self.display_temp_image()
+        # Titik sudut dalam koordinat pixel gambar original
+        points = []
+        result = {'action': None}
+        
+        # Warp gambar (proxy untuk preview), mode L tetap L, lainnya RGB
+        mode = "L" if self.original_image.mode == "L" else "RGB"
+        
+        def compute(proxy=False):
+            img_array = self.load_array(mode, proxy=proxy)
+            corners = order_corners(points)
+            if proxy:
+                # Titik sudut disesuaikan dengan ukuran proxy
+                corners *= np.float32([img_array.shape[1] / self.original_image.size[0],
+                                       img_array.shape[0] / self.original_image.size[1]])
+            return self.perspective_correct(img_array, corners)
+        
+        # Gambar penanda titik dan garis keliling di canvas original
+        def draw_points():
+            self.canvas_original.delete("corner")
+            left, top, scale_x, scale_y = self.canvas_geometry(self.original_image)
+            coords = [(left + x * scale_x, top + y * scale_y) for x, y in points]
+            for cx, cy in coords:
+                self.canvas_original.create_oval(cx - 4, cy - 4, cx + 4, cy + 4, outline="red", width=2, tags="corner")
+            if len(coords) == 4:
+                outline = [value for point in order_corners(coords) for value in point]
+                self.canvas_original.create_polygon(*outline, outline="red", fill="", width=2, tags="corner")
+        
+        def update_status():
+            status.config(text=f"Click the 4 document corners on the original image ({len(points)}/4)")
+        
+        # Klik di canvas original: tambah titik, preview saat 4 titik lengkap
+        def on_click(event):
+            if len(points) == 4:
+                return
+            points.append(self.canvas_to_image(event.x, event.y))
+            draw_points()
+            update_status()
+            if len(points) == 4:
+                self.temp_image = Image.fromarray(compute(proxy=True))
+                self.display_temp_image()
+        
+        def on_clear():
+            points.clear()
+            draw_points()
+            update_status()
+            self.display_images()
         
-        # Slider cutoff frequency 1-200, default 30, step 1
-        result = self.create_slider_dialog("IHPF", "Cutoff Frequency: 1-200", 1, 200, 30, 1, preview_ihpf)
+        def close(action):
+            if action is not None and len(points) < 4:
+                messagebox.showwarning("Warning", "Please click 4 corner points first!", parent=dialog)
+                return
+            result['action'] = action
+            dialog.destroy()
         
-        if result['confirmed'] and result['value'] is not None:
-            img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            f = fft2(img_gray)
-            fshift = fftshift(f)
-            
-            rows, cols = img_gray.shape
-            crow, ccol = rows // 2, cols // 2
-            
-            mask = np.ones((rows, cols), dtype=np.float32)
-            for i in range(rows):
-                for j in range(cols):
-                    if np.sqrt((i - crow)**2 + (j - ccol)**2) <= result['value']:
-                        mask[i, j] = 0
-            
-            fshift_filtered = fshift * mask
-            f_ishift = ifftshift(fshift_filtered)
-            img_back = ifft2(f_ishift)
-            img_back = np.abs(img_back)
-            
-            final_result = np.clip(img_back, 0, 255).astype(np.uint8)
-            self.processed_image = Image.fromarray(final_result)
+        def on_apply():
+            close("apply")
+        
+        def on_batch():
+            close("batch")
+        
+        def on_cancel():
+            close(None)
+        
+        # Dialog tanpa grab_set agar canvas original tetap bisa diklik
+        dialog = Toplevel(self.root)
+        dialog.title("Geometric Correction")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+        
+        status = Label(dialog, font=("Arial", 10, "bold"))
+        status.pack(padx=20, pady=15)
+        update_status()
+        
+        btn_frame = tk.Frame(dialog)
+        btn_frame.pack(padx=10, pady=10)
+        Button(btn_frame, text="Apply", command=on_apply, width=10, bg="green", fg="white").pack(side=tk.LEFT, padx=5)
+        Button(btn_frame, text="Apply to Folder...", command=on_batch, width=14, bg="blue", fg="white").pack(side=tk.LEFT, padx=5)
+        Button(btn_frame, text="Clear Points", command=on_clear, width=10).pack(side=tk.LEFT, padx=5)
+        Button(btn_frame, text="Cancel", command=on_cancel, width=10, bg="red", fg="white").pack(side=tk.LEFT, padx=5)
+        
+        self.canvas_original.bind("<Button-1>", on_click)
+        
+        # Tunggu dialog ditutup (dicatat sebagai idle)
+        with self.perf_phase("idle"):
+            dialog.wait_window()
+        
+        self.canvas_original.unbind("<Button-1>")
+        self.canvas_original.delete("corner")
+        
+        if result['action'] == "apply":
+            self.processed_image = Image.fromarray(compute())
+        elif result['action'] == "batch":
+            corners = order_corners(points)
+            self.batch_remap("Geometric Correction", lambda img_array: self.perspective_correct(img_array, corners))
         else:
             self.processed_image = self.original_image.copy()
         
         self.display_images()
     
-    # Method untuk BHPF (Butterworth Highpass Filter)
-    def sharpening_bhpf(self):
-        """Butterworth Highpass Filter"""
+    # Method untuk koreksi distorsi lensa (radial barrel/pincushion dan tangensial)
+    # Map undistort dihitung sekali per ukuran + koefisien (cache remap), sehingga
+    # preview ulang dengan slider yang sama dan batch folder tidak menghitung ulang
+    def geometric_lens_correction(self):
+        """Koreksi distorsi lensa dengan koefisien k1, k2, p1, p2"""
         if not self.check_image_loaded(): return
         
-        # Inner function untuk preview
-        def preview_bhpf(val):
-            img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            f = fft2(img_gray)
-            fshift = fftshift(f)
-            
-            rows, cols = img_gray.shape
-            crow, ccol = rows // 2, cols // 2
-            
-            # Create BHPF mask (inverse of BLPF)
-            # Formula: H(u,v) = 1 / (1 + (D0 / D(u,v))^(2n))
-            # Kebalikan dari BLPF (cutoff frequency di pembilang, bukan penyebut)
-            mask = np.zeros((rows, cols), dtype=np.float32)
-            for i in range(rows):
-                for j in range(cols):
-                    d = np.sqrt((i - crow)**2 + (j - ccol)**2)
-                    
-                    # Handle pembagian dengan nol di pusat
-                    if d == 0:
-                        mask[i, j] = 0
-                    else:
-                        mask[i, j] = 1 / (1 + (val / d)**(2 * 2))
-            
-            # Apply filter
-            fshift_filtered = fshift * mask
-            f_ishift = ifftshift(fshift_filtered)
-            img_back = ifft2(f_ishift)
-            img_back = np.abs(img_back)
-            
-            result = np.clip(img_back, 0, 255).astype(np.uint8)
-            self.temp_image = Image.fromarray(result)
+        mode = "L" if self.original_image.mode == "L" else "RGB"
+        
+        def coefficients(values):
+            return (values['k1'], values['k2'], values['p1'], values['p2'])
+        
+        # Inner function untuk preview pada gambar proxy
+        def preview_lens(values):
+            corrected = self.lens_correct(self.load_array(mode, proxy=True), coefficients(values))
+            self.temp_image = Image.fromarray(corrected)
             self.display_temp_image()
         
-        # Slider cutoff frequency 1-200, default 30, step 1
-        result = self.create_slider_dialog("BHPF", "Cutoff Frequency: 1-200", 1, 200, 30, 1, preview_bhpf)
+        # k1 < 0 untuk barrel, k1 > 0 untuk pincushion
+        result = self.create_params_dialog("Lens Distortion", [
+            ("slider", "k1", "k1 (radial): -0.5 to 0.5", -0.5, 0.5, 0, 0.01),
+            ("slider", "k2", "k2 (radial): -0.5 to 0.5", -0.5, 0.5, 0, 0.01),
+            ("slider", "p1", "p1 (tangential): -0.05 to 0.05", -0.05, 0.05, 0, 0.001),
+            ("slider", "p2", "p2 (tangential): -0.05 to 0.05", -0.05, 0.05, 0, 0.001),
+            ("check", "batch", "Apply to all images in a folder", False),
+        ], preview_lens)
         
         if result['confirmed'] and result['value'] is not None:
-            img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-            
-            f = fft2(img_gray)
-            fshift = fftshift(f)
-            
-            rows, cols = img_gray.shape
-            crow, ccol = rows // 2, cols // 2
-            
-            mask = np.zeros((rows, cols), dtype=np.float32)
-            for i in range(rows):
-                for j in range(cols):
-                    d = np.sqrt((i - crow)**2 + (j - ccol)**2)
-                    if d == 0:
-                        mask[i, j] = 0
-                    else:
-                        mask[i, j] = 1 / (1 + (result['value'] / d)**(2 * 2))
-            
-            fshift_filtered = fshift * mask
-            f_ishift = ifftshift(fshift_filtered)
-            img_back = ifft2(f_ishift)
-            img_back = np.abs(img_back)
-            
-            final_result = np.clip(img_back, 0, 255).astype(np.uint8)
-            self.processed_image = Image.fromarray(final_result)
+            coeffs = coefficients(result['value'])
+            if result['value']['batch']:
+                self.batch_remap("Lens Distortion", lambda img_array: self.lens_correct(img_array, coeffs))
+                self.processed_image = self.original_image.copy()
+            else:
+                self.processed_image = Image.fromarray(self.lens_correct(self.load_array(mode), coeffs))
         else:
             self.processed_image = self.original_image.copy()
         
         self.display_images()
     
-    # Method untuk Geometric Correction
-    def geometric_correction(self):
-        if not self.check_image_loaded(): return
+    # Method untuk menerapkan koreksi geometris yang sama ke semua gambar
+    # dalam folder dan menyimpan hasilnya ke folder output (nama file sama)
+    # Hanya gambar dengan ukuran sama dengan gambar original yang diproses,
+    # sehingga semua gambar memakai map remap yang sama dari cache
+    # - title: judul progress dialog
+    # - correct: fungsi array gambar -> array hasil koreksi
+    def batch_remap(self, title, correct):
+        """Batch koreksi geometris untuk semua gambar dalam folder"""
+        
+        with self.perf_phase("idle"):
+            input_dir = filedialog.askdirectory(title="Pilih Folder Gambar")
+            if not input_dir:
+                return
+            output_dir = filedialog.askdirectory(title="Pilih Folder Output")
+            if not output_dir:
+                return
+        
+        names = sorted(name for name in os.listdir(input_dir)
+                       if name.lower().endswith(IMAGE_EXTENSIONS))
+        if not names:
+            with self.perf_phase("idle"):
+                messagebox.showwarning("Warning", "No images found in folder!")
+            return
+        
+        # Koreksi semua gambar di worker thread
+        # Return: (jumlah disimpan, jumlah dilewati karena ukuran berbeda)
+        def compute(progress):
+            saved = skipped = 0
+            for i, name in enumerate(names):
+                progress(i / len(names))
+                
+                with Image.open(os.path.join(input_dir, name)) as img:
+                    if img.size != self.original_image.size:
+                        skipped += 1
+                        continue
+                    img_array = np.array(img.convert("L" if img.mode == "L" else "RGB"))
+                
+                Image.fromarray(correct(img_array)).save(os.path.join(output_dir, name))
+                saved += 1
+            
+            return saved, skipped
+        
+        counts = self.run_in_background(title, compute)
+        if counts is None:
+            return
         
-        # Placeholder untuk fitur geometric correction
-        # Fitur ini belum diimplementasikan
-        messagebox.showinfo("Info", "Geometric Correction feature - Coming soon!")
+        with self.perf_phase("idle"):
+            messagebox.showinfo("Success", f"Corrected {counts[0]} images, skipped {counts[1]} (different size)!")
     
     # ========== NOISE OPERATIONS ==========
     # Method untuk menambahkan Gaussian Noise
@@ -1968,7 +4848,7 @@ class ImageProcessingApp:
         # Inner function untuk preview
         def preview_gaussian(val):
             # Konversi gambar ke numpy array float32
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             
             # np.random.normal(): generate noise dengan distribusi Gaussian/Normal
             # mean = 0, std = val (standard deviation)
@@ -1988,7 +4868,7 @@ class ImageProcessingApp:
         result = self.create_slider_dialog("Gaussian Noise", "Standard Deviation: 0-50", 0, 50, 10, 1, preview_gaussian)
         
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             noise = np.random.normal(0, result['value'], img_array.shape)
             noisy = img_array + noise
             final_result = np.clip(noisy, 0, 255).astype(np.uint8)
@@ -2004,7 +4884,7 @@ class ImageProcessingApp:
         
         # Inner function untuk preview
         def preview_rayleigh(val):
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             
             # np.random.rayleigh(): generate noise dengan distribusi Rayleigh
             # scale = val (parameter scale)
@@ -2021,7 +4901,7 @@ class ImageProcessingApp:
         result = self.create_slider_dialog("Rayleigh Noise", "Scale: 0-30", 0, 30, 10, 1, preview_rayleigh)
         
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             noise = np.random.rayleigh(result['value'], img_array.shape)
             noisy = img_array + noise
             final_result = np.clip(noisy, 0, 255).astype(np.uint8)
@@ -2037,7 +4917,7 @@ class ImageProcessingApp:
         
         # Inner function untuk preview
         def preview_erlang(val):
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             
             # np.random.gamma(): generate noise dengan distribusi Gamma
             # shape=2 (untuk Erlang distribution), scale=val
@@ -2054,7 +4934,7 @@ class ImageProcessingApp:
         result = self.create_slider_dialog("Erlang Noise", "Scale: 0-20", 0, 20, 5, 1, preview_erlang)
         
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             noise = np.random.gamma(2, result['value'], img_array.shape)
             noisy = img_array + noise
             final_result = np.clip(noisy, 0, 255).astype(np.uint8)
@@ -2070,7 +4950,7 @@ class ImageProcessingApp:
         
         # Inner function untuk preview
         def preview_exponential(val):
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             
             # np.random.exponential(): generate noise dengan distribusi Exponential
             # scale=val (parameter scale = 1/lambda)
@@ -2087,7 +4967,7 @@ class ImageProcessingApp:
         result = self.create_slider_dialog("Exponential Noise", "Scale: 0-20", 0, 20, 5, 1, preview_exponential)
         
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             noise = np.random.exponential(result['value'], img_array.shape)
             noisy = img_array + noise
             final_result = np.clip(noisy, 0, 255).astype(np.uint8)
@@ -2103,7 +4983,7 @@ class ImageProcessingApp:
         
         # Inner function untuk preview
         def preview_uniform(val):
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             
             # np.random.uniform(): generate noise dengan distribusi Uniform
             # low=-val, high=val (range noise)
@@ -2120,7 +5000,7 @@ class ImageProcessingApp:
         result = self.create_slider_dialog("Uniform Noise", "Range: 0-50", 0, 50, 20, 1, preview_uniform)
         
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image, dtype=np.float32)
+            img_array = self.load_array(dtype=np.float32)
             noise = np.random.uniform(-result['value'], result['value'], img_array.shape)
             noisy = img_array + noise
             final_result = np.clip(noisy, 0, 255).astype(np.uint8)
@@ -2138,7 +5018,7 @@ class ImageProcessingApp:
         # Inner function untuk preview
         def preview_impulse(val):
             # Copy gambar ke numpy array
-            img_array = np.array(self.original_image).copy()
+            img_array = self.load_array()
             
             # Hitung probabilitas dari slider (0-50%)
             prob = val / 100.0
@@ -2161,7 +5041,7 @@ class ImageProcessingApp:
         result = self.create_slider_dialog("Impulse Noise", "Probability: 0-50%", 0, 50, 5, 1, preview_impulse)
         
         if result['confirmed'] and result['value'] is not None:
-            img_array = np.array(self.original_image).copy()
+            img_array = self.load_array()
             prob = result['value'] / 100.0
             
             # Tambahkan salt noise
@@ -2179,87 +5059,79 @@ class ImageProcessingApp:
         self.display_images()
     
     # ========== EDGE DETECTION ==========
+    # Method umum untuk deteksi edge turunan pertama (Sobel, Prewitt, Roberts)
+    # Gradient dihitung dalam int16, magnitude L2 dengan np.sqrt float32
+    # (gradient_magnitude)
+    def edge_gradient(self, operator):
+        # Konversi ke grayscale
+        img_gray = self.load_array("L")
+        
+        # Gradient X dan Y, lalu magnitude = sqrt(Gx^2 + Gy^2)
+        gx, gy = image_gradients(img_gray, operator)
+        magnitude, _ = gradient_magnitude(gx, gy)
+        
+        self.processed_image = Image.fromarray(magnitude)
+        self.display_images()
+    
     # Method untuk Sobel Edge Detection
     def edge_sobel(self):
         if not self.check_image_loaded(): return
         
-        # Konversi ke grayscale
-        img_gray = np.array(self.original_image.convert("L"))
-        
         # Sobel operators (deteksi edge dengan turunan pertama)
-        # cv2.Sobel(): fungsi Sobel OpenCV
-        # CV_64F: tipe data float64 untuk hasil
-        # 1, 0: turunan order 1 di X, order 0 di Y (gradient horizontal)
-        # ksize=3: ukuran kernel 3x3
-        sobelx = cv2.Sobel(img_gray, cv2.CV_64F, 1, 0, ksize=3)
-        
-        # 0, 1: turunan order 0 di X, order 1 di Y (gradient vertikal)
-        sobely = cv2.Sobel(img_gray, cv2.CV_64F, 0, 1, ksize=3)
-        
-        # Magnitude: gabungkan gradient X dan Y
-        # Formula: magnitude = sqrt(Gx^2 + Gy^2)
-        sobel = np.sqrt(sobelx**2 + sobely**2)
-        
-        # Clip dan konversi tipe data
-        sobel = np.clip(sobel, 0, 255).astype(np.uint8)
-        
-        self.processed_image = Image.fromarray(sobel)
-        self.display_images()
+        # cv2.Sobel() dengan CV_16S: hasil int16 exact, kernel 3x3
+        self.edge_gradient("Sobel")
     
     # Method untuk Prewitt Edge Detection
     def edge_prewitt(self):
         if not self.check_image_loaded(): return
         
-        # Konversi ke grayscale float32
-        img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-        
         # Prewitt kernels (mirip Sobel tapi koefisien berbeda)
-        # Kernel X (gradient horizontal)
-        kernel_x = np.array([[-1, 0, 1],
-                            [-1, 0, 1],
-                            [-1, 0, 1]])
-        
-        # Kernel Y (gradient vertikal)
-        kernel_y = np.array([[-1, -1, -1],
-                            [0, 0, 0],
-                            [1, 1, 1]])
-        
-        # Konvolusi dengan kernel
-        prewitt_x = ndimage.convolve(img_gray, kernel_x)
-        prewitt_y = ndimage.convolve(img_gray, kernel_y)
-        
-        # Hitung magnitude
-        prewitt = np.sqrt(prewitt_x**2 + prewitt_y**2)
-        prewitt = np.clip(prewitt, 0, 255).astype(np.uint8)
-        
-        self.processed_image = Image.fromarray(prewitt)
-        self.display_images()
+        self.edge_gradient("Prewitt")
     
     # Method untuk Robert Edge Detection
     def edge_robert(self):
         if not self.check_image_loaded(): return
         
-        # Konversi ke grayscale float32
-        img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
-        
-        # Roberts kernels (kernel 2x2, lebih sederhana)
-        # Kernel X (gradient diagonal)
-        kernel_x = np.array([[1, 0],
-                            [0, -1]])
+        # Roberts kernels (kernel 2x2, gradient diagonal)
+        self.edge_gradient("Roberts")
+    
+    # Method untuk gradient dengan pilihan operator, norm, dan orientasi
+    def edge_gradient_options(self):
+        """Gradient Sobel/Prewitt/Roberts dengan norm L1/L2 dan orientasi"""
+        if not self.check_image_loaded(): return
         
-        # Kernel Y (gradient diagonal lain)
-        kernel_y = np.array([[0, 1],
-                            [-1, 0]])
+        # Gradient dalam int16 di-cache per resolusi dan operator,
+        # sehingga mengganti norm/orientasi tidak menghitung ulang konvolusi
+        cache = {}
+        
+        def compute(values, proxy=False):
+            key = (proxy, values['operator'])
+            if key not in cache:
+                cache.clear()
+                cache[key] = image_gradients(self.load_array("L", proxy=proxy), values['operator'])
+            gx, gy = cache[key]
+            
+            magnitude, angle = gradient_magnitude(gx, gy, values['norm'], values['orientation'])
+            if angle is not None:
+                return orientation_image(magnitude, angle)
+            return magnitude
+        
+        # Inner function untuk preview pada gambar proxy
+        def preview_gradient(values):
+            self.temp_image = Image.fromarray(compute(values, proxy=True))
+            self.display_temp_image()
         
-        # Konvolusi
-        robert_x = ndimage.convolve(img_gray, kernel_x)
-        robert_y = ndimage.convolve(img_gray, kernel_y)
+        result = self.create_params_dialog("Gradient", [
+            ("choice", "operator", "Operator:", list(GRADIENT_OPERATORS), "Sobel"),
+            ("choice", "norm", "Magnitude:", ["L2", "L1"], "L2"),
+            ("check", "orientation", "Show Orientation (color = direction)", False),
+        ], preview_gradient)
         
-        # Hitung magnitude
-        robert = np.sqrt(robert_x**2 + robert_y**2)
-        robert = np.clip(robert, 0, 255).astype(np.uint8)
+        if result['confirmed'] and result['value'] is not None:
+            self.processed_image = Image.fromarray(compute(result['value']))
+        else:
+            self.processed_image = self.original_image.copy()
         
-        self.processed_image = Image.fromarray(robert)
         self.display_images()
     
     # Method untuk Laplacian Edge Detection
@@ -2267,7 +5139,7 @@ class ImageProcessingApp:
         if not self.check_image_loaded(): return
         
         # Konversi ke grayscale
-        img_gray = np.array(self.original_image.convert("L"))
+        img_gray = self.load_array("L")
         
         # cv2.Laplacian(): operator Laplacian (turunan kedua)
         # CV_64F: tipe data float64
@@ -2286,44 +5158,89 @@ class ImageProcessingApp:
         """Laplacian of Gaussian"""
         if not self.check_image_loaded(): return
         
-        # Inner function untuk preview
-        def preview_log(val):
+        # Hasil blur di-cache per kernel size dan resolusi, sehingga
+        # kembali ke kernel size sebelumnya tidak mem-blur ulang
+        blur_cache = {}
+        
+        def compute(val, proxy=False):
             kernel_size = int(val)
             
             # Kernel size harus ganjil
             if kernel_size % 2 == 0:
                 kernel_size += 1
             
-            # Konversi ke grayscale
-            img_gray = np.array(self.original_image.convert("L"))
-            
             # Step 1: Apply Gaussian blur untuk reduce noise
             # LoG = Laplacian of Gaussian (blur dulu baru Laplacian)
-            blurred = cv2.GaussianBlur(img_gray, (kernel_size, kernel_size), 0)
-            
-            # Step 2: Apply Laplacian
-            log = cv2.Laplacian(blurred, cv2.CV_64F)
-            log = np.absolute(log)
-            result = np.clip(log, 0, 255).astype(np.uint8)
+            key = (proxy, kernel_size)
+            if key not in blur_cache:
+                img_gray = self.load_array("L", proxy=proxy)
+                blur_cache[key] = cv2.GaussianBlur(img_gray, (kernel_size, kernel_size), 0)
             
-            self.temp_image = Image.fromarray(result)
+            # Step 2: Apply Laplacian dalam int16 (exact, |nilai| <= 8 * 255)
+            # cv2.convertScaleAbs(): nilai absolut + saturasi ke uint8
+            log = cv2.Laplacian(blur_cache[key], cv2.CV_16S)
+            return cv2.convertScaleAbs(log)
+        
+        # Inner function untuk preview pada gambar proxy
+        def preview_log(val):
+            self.temp_image = Image.fromarray(compute(val, proxy=True))
             self.display_temp_image()
         
         # Slider kernel size 1-15, default 5, step 2
         result = self.create_slider_dialog("LoG", "Kernel Size: 1-15", 1, 15, 5, 2, preview_log)
         
         if result['confirmed'] and result['value'] is not None:
-            kernel_size = int(result['value'])
-            if kernel_size % 2 == 0:
-                kernel_size += 1
-            
-            img_gray = np.array(self.original_image.convert("L"))
-            blurred = cv2.GaussianBlur(img_gray, (kernel_size, kernel_size), 0)
-            log = cv2.Laplacian(blurred, cv2.CV_64F)
-            log = np.absolute(log)
-            final_result = np.clip(log, 0, 255).astype(np.uint8)
-            
-            self.processed_image = Image.fromarray(final_result)
+            self.processed_image = Image.fromarray(compute(result['value']))
+        else:
+            self.processed_image = self.original_image.copy()
+        
+        self.display_images()
+    
+    # Method untuk deteksi edge scale-space (LoG, DoG, zero crossing)
+    def edge_scale_space(self):
+        """LoG/DoG/zero crossing dari Gaussian stack yang di-cache"""
+        if not self.check_image_loaded(): return
+        
+        # Satu GaussianStack per resolusi (proxy / asli); level dibangun
+        # bertahap saat slider scale digeser, lalu dipakai ulang
+        stacks = {}
+        
+        def compute(values, proxy=False):
+            if proxy not in stacks:
+                img_gray = self.load_array("L", proxy=proxy)
+                
+                # Sigma dalam pixel gambar asli, disesuaikan untuk proxy
+                ratio = img_gray.shape[1] / self.original_image.size[0]
+                stacks[proxy] = GaussianStack(img_gray, SCALE_SPACE_BASE_SIGMA * ratio)
+            stack = stacks[proxy]
+            
+            level = values['level']
+            if values['method'] == "DoG":
+                return cv2.convertScaleAbs(stack.dog(level))
+            if values['method'] == "LoG":
+                return cv2.convertScaleAbs(stack.log(level))
+            return zero_crossings(stack.log(level), values['threshold'])
+        
+        # Inner function untuk preview pada gambar proxy
+        def preview_scale_space(values):
+            self.temp_image = Image.fromarray(compute(values, proxy=True))
+            self.display_temp_image()
+        
+        max_sigma = SCALE_SPACE_BASE_SIGMA * SCALE_SPACE_FACTOR ** (SCALE_SPACE_LEVELS - 1)
+        result = self.create_params_dialog("Scale Space", [
+            ("choice", "method", "Method:", list(SCALE_SPACE_METHODS), "LoG"),
+            ("slider", "level", f"Scale Level (sigma {SCALE_SPACE_BASE_SIGMA:.1f}-{max_sigma:.1f}):",
+             0, SCALE_SPACE_LEVELS - 1, 2, 1),
+            ("slider", "threshold", "Zero Crossing Threshold: 0-50", 0, 50, 4, 1),
+        ], preview_scale_space)
+        
+        if result['confirmed'] and result['value'] is not None:
+            edges = compute(result['value'])
+            if result['value']['method'] == "Zero Crossing":
+                # Edge map biner disimpan bit-packed (1 bit per pixel)
+                self.set_processed_mask(BinaryMask.from_array(edges))
+            else:
+                self.processed_image = Image.fromarray(edges)
         else:
             self.processed_image = self.original_image.copy()
         
@@ -2331,34 +5248,51 @@ class ImageProcessingApp:
     
     # Method untuk Canny Edge Detection
     def edge_canny(self):
+        """Canny dengan threshold low/high, aperture, L2gradient dan pre-blur"""
         if not self.check_image_loaded(): return
         
-        # Inner function untuk preview
-        def preview_canny(val):
-            # Konversi ke grayscale
-            img_gray = np.array(self.original_image.convert("L"))
+        # Gradient dx, dy (int16) di-cache per resolusi, sigma dan aperture,
+        # sehingga menggeser threshold atau L2gradient hanya menjalankan ulang
+        # non-maximum suppression + hysteresis, tanpa blur dan Sobel
+        cache = {}
+        
+        def compute(values, proxy=False):
+            key = (proxy, values['sigma'], values['aperture'])
+            if key not in cache:
+                cache.clear()
+                img_gray = self.load_array("L", proxy=proxy)
+                
+                # Sigma dalam pixel gambar asli, disesuaikan untuk proxy
+                sigma = values['sigma'] * img_gray.shape[1] / self.original_image.size[0]
+                cache[key] = canny_gradients(img_gray, int(values['aperture']), sigma)
+            dx, dy = cache[key]
             
-            # cv2.Canny(): algoritma Canny edge detection
-            # val: lower threshold
-            # val * 2: upper threshold (ratio 1:2 recommended)
             # Canny menggunakan multi-stage algorithm:
-            # 1. Gaussian blur
-            # 2. Gradient calculation (Sobel)
-            # 3. Non-maximum suppression
-            # 4. Double thresholding
-            # 5. Edge tracking by hysteresis
-            edges = cv2.Canny(img_gray, val, val * 2)
-            
-            self.temp_image = Image.fromarray(edges)
+            # 1. Gradient calculation (Sobel) -> dari cache
+            # 2. Non-maximum suppression
+            # 3. Double thresholding (low, high)
+            # 4. Edge tracking by hysteresis
+            return cv2.Canny(dx, dy, values['low'], values['high'], L2gradient=values['l2gradient'])
+        
+        # Inner function untuk preview pada gambar proxy
+        def preview_canny(values):
+            self.temp_image = Image.fromarray(compute(values, proxy=True))
             self.display_temp_image()
         
-        # Slider lower threshold 0-255, default 50, step 1
-        result = self.create_slider_dialog("Canny", "Lower Threshold: 0-255", 0, 255, 50, 1, preview_canny)
+        # Default low 50 / high 100 (ratio 1:2), sama seperti sebelumnya
+        result = self.create_params_dialog("Canny", [
+            ("slider", "low", "Lower Threshold: 0-255", 0, 255, 50, 1),
+            ("slider", "high", "Upper Threshold: 0-510", 0, 510, 100, 1),
+            ("choice", "aperture", "Aperture Size:", ["3", "5", "7"], "3"),
+            ("check", "l2gradient", "L2 Gradient (more accurate magnitude)", False),
+            ("slider", "sigma", "Pre-blur Sigma: 0-5 (0 = off)", 0, 5, 0, 0.5),
+        ], preview_canny)
         
         if result['confirmed'] and result['value'] is not None:
-            img_gray = np.array(self.original_image.convert("L"))
-            edges = cv2.Canny(img_gray, int(result['value']), int(result['value'] * 2))
-            self.processed_image = Image.fromarray(edges)
+            edges = compute(result['value'])
+            
+            # Edge map biner disimpan bit-packed (1 bit per pixel)
+            self.set_processed_mask(BinaryMask.from_array(edges))
         else:
             self.processed_image = self.original_image.copy()
         
@@ -2370,7 +5304,7 @@ class ImageProcessingApp:
         if not self.check_image_loaded(): return
         
         # Konversi ke grayscale float32
-        img_gray = np.array(self.original_image.convert("L"), dtype=np.float32)
+        img_gray = self.load_array("L", np.float32)
         
         # Kirsch compass masks (8 directions)
         # 8 kernel untuk mendeteksi edge di 8 arah berbeda
@@ -2386,18 +5320,113 @@ class ImageProcessingApp:
             np.array([[-3, 5, 5], [-3, 0, 5], [-3, -3, -3]])      # NW
         ]
         
-        # Apply all kernels and take maximum response
-        # Konvolusi gambar dengan semua 8 kernel
-        responses = [np.absolute(ndimage.convolve(img_gray, kernel)) for kernel in kernels]
+        # Komputasi dijalankan di worker thread (8 konvolusi cukup lama untuk gambar besar)
+        def compute(progress):
+            # Apply all kernels and take maximum response
+            # Konvolusi gambar dengan semua 8 kernel, progress dilaporkan per kernel
+            # np.maximum(): simpan respon terkuat sejauh ini (tanpa menyimpan 8 array)
+            compass = None
+            for k, kernel in enumerate(kernels):
+                progress(k / len(kernels))
+                response = np.absolute(ndimage.convolve(img_gray, kernel))
+                compass = response if compass is None else np.maximum(compass, response)
+            
+            # Ambil edge dengan respon terkuat dari 8 arah
+            compass = np.clip(compass, 0, 255).astype(np.uint8)
+            return Image.fromarray(compass)
+        
+        final_image = self.run_in_background("Compass", compute)
+        
+        # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+        if final_image is not None:
+            self.processed_image = final_image
+        self.display_images()
+    
+    # ========== MORPHOLOGY OPERATIONS ==========
+    # Method umum untuk semua operasi morfologi
+    # - title: judul dialog
+    # - op: nama operasi untuk morphology() ("erode", "dilate", "open", ...)
+    def morphology_operation(self, title, op):
+        """Dialog morfologi dengan pilihan bentuk dan ukuran kernel"""
+        
+        # Gambar biner/grayscale diproses 1 channel, gambar warna per channel RGB
+        mode = self.original_image.mode
+        if mode not in ("L", "RGB"):
+            mode = "L" if mode in ("1", "I", "I;16", "F") else "RGB"
+        
+        # Inner function untuk preview pada gambar proxy
+        # Ukuran kernel dalam pixel gambar penuh; untuk proxy diperkecil sesuai
+        # rasio ukuran (tetap ganjil, minimal 1)
+        img_proxy = self.load_array(mode, proxy=True)
+        scale = img_proxy.shape[1] / self.original_image.size[0]
+        
+        def preview_morphology(values):
+            size = max(1, int(round(values['kernel_size'] * scale)) | 1)
+            result = morphology(img_proxy, op, values['shape'], size)
+            
+            self.temp_image = Image.fromarray(result)
+            self.display_temp_image()
+        
+        # Kernel 3x3 persegi (sama seperti kernel morfologi di watershed)
+        result = self.create_params_dialog(title, [
+            ("choice", "shape", "Kernel Shape:", list(MORPH_SHAPES), "Rectangle"),
+            ("slider", "kernel_size", f"Kernel Size: 3-{MORPH_MAX_KERNEL}", 3, MORPH_MAX_KERNEL, 3, 2),
+        ], preview_morphology)
         
-        # np.maximum.reduce(): ambil nilai maksimum dari semua response
-        # Mengambil edge dengan respon terkuat dari 8 arah
-        compass = np.maximum.reduce(responses)
-        compass = np.clip(compass, 0, 255).astype(np.uint8)
+        if result['confirmed'] and result['value'] is not None:
+            values = result['value']
+            
+            # Komputasi final di worker thread (kernel besar pada gambar besar)
+            def compute(progress):
+                img_array = self.load_array(mode)
+                progress(0.5)
+                return Image.fromarray(morphology(img_array, op, values['shape'], int(values['kernel_size'])))
+            
+            final_image = self.run_in_background(title, compute)
+            
+            # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+            if final_image is not None:
+                self.processed_image = final_image
+        else:
+            self.processed_image = self.original_image.copy()
         
-        self.processed_image = Image.fromarray(compass)
         self.display_images()
     
+    # Method untuk Erosion (mengikis objek terang)
+    def morphology_erosion(self):
+        if not self.check_image_loaded(): return
+        self.morphology_operation("Erosion", "erode")
+    
+    # Method untuk Dilation (memperluas objek terang)
+    def morphology_dilation(self):
+        if not self.check_image_loaded(): return
+        self.morphology_operation("Dilation", "dilate")
+    
+    # Method untuk Opening (menghapus noise terang kecil)
+    def morphology_opening(self):
+        if not self.check_image_loaded(): return
+        self.morphology_operation("Opening", "open")
+    
+    # Method untuk Closing (menutup lubang gelap kecil)
+    def morphology_closing(self):
+        if not self.check_image_loaded(): return
+        self.morphology_operation("Closing", "close")
+    
+    # Method untuk Morphological Gradient (tepi objek)
+    def morphology_gradient(self):
+        if not self.check_image_loaded(): return
+        self.morphology_operation("Morphological Gradient", "gradient")
+    
+    # Method untuk Top-hat (detail terang lebih kecil dari kernel)
+    def morphology_tophat(self):
+        if not self.check_image_loaded(): return
+        self.morphology_operation("Top-hat", "tophat")
+    
+    # Method untuk Black-hat (detail gelap lebih kecil dari kernel)
+    def morphology_blackhat(self):
+        if not self.check_image_loaded(): return
+        self.morphology_operation("Black-hat", "blackhat")
+    
     # ========== SEGMENTATION ==========
     # Method untuk Region Growing Segmentation
     def segmentation_region_growing(self):
@@ -2405,117 +5434,294 @@ class ImageProcessingApp:
         if not self.check_image_loaded(): return
         
         # Konversi ke grayscale
-        img_gray = np.array(self.original_image.convert("L"))
+        img_gray = self.load_array("L")
         
         # Dialog untuk memilih threshold
         # Threshold: beda intensitas maksimal yang masih dianggap satu region
-        threshold = simpledialog.askinteger("Region Growing", 
-                                           "Enter threshold (0-50):", 
-                                           initialvalue=10, minvalue=0, maxvalue=50)
+        with self.perf_phase("idle"):
+            threshold = simpledialog.askinteger("Region Growing", 
+                                               "Enter threshold (0-50):", 
+                                               initialvalue=10, minvalue=0, maxvalue=50)
         if threshold is None:
             return
         
         # Info ke user tentang seed point
-        messagebox.showinfo("Region Growing", 
-                          "Click on the image to select seed point.\nMiddle of the image will be used as default.")
+        with self.perf_phase("idle"):
+            messagebox.showinfo("Region Growing", 
+                              "Click on the image to select seed point.\nMiddle of the image will be used as default.")
         
         # Gunakan titik tengah sebagai seed point default
         # seed point = titik awal pertumbuhan region
         seed_x, seed_y = img_gray.shape[1] // 2, img_gray.shape[0] // 2
         
-        # Implementasi region growing
-        h, w = img_gray.shape  # tinggi dan lebar
-        segmented = np.zeros((h, w), dtype=np.uint8)  # hasil segmentasi
-        visited = np.zeros((h, w), dtype=bool)  # track pixel yang sudah dikunjungi
-        
-        # Ambil nilai intensitas seed point
-        seed_value = int(img_gray[seed_y, seed_x])
-        
-        # Stack untuk BFS/DFS (Breadth/Depth First Search)
-        # Mulai dari seed point
-        stack = [(seed_x, seed_y)]
-        visited[seed_y, seed_x] = True
-        
-        # Loop sampai stack kosong
-        while stack:
-            # Pop pixel dari stack
-            x, y = stack.pop()
-            
-            # Mark pixel ini sebagai bagian dari region (255 = putih)
-            segmented[y, x] = 255
-            
-            # Check 4-connected neighbors (atas, bawah, kiri, kanan)
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy  # neighbor coordinates
+        # Komputasi dijalankan di worker thread (loop per pixel bisa sangat lama)
+        def compute(progress):
+            # Implementasi region growing
+            h, w = img_gray.shape  # tinggi dan lebar
+            segmented = np.zeros((h, w), dtype=np.uint8)  # hasil segmentasi
+            visited = np.zeros((h, w), dtype=bool)  # track pixel yang sudah dikunjungi
+            
+            # Ambil nilai intensitas seed point
+            seed_value = int(img_gray[seed_y, seed_x])
+            
+            # Stack untuk BFS/DFS (Breadth/Depth First Search)
+            # Mulai dari seed point
+            stack = [(seed_x, seed_y)]
+            visited[seed_y, seed_x] = True
+            
+            # Jumlah pixel yang sudah diproses (untuk progress)
+            # Ukuran region belum diketahui, jadi progress dihitung terhadap
+            # jumlah pixel seluruh gambar (batas atas)
+            processed = 0
+            
+            # Loop sampai stack kosong
+            while stack:
+                # Pop pixel dari stack
+                x, y = stack.pop()
+                
+                # Mark pixel ini sebagai bagian dari region (255 = putih)
+                segmented[y, x] = 255
                 
-                # Cek apakah neighbor valid dan belum dikunjungi
-                if 0 <= nx < w and 0 <= ny < h and not visited[ny, nx]:
-                    # Cek apakah perbedaan intensitas <= threshold
-                    if abs(int(img_gray[ny, nx]) - seed_value) <= threshold:
-                        # Tambahkan ke stack untuk diproses
-                        stack.append((nx, ny))
-                        visited[ny, nx] = True
-        
-        self.processed_image = Image.fromarray(segmented)
+                # Laporkan progress setiap 10000 pixel
+                processed += 1
+                if processed % 10000 == 0:
+                    progress(processed / (h * w))
+                
+                # Check 4-connected neighbors (atas, bawah, kiri, kanan)
+                for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                    nx, ny = x + dx, y + dy  # neighbor coordinates
+                    
+                    # Cek apakah neighbor valid dan belum dikunjungi
+                    if 0 <= nx < w and 0 <= ny < h and not visited[ny, nx]:
+                        # Cek apakah perbedaan intensitas <= threshold
+                        if abs(int(img_gray[ny, nx]) - seed_value) <= threshold:
+                            # Tambahkan ke stack untuk diproses
+                            stack.append((nx, ny))
+                            visited[ny, nx] = True
+            
+            # Region hasil segmentasi disimpan bit-packed (1 bit per pixel)
+            return BinaryMask.from_array(segmented)
+        
+        final_mask = self.run_in_background("Region Growing", compute)
+        
+        # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+        if final_mask is not None:
+            self.set_processed_mask(final_mask)
         self.display_images()
     
     # Method untuk Watershed Segmentation
     def segmentation_watershed(self):
         if not self.check_image_loaded(): return
         
-        # Konversi ke numpy array RGB
-        img_array = np.array(self.original_image.convert("RGB"))
+        # Cache hasil antara per resolusi (True: proxy untuk preview, False: gambar penuh)
+        # Setiap tahap menyimpan (parameter, hasil) terakhir; tahap hanya dihitung ulang
+        # jika parameternya berubah, sehingga slider foreground ratio hanya mengulang
+        # threshold distance, labeling, dan watershed
+        caches = {True: {}, False: {}}
+        
+        # Ambil hasil tahap dari cache, atau hitung dengan compute_stage() jika
+        # parameter tahap berbeda dari perhitungan terakhir
+        def cached_stage(cache, name, key, compute_stage):
+            if name not in cache or cache[name][0] != key:
+                cache[name] = (key, compute_stage())
+            return cache[name][1]
+        
+        # Pipeline watershed dengan parameter dari dialog
+        # - proxy: True untuk preview (gambar proxy)
+        # - progress: callback progress (worker thread) untuk hasil akhir
+        def watershed(values, proxy=False, progress=lambda fraction: None):
+            cache = caches[proxy]
+            kernel_size = int(values['kernel_size'])
+            open_iterations = int(values['open_iterations'])
+            dilate_iterations = int(values['dilate_iterations'])
+            
+            # Konversi ke numpy array RGB (sekali per resolusi)
+            img_array = cached_stage(cache, "image", None, lambda: self.load_array("RGB", proxy=proxy))
+            
+            # Step 1: Apply threshold dengan Otsu's method (tidak bergantung parameter)
+            progress(0 / 7)
+            # Konversi ke grayscale
+            # THRESH_BINARY_INV: inverse binary (background hitam, foreground putih)
+            # THRESH_OTSU: otomatis menentukan threshold optimal
+            thresh = cached_stage(cache, "thresh", None, lambda: cv2.threshold(
+                cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY), 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1])
+            
+            # Step 2: Noise removal dengan morphological opening
+            progress(1 / 7)
+            kernel = np.ones((kernel_size, kernel_size), np.uint8)
+            # Opening = erosion diikuti dilation (remove small noise)
+            opening_key = (kernel_size, open_iterations)
+            opening = cached_stage(cache, "opening", opening_key, lambda: cv2.morphologyEx(
+                thresh, cv2.MORPH_OPEN, kernel, iterations=open_iterations))
+            
+            # Step 3: Sure background area dengan dilation
+            progress(2 / 7)
+            # Dilation memperluas foreground
+            sure_bg = cached_stage(cache, "sure_bg", opening_key + (dilate_iterations,), lambda: cv2.dilate(
+                opening, kernel, iterations=dilate_iterations))
+            
+            # Step 4: Finding sure foreground area
+            progress(3 / 7)
+            # Distance transform: hitung jarak setiap pixel ke background terdekat
+            # Disimpan bersama nilai maksimumnya agar tidak di-scan ulang
+            def distance():
+                dist = cv2.distanceTransform(opening, cv2.DIST_L2, 5)
+                return dist, dist.max()
+            dist_transform, dist_max = cached_stage(cache, "dist", opening_key, distance)
+            
+            # Threshold distance transform (foreground ratio dari max = sure foreground)
+            _, sure_fg = cv2.threshold(dist_transform, values['fg_ratio'] * dist_max, 255, 0)
+            
+            # Step 5: Finding unknown region
+            progress(4 / 7)
+            # Unknown = sure background - sure foreground
+            sure_fg = np.uint8(sure_fg)
+            unknown = cv2.subtract(sure_bg, sure_fg)
+            
+            # Step 6: Marker labelling
+            progress(5 / 7)
+            # connectedComponents: label setiap komponen terpisah
+            _, markers = cv2.connectedComponents(sure_fg)
+            
+            # Add 1 ke semua marker agar background bukan 0
+            markers = markers + 1
+            
+            # Mark unknown region dengan 0
+            markers[unknown == 255] = 0
+            
+            # Step 7: Apply watershed algorithm
+            progress(6 / 7)
+            # Watershed memperlakukan gambar seperti topographic map
+            # Algoritma "mengalirkan air" dari markers
+            markers = cv2.watershed(img_array, markers)
+            
+            # Mark boundaries dengan warna merah pada copy gambar (gambar di cache tetap)
+            # markers == -1: boundary yang ditemukan watershed
+            result = img_array.copy()
+            result[markers == -1] = [255, 0, 0]  # Mark boundaries in red
+            
+            return result
+        
+        # Preview pada gambar proxy (parameter morfologi dalam pixel, sehingga efeknya
+        # relatif lebih besar di preview dibanding gambar penuh)
+        def preview_watershed(values):
+            self.temp_image = Image.fromarray(watershed(values, proxy=True))
+            self.display_temp_image()
         
-        # Konversi ke grayscale
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        # Default sama seperti parameter watershed sebelumnya
+        result = self.create_params_dialog("Watershed", [
+            ("slider", "fg_ratio", "Foreground Ratio:", 0.05, 0.95, 0.7, 0.05),
+            ("slider", "kernel_size", "Kernel Size:", 3, 15, 3, 2),
+            ("slider", "open_iterations", "Opening Iterations:", 1, 10, 2, 1),
+            ("slider", "dilate_iterations", "Dilation Iterations:", 1, 10, 3, 1),
+        ], preview_watershed)
+        
+        if result['confirmed'] and result['value'] is not None:
+            # Komputasi final dijalankan di worker thread, progress dilaporkan per step
+            def compute(progress):
+                return Image.fromarray(watershed(result['value'], progress=progress))
+            
+            final_image = self.run_in_background("Watershed", compute)
+            
+            # Hasil hanya dipakai jika komputasi selesai (tidak di-cancel / error)
+            if final_image is not None:
+                self.processed_image = final_image
+        else:
+            self.processed_image = self.original_image.copy()
         
-        # Step 1: Apply threshold dengan Otsu's method
-        # THRESH_BINARY_INV: inverse binary (background hitam, foreground putih)
-        # THRESH_OTSU: otomatis menentukan threshold optimal
-        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        self.display_images()
+    
+    # Method untuk menyimpan tabel region ke file CSV/Parquet yang dipilih user
+    # Return True jika tersimpan, False jika dibatalkan atau gagal
+    def save_region_table(self, table):
+        with self.perf_phase("idle"):
+            file_path = filedialog.asksaveasfilename(
+                defaultextension=".csv",
+                filetypes=[("CSV", "*.csv"), ("Parquet", "*.parquet"), ("All Files", "*.*")]
+            )
+        if not file_path:
+            return False
         
-        # Step 2: Noise removal dengan morphological opening
-        kernel = np.ones((3, 3), np.uint8)
-        # Opening = erosion diikuti dilation (remove small noise)
-        opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel, iterations=2)
+        # Parquet tanpa pyarrow/pandas: tampilkan error, tabel tidak disimpan
+        try:
+            export_table(table, file_path)
+        except RuntimeError as e:
+            with self.perf_phase("idle"):
+                messagebox.showerror("Error", str(e))
+            return False
+        return True
+    
+    # Method untuk Connected Component Labeling + statistik setiap region
+    def segmentation_label_regions(self):
+        """Labeling region biner dan export statistik (CSV/Parquet)"""
+        if not self.check_image_loaded(): return
         
-        # Step 3: Sure background area dengan dilation
-        # Dilation memperluas foreground
-        sure_bg = cv2.dilate(opening, kernel, iterations=3)
+        # Sumber biner: hasil threshold/segmentasi sebelumnya (mask bit-packed),
+        # jika tidak ada gambar original di-threshold dengan Otsu
+        if self.processed_mask is not None:
+            binary = self.processed_mask.to_array()
+        else:
+            img_gray = self.load_array("L")
+            _, binary = cv2.threshold(img_gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         
-        # Step 4: Finding sure foreground area
-        # Distance transform: hitung jarak setiap pixel ke background terdekat
-        dist_transform = cv2.distanceTransform(opening, cv2.DIST_L2, 5)
+        labels, table = measure_regions(binary)
         
-        # Threshold distance transform (70% dari max = sure foreground)
-        _, sure_fg = cv2.threshold(dist_transform, 0.7 * dist_transform.max(), 255, 0)
+        # Gambar bounding box setiap region (hijau) di atas gambar biner
+        result = cv2.cvtColor(binary, cv2.COLOR_GRAY2RGB)
+        for left, top, width, height in zip(table["left"], table["top"], table["width"], table["height"]):
+            cv2.rectangle(result, (int(left), int(top)),
+                          (int(left + width - 1), int(top + height - 1)), (0, 255, 0), 1)
         
-        # Step 5: Finding unknown region
-        # Unknown = sure background - sure foreground
-        sure_fg = np.uint8(sure_fg)
-        unknown = cv2.subtract(sure_bg, sure_fg)
+        self.processed_image = Image.fromarray(result)
+        self.display_images()
         
-        # Step 6: Marker labelling
-        # connectedComponents: label setiap komponen terpisah
-        _, markers = cv2.connectedComponents(sure_fg)
+        with self.perf_phase("idle"):
+            messagebox.showinfo("Label Regions", f"{len(table)} regions found.\nChoose a file to export the region table.")
         
-        # Add 1 ke semua marker agar background bukan 0
-        markers = markers + 1
+        if self.save_region_table(table):
+            with self.perf_phase("idle"):
+                messagebox.showinfo("Success", f"Exported {len(table)} regions!")
+    
+    # Method untuk labeling semua gambar dalam satu folder
+    # Setiap gambar di-threshold Otsu, statistiknya digabung ke satu tabel
+    # dengan kolom "image" berisi nama file
+    def segmentation_label_batch(self):
+        """Batch labeling region untuk semua gambar dalam folder"""
+        
+        with self.perf_phase("idle"):
+            input_dir = filedialog.askdirectory(title="Pilih Folder Gambar")
+        if not input_dir:
+            return
         
-        # Mark unknown region dengan 0
-        markers[unknown == 255] = 0
+        # Hanya file gambar, diurutkan agar urutan tabel konsisten
+        names = sorted(name for name in os.listdir(input_dir)
+                       if name.lower().endswith(IMAGE_EXTENSIONS))
+        if not names:
+            with self.perf_phase("idle"):
+                messagebox.showwarning("Warning", "No images found in folder!")
+            return
         
-        # Step 7: Apply watershed algorithm
-        # Watershed memperlakukan gambar seperti topographic map
-        # Algoritma "mengalirkan air" dari markers
-        markers = cv2.watershed(img_array, markers)
+        # Labeling semua gambar di worker thread
+        def compute(progress):
+            tables = []
+            for i, name in enumerate(names):
+                progress(i / len(names))
+                
+                with Image.open(os.path.join(input_dir, name)) as img:
+                    img_gray = np.array(img.convert("L"))
+                
+                _, binary = cv2.threshold(img_gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+                tables.append((name, measure_regions(binary)[1]))
+            
+            return combine_region_tables(tables)
         
-        # Mark boundaries dengan warna merah
-        # markers == -1: boundary yang ditemukan watershed
-        img_array[markers == -1] = [255, 0, 0]  # Mark boundaries in red
+        table = self.run_in_background("Batch Label Regions", compute)
+        if table is None:
+            return
         
-        self.processed_image = Image.fromarray(img_array)
-        self.display_images()
+        if self.save_region_table(table):
+            with self.perf_phase("idle"):
+                messagebox.showinfo("Success", f"Exported {len(table)} regions from {len(names)} images!")
     
     # ========== ABOUT MENU ==========
     # Method untuk menampilkan info tim developer
@@ -0,0 +1,479 @@
+# ========== BENCHMARK OPERASI IMAGE PROCESSING ==========
+# Script ini mengukur waktu dan memori puncak setiap operasi menu di
+# ImageProcessingApp tanpa membuka window (headless).
+#
+# Contoh pemakaian:
+#   python benchmark.py                          -> semua operasi, semua ukuran
+#   python benchmark.py --sizes 0.3 2 --modes L  -> hanya ukuran/mode tertentu
+#   python benchmark.py --ops edge_sobel smoothing_median
+#   python benchmark.py --output new.json --compare old.json
+
+# Mengimport argparse untuk membaca argumen command line
+import argparse
+
+# Mengimport json untuk menyimpan hasil benchmark
+import json
+
+# Mengimport os untuk path file sementara
+import os
+
+# Mengimport platform untuk mencatat info mesin di hasil benchmark
+import platform
+
+# Mengimport tempfile untuk folder sementara (gambar kedua operasi boolean)
+import tempfile
+
+# Mengimport time untuk timer presisi tinggi (perf_counter)
+import time
+
+# Mengimport tracemalloc untuk mengukur memori puncak
+# NumPy (dan array hasil OpenCV) melaporkan alokasinya ke tracemalloc
+import tracemalloc
+
+# Mengimport datetime untuk timestamp hasil
+from datetime import datetime
+
+# Mengimport NumPy, OpenCV, SciPy, dan PIL (untuk generate gambar dan info versi)
+import numpy as np
+import cv2
+import scipy
+import PIL
+from PIL import Image
+
+# Mengimport modul aplikasi utama
+# Dialog-dialog Tkinter di modul ini akan diganti versi headless di bawah
+import ImageProcessingApp as app_module
+from ImageProcessingApp import ImageProcessingApp
+
+# ========== KONFIGURASI ==========
+# Ukuran gambar sintetis dalam megapixel
+DEFAULT_SIZES = [0.3, 2, 12, 50]
+
+# Mode gambar: L (grayscale) dan RGB
+DEFAULT_MODES = ["L", "RGB"]
+
+# Daftar operasi: (nama method, kategori)
+# Urutan mengikuti struktur menu aplikasi
+OPERATIONS = [
+    ("negative", "point"),
+    ("arithmetic_add", "point"),
+    ("arithmetic_subtract", "point"),
+    ("arithmetic_multiply", "point"),
+    ("arithmetic_divide", "point"),
+    ("boolean_not", "point"),
+    ("boolean_and", "boolean"),
+    ("boolean_or", "boolean"),
+    ("boolean_xor", "boolean"),
+    ("boolean_batch", "boolean"),
+    ("boolean_combine", "boolean"),
+    ("geometric_translation", "geometric"),
+    ("geometric_rotation", "geometric"),
+    ("geometric_zooming", "geometric"),
+    ("geometric_cropping", "geometric"),
+    ("geometric_lens_correction", "geometric"),
+    ("thresholding", "point"),
+    ("convolution", "filter"),
+    ("fourier_transform", "fft"),
+    ("color_binary", "color"),
+    ("color_grayscale", "color"),
+    ("color_rgb", "color"),
+    ("color_hsv", "color"),
+    ("color_cmy", "color"),
+    ("color_yuv", "color"),
+    ("color_yiq", "color"),
+    ("color_lab", "color"),
+    ("color_pseudo", "color"),
+    ("enhance_brightness", "point"),
+    ("enhance_contrast", "point"),
+    ("histogram_equalization", "point"),
+    ("smoothing_lowpass", "filter"),
+    ("smoothing_median", "filter"),
+    ("smoothing_gaussian", "filter"),
+    ("smoothing_bilateral", "filter"),
+    ("smoothing_guided", "filter"),
+    ("smoothing_ilpf", "fft"),
+    ("smoothing_blpf", "fft"),
+    ("smoothing_glpf", "fft"),
+    ("sharpening_highpass", "filter"),
+    ("sharpening_highboost", "filter"),
+    ("sharpening_unsharp", "filter"),
+    ("sharpening_ihpf", "fft"),
+    ("sharpening_bhpf", "fft"),
+    ("sharpening_ghpf", "fft"),
+    ("frequency_filter_custom", "fft"),
+    ("noise_gaussian", "noise"),
+    ("noise_rayleigh", "noise"),
+    ("noise_erlang", "noise"),
+    ("noise_exponential", "noise"),
+    ("noise_uniform", "noise"),
+    ("noise_impulse", "noise"),
+    ("edge_sobel", "edge"),
+    ("edge_prewitt", "edge"),
+    ("edge_robert", "edge"),
+    ("edge_gradient_options", "edge"),
+    ("edge_laplacian", "edge"),
+    ("edge_log", "edge"),
+    ("edge_scale_space", "edge"),
+    ("edge_canny", "edge"),
+    ("edge_compass", "edge"),
+    ("morphology_erosion", "morphology"),
+    ("morphology_dilation", "morphology"),
+    ("morphology_opening", "morphology"),
+    ("morphology_closing", "morphology"),
+    ("morphology_gradient", "morphology"),
+    ("morphology_tophat", "morphology"),
+    ("morphology_blackhat", "morphology"),
+    ("segmentation_region_growing", "segmentation"),
+    ("segmentation_watershed", "segmentation"),
+    ("segmentation_label_regions", "segmentation"),
+]
+
+# Operasi yang masih memakai loop Python per pixel
+# Hanya dijalankan sampai ukuran --slow-max-mp agar benchmark tetap selesai
+SLOW_OPERATIONS = {
+    "segmentation_region_growing",
+}
+
+# Operasi yang butuh dialog Tkinter custom (tidak bisa dijalankan headless)
+HEADLESS_UNSUPPORTED = {
+    "geometric_flipping": "custom Toplevel dialog",
+    "geometric_correction": "corner points clicked on canvas",
+    "color_channel_view": "Toplevel window",
+    "show_histogram": "Toplevel window",
+    "show_spectrum": "Toplevel window",
+    "segmentation_label_batch": "folder of images + table export dialog",
+}
+
+# ========== DIALOG HEADLESS ==========
+# Pengganti filedialog: selalu mengembalikan path gambar kedua
+# (dan folder output sementara untuk operasi batch)
+class HeadlessFileDialog:
+    def __init__(self):
+        self.second_image_path = None
+        self.output_dir = None
+
+    def askopenfilename(self, **kwargs):
+        return self.second_image_path
+
+    def askopenfilenames(self, **kwargs):
+        return (self.second_image_path,)
+
+    def askdirectory(self, **kwargs):
+        return self.output_dir
+
+    def asksaveasfilename(self, **kwargs):
+        return ""
+
+
+# Pengganti simpledialog: selalu mengembalikan nilai default (initialvalue)
+class HeadlessSimpleDialog:
+    @staticmethod
+    def askinteger(title, prompt, **kwargs):
+        return kwargs.get("initialvalue", 0)
+
+
+# Pengganti messagebox: tidak menampilkan apa-apa
+class HeadlessMessageBox:
+    @staticmethod
+    def showinfo(*args, **kwargs):
+        pass
+
+    @staticmethod
+    def showwarning(*args, **kwargs):
+        pass
+
+    @staticmethod
+    def showerror(*args, **kwargs):
+        pass
+
+    @staticmethod
+    def askokcancel(*args, **kwargs):
+        return True
+
+
+# ========== APP HEADLESS ==========
+# Pengganti tk.BooleanVar (opsi Track Peak Memory / Profile Next Operation)
+class HeadlessVar:
+    def __init__(self, value=False):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+# Pengganti status bar: menyimpan teks timing terakhir
+class HeadlessStatusBar:
+    def __init__(self):
+        self.text = ""
+
+    def config(self, text=""):
+        self.text = text
+
+
+# Subclass ImageProcessingApp tanpa window
+# Dialog langsung mengembalikan nilai default (seperti user klik OK) setelah
+# menjalankan preview sekali dengan nilai default, lewat instrument() seperti
+# dialog asli. Fungsi display tidak melakukan apa-apa, sehingga yang terukur
+# hanya jalur komputasi setiap operasi
+class HeadlessApp(ImageProcessingApp):
+    def __init__(self, image):
+        # Tidak memanggil super().__init__() karena tidak ada root window;
+        # state non-Tkinter (cache, log timing) dari init_state() yang sama
+        self.root = None
+        self.init_state()
+        self.original_image = image
+
+        # Memori puncak diukur sendiri oleh measure_operation (tracemalloc)
+        self.track_memory = HeadlessVar(False)
+        self.profile_next = HeadlessVar(False)
+        self.status_bar = HeadlessStatusBar()
+
+    def create_slider_dialog(self, title, label_text, min_val, max_val, default_val, resolution=1, callback=None):
+        # Dialog asli memanggil preview dengan float(nilai slider)
+        if callback:
+            self.instrument(f"{title} (preview)", callback)(float(default_val))
+        return {'value': default_val, 'confirmed': True}
+
+    def create_params_dialog(self, title, params, callback=None):
+        # Nilai default setiap parameter (posisi default berbeda per jenis)
+        default_index = {"slider": 5, "choice": 4, "check": 3}
+        values = {param[1]: param[default_index[param[0]]] for param in params}
+        if callback:
+            self.instrument(f"{title} (preview)", callback)(dict(values))
+        return {'value': values, 'confirmed': True}
+
+    def choose_option_dialog(self, title, label_text, options):
+        # Opsi pertama (mis. AND untuk operasi boolean)
+        return options[0]
+
+    def run_in_background(self, title, compute):
+        # Tanpa worker thread dan dialog progress: jalankan langsung
+        return compute(lambda fraction: None)
+
+    def display_images(self):
+        pass
+
+    def display_temp_image(self):
+        pass
+
+
+# ========== GAMBAR SINTETIS ==========
+# Membuat gambar sintetis dengan ukuran megapixel tertentu
+# Isi gambar: gradient + lingkaran (objek untuk segmentasi) + noise
+# seed tetap agar hasil setiap run bisa dibandingkan
+def make_synthetic_image(megapixels, mode, seed=0):
+    """Membuat gambar sintetis deterministik (rasio 4:3)"""
+
+    # Hitung lebar dan tinggi dengan rasio 4:3
+    width = int(round((megapixels * 1e6 * 4 / 3) ** 0.5))
+    height = int(round(megapixels * 1e6 / width))
+
+    rng = np.random.default_rng(seed)
+
+    # Background: gradient horizontal dan vertikal
+    xs = np.linspace(0, 160, width, dtype=np.float32)
+    ys = np.linspace(0, 60, height, dtype=np.float32)
+    base = (xs[np.newaxis, :] + ys[:, np.newaxis]).astype(np.uint8)
+    img = np.dstack([base, base[::-1], base[:, ::-1]])
+
+    # Tambahkan lingkaran-lingkaran terang sebagai objek
+    n_blobs = max(8, int(megapixels * 40))
+    radius_max = max(4, min(width, height) // 30)
+    for _ in range(n_blobs):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        radius = int(rng.integers(radius_max // 3, radius_max + 1))
+        color = tuple(int(c) for c in rng.integers(150, 256, 3))
+        cv2.circle(img, center, radius, color, -1)
+
+    # Tambahkan noise ringan
+    noise = rng.integers(-10, 11, img.shape, dtype=np.int16)
+    img = np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+    image = Image.fromarray(img)
+    return image.convert(mode) if mode != "RGB" else image
+
+
+# ========== PENGUKURAN ==========
+# Menjalankan satu operasi dan mengukur waktu (beberapa kali) + memori puncak
+def measure_operation(app, op_name, repeat):
+    """Mengukur waktu dan memori puncak satu operasi"""
+
+    # Dibungkus instrument() seperti menu command di aplikasi
+    method = app.instrument(op_name, getattr(app, op_name))
+
+    # Waktu: jalankan beberapa kali tanpa tracemalloc (tracemalloc memperlambat)
+    # Waktu preview (record "... (preview)" di perf_log) dicatat terpisah dan
+    # tidak dihitung dalam waktu operasi
+    times = []
+    preview_times = []
+    for _ in range(repeat):
+        app.perf_log.clear()
+        start = time.perf_counter()
+        method()
+        elapsed = time.perf_counter() - start
+        preview = sum(entry['total_s'] for entry in app.perf_log
+                      if entry['operation'].endswith("(preview)"))
+        times.append(elapsed - preview)
+        preview_times.append(preview)
+
+    # Memori puncak: satu run tambahan dengan tracemalloc aktif
+    tracemalloc.start()
+    try:
+        method()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return times, preview_times, peak
+
+
+def run_benchmark(sizes, modes, ops, repeat, slow_max_mp):
+    """Menjalankan benchmark untuk semua kombinasi ukuran, mode, dan operasi"""
+
+    # Ganti dialog Tkinter di modul aplikasi dengan versi headless
+    file_dialog = HeadlessFileDialog()
+    app_module.filedialog = file_dialog
+    app_module.simpledialog = HeadlessSimpleDialog
+    app_module.messagebox = HeadlessMessageBox
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Folder output operasi batch
+        file_dialog.output_dir = os.path.join(tmp_dir, "batch")
+        os.makedirs(file_dialog.output_dir)
+
+        for mp in sizes:
+            for mode in modes:
+                image = make_synthetic_image(mp, mode)
+
+                # Gambar kedua untuk operasi boolean (disimpan ke file karena
+                # operasi boolean membaca gambar kedua dari disk)
+                second = make_synthetic_image(mp, mode, seed=1).transpose(Image.FLIP_LEFT_RIGHT)
+                file_dialog.second_image_path = os.path.join(tmp_dir, f"second_{mp}_{mode}.png")
+                second.save(file_dialog.second_image_path)
+
+                app = HeadlessApp(image)
+
+                for op_name, category in ops:
+                    entry = {
+                        "op": op_name,
+                        "category": category,
+                        "mode": mode,
+                        "megapixels": mp,
+                        "width": image.width,
+                        "height": image.height,
+                    }
+
+                    # Lewati operasi lambat untuk gambar besar
+                    if op_name in SLOW_OPERATIONS and mp > slow_max_mp:
+                        entry.update(status="skipped", reason=f"python loop, > {slow_max_mp} MP")
+                        results.append(entry)
+                        continue
+
+                    try:
+                        times, preview_times, peak = measure_operation(app, op_name, repeat)
+                    except Exception as e:
+                        entry.update(status="error", error=f"{type(e).__name__}: {e}")
+                        print(f"{op_name:32s} {mode:3s} {mp:5.1f} MP  ERROR {e}")
+                    else:
+                        entry.update(
+                            status="ok",
+                            times_s=times,
+                            best_s=min(times),
+                            median_s=float(np.median(times)),
+                            preview_s=min(preview_times),
+                            peak_bytes=peak,
+                        )
+                        print(f"{op_name:32s} {mode:3s} {mp:5.1f} MP  "
+                              f"{min(times) * 1000:10.1f} ms  {peak / 2**20:9.1f} MiB")
+                    results.append(entry)
+
+    for op_name, reason in HEADLESS_UNSUPPORTED.items():
+        results.append({"op": op_name, "status": "skipped", "reason": reason})
+
+    return results
+
+
+# ========== PERBANDINGAN HASIL ==========
+# Membandingkan hasil run sekarang dengan file JSON run sebelumnya
+def compare_results(baseline_path, results):
+    """Mencetak rasio waktu run sekarang terhadap baseline"""
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    # Index hasil baseline berdasarkan (op, mode, megapixels)
+    def key(entry):
+        return (entry["op"], entry.get("mode"), entry.get("megapixels"))
+
+    old = {key(e): e for e in baseline["results"] if e.get("status") == "ok"}
+
+    print(f"\n{'operation':32s} {'mode':4s} {'MP':>5s} {'old ms':>10s} {'new ms':>10s} {'speedup':>8s}")
+    for entry in results:
+        if entry.get("status") != "ok" or key(entry) not in old:
+            continue
+        old_s = old[key(entry)]["best_s"]
+        new_s = entry["best_s"]
+        print(f"{entry['op']:32s} {entry['mode']:4s} {entry['megapixels']:5.1f} "
+              f"{old_s * 1000:10.1f} {new_s * 1000:10.1f} {old_s / new_s:7.2f}x")
+
+
+# ========== MAIN PROGRAM ==========
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless operasi ImageProcessingApp")
+    parser.add_argument("--sizes", type=float, nargs="+", default=DEFAULT_SIZES,
+                        help="ukuran gambar dalam megapixel")
+    parser.add_argument("--modes", nargs="+", default=DEFAULT_MODES, choices=["L", "RGB", "RGBA"],
+                        help="mode gambar (RGBA: PNG dengan alpha channel)")
+    parser.add_argument("--ops", nargs="+", default=None,
+                        help="nama method operasi (default: semua)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="jumlah pengulangan untuk pengukuran waktu")
+    parser.add_argument("--slow-max-mp", type=float, default=2,
+                        help="ukuran maksimum untuk operasi dengan loop Python")
+    parser.add_argument("--output", default="bench_results.json",
+                        help="file JSON hasil benchmark")
+    parser.add_argument("--compare", default=None,
+                        help="file JSON hasil run sebelumnya untuk dibandingkan")
+    args = parser.parse_args()
+
+    ops = OPERATIONS
+    if args.ops:
+        known = dict(OPERATIONS)
+        unknown = [name for name in args.ops if name not in known]
+        if unknown:
+            parser.error(f"unknown operation(s): {', '.join(unknown)}")
+        ops = [(name, known[name]) for name in args.ops]
+
+    results = run_benchmark(args.sizes, args.modes, ops, args.repeat, args.slow_max_mp)
+
+    # Simpan hasil beserta info environment agar run bisa dibandingkan
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "scipy": scipy.__version__,
+            "pillow": PIL.__version__,
+            "repeat": args.repeat,
+            "sizes": args.sizes,
+            "modes": args.modes,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare_results(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()